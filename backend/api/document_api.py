@@ -2357,18 +2357,10 @@ async def update_document_content(
             await document_service.document_repository.update_status(doc_id, ProcessingStatus.COMPLETED)
             return {"status": "success", "message": "Content updated (exempt from vectorization)", "document_id": doc_id}
 
-        # Queue re-embedding and entity extraction in background so save returns immediately
+        # Queue re-embedding and entity extraction in background so save returns immediately.
+        # Existing chunks/entities are kept: the task diffs chunks and only touches what changed.
         await document_service.document_repository.update_status(doc_id, ProcessingStatus.EMBEDDING)
         await document_service._emit_document_status_update(doc_id, ProcessingStatus.EMBEDDING.value, current_user.user_id)
-        try:
-            await document_service.embedding_manager.delete_document_chunks(doc_id)
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to delete old chunks for {doc_id}: {e}")
-        if document_service.kg_service:
-            try:
-                await document_service.kg_service.delete_document_entities(doc_id)
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to delete old KG entities for {doc_id}: {e}")
 
         from services.celery_tasks.document_tasks import reprocess_document_after_save_task
         reprocess_document_after_save_task.apply_async(args=[doc_id, current_user.user_id], queue="default")
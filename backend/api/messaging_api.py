@@ -10,7 +10,11 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Query
 from pydantic import BaseModel, Field
 
-from services.messaging.messaging_service import messaging_service
+from services.messaging.messaging_service import (
+    messaging_service,
+    encode_message_cursor,
+    decode_message_cursor,
+)
 from services.messaging.messaging_attachment_service import messaging_attachment_service
 from utils.auth_middleware import get_current_user
 from models.api_models import AuthenticatedUserResponse
@@ -295,24 +299,38 @@ async def get_room_messages(
     room_id: str,
     limit: int = Query(50, ge=1, le=100),
     before_message_id: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: AuthenticatedUserResponse = Depends(get_current_user)
 ):
-    """Get messages from a room (paginated)"""
+    """Get messages from a room (keyset paginated via cursor or before_message_id)"""
     try:
         if not settings.MESSAGING_ENABLED:
             raise HTTPException(status_code=503, detail="Messaging is not enabled")
         
+        before = None
+        if cursor:
+            try:
+                before = decode_message_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
         messages = await messaging_service.get_room_messages(
             room_id=room_id,
             user_id=current_user.user_id,
             limit=limit,
-            before_message_id=before_message_id
+            before_message_id=before_message_id,
+            before=before
         )
         
+        has_more = len(messages) == limit
         return {
             "messages": messages,
             "total": len(messages),
-            "has_more": len(messages) == limit
+            "has_more": has_more,
+            "next_cursor": (
+                encode_message_cursor(messages[0]['created_at'], messages[0]['message_id'])
+                if has_more else None
+            )
         }
     
     except HTTPException:
@@ -4,12 +4,14 @@ Crawl4AI Service gRPC Client
 Provides client interface to the Crawl4AI Service for web crawling.
 """
 
+import asyncio
 import grpc
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from config import get_settings
 from protos import crawl_service_pb2, crawl_service_pb2_grpc
+from services.crawl_cache import get_crawl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ class CrawlServiceClient:
         self.channel: Optional[grpc.aio.Channel] = None
         self.stub: Optional[crawl_service_pb2_grpc.CrawlServiceStub] = None
         self._initialized = False
+        self.cache = get_crawl_cache()
     
     async def initialize(self):
         """Initialize the gRPC channel and stub"""
@@ -110,6 +113,12 @@ class CrawlServiceClient:
         Returns:
             Dictionary with crawl results
         """
+        variant = self._cache_variant(extraction_strategy, css_selector, llm_question, max_content_length, virtual_scroll, use_fit_markdown)
+        if variant:
+            cached = await self.cache.get(url, variant, source="crawl")
+            if cached:
+                return {**cached["data"], "url": url, "cached": True}
+        
         if not self._initialized:
             await self.initialize()
         
@@ -132,22 +141,10 @@ class CrawlServiceClient:
             
             response = await self.stub.Crawl(request, timeout=timeout_seconds or 120.0)
             
-            return {
-                "success": response.success,
-                "url": response.url,
-                "title": response.title,
-                "content": response.content,
-                "markdown": response.markdown,
-                "html": response.html,
-                "metadata": dict(response.metadata) if response.metadata else {},
-                "links": list(response.links) if response.links else [],
-                "images": list(response.images) if response.images else [],
-                "content_length": response.content_length,
-                "fetch_time_seconds": response.fetch_time_seconds,
-                "status_code": response.status_code,
-                "error": response.error if response.error else None,
-                "extracted_content": response.extracted_content if response.extracted_content else None
-            }
+            result = self._crawl_response_to_dict(response)
+            if variant and result["success"]:
+                await self.cache.put(url, variant, result)
+            return result
             
         except grpc.RpcError as e:
             logger.error(f"❌ gRPC error crawling {url}: {e.code()}: {e.details()}")
@@ -197,12 +194,27 @@ class CrawlServiceClient:
         Returns:
             Dictionary with crawl results
         """
+        variant = self._cache_variant(extraction_strategy, css_selector, llm_question, max_content_length, virtual_scroll, use_fit_markdown)
+        results = await self._cached_results(urls, variant, source="crawl_many")
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            return {
+                "success": True,
+                "results": results,
+                "urls_requested": len(urls),
+                "successful_crawls": len(urls),
+                "failed_crawls": 0,
+                "total_content_length": sum(result["content_length"] for result in results),
+                "total_time_seconds": 0.0,
+                "error": None
+            }
+        
         if not self._initialized:
             await self.initialize()
         
         try:
             request = crawl_service_pb2.CrawlManyRequest(
-                urls=urls,
+                urls=[urls[index] for index in pending],
                 extraction_strategy=extraction_strategy,
                 chunking_strategy=chunking_strategy,
                 max_concurrent=max_concurrent,
@@ -220,36 +232,35 @@ class CrawlServiceClient:
             )
             
             response = await self.stub.CrawlMany(request, timeout=300.0)
+            if not response.success:
+                return {
+                    "success": False,
+                    "results": [],
+                    "urls_requested": len(urls),
+                    "successful_crawls": 0,
+                    "failed_crawls": len(urls),
+                    "total_content_length": 0,
+                    "total_time_seconds": response.total_time_seconds,
+                    "error": response.error if response.error else None
+                }
             
-            # Convert results to dictionaries
-            results = []
-            for result in response.results:
-                results.append({
-                    "success": result.success,
-                    "url": result.url,
-                    "title": result.title,
-                    "content": result.content,
-                    "markdown": result.markdown,
-                    "html": result.html,
-                    "metadata": dict(result.metadata) if result.metadata else {},
-                    "links": list(result.links) if result.links else [],
-                    "images": list(result.images) if result.images else [],
-                    "content_length": result.content_length,
-                    "fetch_time_seconds": result.fetch_time_seconds,
-                    "status_code": result.status_code,
-                    "error": result.error if result.error else None,
-                    "extracted_content": result.extracted_content if result.extracted_content else None
-                })
+            # Convert results to dictionaries, merged back with cache hits in request order
+            for index, result in zip(pending, response.results):
+                results[index] = self._crawl_response_to_dict(result)
+                if variant and results[index]["success"]:
+                    await self.cache.put(urls[index], variant, results[index])
+            results = [result for result in results if result is not None]
+            successful = sum(1 for result in results if result["success"])
             
             return {
-                "success": response.success,
+                "success": True,
                 "results": results,
-                "urls_requested": response.urls_requested,
-                "successful_crawls": response.successful_crawls,
-                "failed_crawls": response.failed_crawls,
-                "total_content_length": response.total_content_length,
+                "urls_requested": len(urls),
+                "successful_crawls": successful,
+                "failed_crawls": len(urls) - successful,
+                "total_content_length": sum(result["content_length"] for result in results if result["success"]),
                 "total_time_seconds": response.total_time_seconds,
-                "error": response.error if response.error else None
+                "error": None
             }
             
         except grpc.RpcError as e:
@@ -259,6 +270,119 @@ class CrawlServiceClient:
             logger.error(f"❌ Error crawling many URLs: {e}")
             raise
     
+    async def stream_crawl_many(
+        self,
+        urls: List[str],
+        extraction_strategy: str = "markdown",
+        chunking_strategy: str = "RegexChunking",
+        max_concurrent: int = 5,
+        css_selector: Optional[str] = None,
+        llm_question: Optional[str] = None,
+        max_content_length: Optional[int] = None,
+        include_links: bool = True,
+        include_metadata: bool = True,
+        timeout_seconds: Optional[int] = None,
+        virtual_scroll: bool = False,
+        scroll_delay: float = 1.0,
+        use_fit_markdown: bool = False,
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Crawl multiple URLs, yielding each page as soon as it is crawled
+        
+        Same arguments as crawl_many. Results arrive in completion order; each dict
+        carries "index" (position in urls) alongside the usual crawl result fields.
+        """
+        variant = self._cache_variant(extraction_strategy, css_selector, llm_question, max_content_length, virtual_scroll, use_fit_markdown)
+        cached_results = await self._cached_results(urls, variant, source="stream_crawl_many")
+        pending = []
+        for index, result in enumerate(cached_results):
+            if result is None:
+                pending.append(index)
+            else:
+                yield {"index": index, **result}
+        if not pending:
+            return
+        
+        if not self._initialized:
+            await self.initialize()
+        
+        request = crawl_service_pb2.CrawlManyRequest(
+            urls=[urls[index] for index in pending],
+            extraction_strategy=extraction_strategy,
+            chunking_strategy=chunking_strategy,
+            max_concurrent=max_concurrent,
+            css_selector=css_selector or "",
+            llm_question=llm_question or "",
+            max_content_length=max_content_length or 0,
+            include_links=include_links,
+            include_metadata=include_metadata,
+            timeout_seconds=timeout_seconds or 0,
+            virtual_scroll=virtual_scroll,
+            scroll_delay=scroll_delay,
+            use_fit_markdown=use_fit_markdown,
+            user_id=user_id or ""
+        )
+        
+        try:
+            async for item in self.stub.StreamCrawlMany(request, timeout=300.0):
+                index = pending[item.index]
+                result = self._crawl_response_to_dict(item.result)
+                if variant and result["success"]:
+                    await self.cache.put(urls[index], variant, result)
+                yield {"index": index, **result}
+                
+        except grpc.RpcError as e:
+            logger.error(f"❌ gRPC error streaming crawl of many URLs: {e.code()}: {e.details()}")
+            raise
+    
+    @staticmethod
+    def _cache_variant(
+        extraction_strategy: str,
+        css_selector: Optional[str],
+        llm_question: Optional[str],
+        max_content_length: Optional[int],
+        virtual_scroll: bool,
+        use_fit_markdown: bool
+    ) -> Optional[str]:
+        """Crawl cache variant for the options that change extracted output (None = don't cache)"""
+        if llm_question or extraction_strategy == "llm_extraction":
+            return None
+        return (
+            f"crawl4ai:{extraction_strategy}:fit={int(bool(use_fit_markdown))}:css={css_selector or ''}"
+            f":max={max_content_length or 0}:vs={int(bool(virtual_scroll))}"
+        )
+    
+    async def _cached_results(self, urls: List[str], variant: Optional[str], source: str) -> List[Optional[Dict[str, Any]]]:
+        """Fresh cached results per URL (None where the page must be crawled)"""
+        if not variant:
+            return [None] * len(urls)
+        entries = await asyncio.gather(*(self.cache.get(url, variant, source=source) for url in urls))
+        return [
+            {**entry["data"], "url": url, "cached": True} if entry else None
+            for url, entry in zip(urls, entries)
+        ]
+    
+    @staticmethod
+    def _crawl_response_to_dict(result) -> Dict[str, Any]:
+        """Convert a CrawlResponse message to a dictionary"""
+        return {
+            "success": result.success,
+            "url": result.url,
+            "title": result.title,
+            "content": result.content,
+            "markdown": result.markdown,
+            "html": result.html,
+            "metadata": dict(result.metadata) if result.metadata else {},
+            "links": list(result.links) if result.links else [],
+            "images": list(result.images) if result.images else [],
+            "content_length": result.content_length,
+            "fetch_time_seconds": result.fetch_time_seconds,
+            "status_code": result.status_code,
+            "error": result.error if result.error else None,
+            "extracted_content": result.extracted_content if result.extracted_content else None
+        }
+    
     async def adaptive_crawl(
         self,
         seed_url: str,
@@ -6,7 +6,7 @@ Provides client interface to the Image Vision Service for face detection.
 
 import grpc
 import logging
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple
 
 from config import get_settings
 from protos import image_vision_pb2, image_vision_pb2_grpc
@@ -143,22 +143,92 @@ class ImageVisionClient:
             logger.error(f"❌ Error detecting faces: {e}")
             return None
     
+    async def detect_faces_batch(
+        self,
+        images: List[Tuple[str, str]],
+        max_detection_dimension: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Detect faces in many images with one streaming call
+        
+        Args:
+            images: (image_path, document_id) pairs
+            max_detection_dimension: Downsample longest side for detection (0 = service default)
+            
+        Yields:
+            Dict per image in completion order with index, image_path, document_id and
+            either faces/image dimensions/processing time or error
+        """
+        if not self._initialized:
+            logger.info("Image Vision Service not initialized, attempting to connect...")
+            try:
+                await self.initialize(required=False)
+            except Exception as e:
+                logger.error(f"❌ Cannot detect faces: Image Vision Service unavailable: {e}")
+                return
+        
+        if not self._initialized or not images:
+            return
+        
+        request = image_vision_pb2.FaceDetectionBatchRequest(
+            images=[
+                image_vision_pb2.FaceDetectionRequest(image_path=image_path, document_id=document_id)
+                for image_path, document_id in images
+            ],
+            max_detection_dimension=max_detection_dimension
+        )
+        
+        try:
+            # Per-image work is bounded by the service; allow 60s per image like detect_faces
+            async for item in self.stub.DetectFacesBatch(request, timeout=60.0 * len(images)):
+                result = item.result
+                yield {
+                    "index": item.index,
+                    "image_path": item.image_path,
+                    "document_id": item.document_id,
+                    "error": result.error or None,
+                    "faces": [
+                        {
+                            "bbox_x": face.bbox_x,
+                            "bbox_y": face.bbox_y,
+                            "bbox_width": face.bbox_width,
+                            "bbox_height": face.bbox_height,
+                            "face_encoding": list(face.face_encoding),
+                            "confidence": face.confidence
+                        }
+                        for face in result.faces
+                    ],
+                    "image_width": result.image_width,
+                    "image_height": result.image_height,
+                    "processing_time_seconds": result.processing_time_seconds
+                }
+                
+        except grpc.RpcError as e:
+            logger.error(f"❌ gRPC error in batch face detection: {e.code()}: {e.details()}")
+            self._initialized = False
+        except Exception as e:
+            logger.error(f"❌ Error in batch face detection: {e}")
+
     async def match_faces(
         self,
         unknown_faces: List[list],
         known_identities: list,
-        confidence_threshold: float = 0.82
+        confidence_threshold: float = 0.82,
+        top_k: int = 1,
+        owner_id: str = ""
     ) -> Optional[List[Dict[str, Any]]]:
         """
         Match unknown faces against known identities
         
         Args:
             unknown_faces: List of face encodings (each is a 128-dimensional list)
-            known_identities: List of dicts with identity_name and face_encoding
+            known_identities: List of dicts with identity_name and face_encoding (repeat an identity for multiple samples)
             confidence_threshold: Minimum confidence (0.0-1.0) for a match. 0.82 aligns with L2 < 0.6 same-person rule.
+            top_k: Number of ranked candidate identities to return per matched face
+            owner_id: Owner of known_identities (e.g. user_id); the service keeps one index per owner
             
         Returns:
-            List of matches with face_index, matched_identity, and confidence, or None if service unavailable
+            List of matches with face_index, matched_identity, confidence and candidates, or None if service unavailable
         """
         if not self._initialized:
             logger.info("Image Vision Service not initialized, attempting to connect...")
@@ -190,7 +260,9 @@ class ImageVisionClient:
             request = image_vision_pb2.FaceMatchingRequest(
                 unknown_faces=unknown_face_protos,
                 known_identities=known_identity_protos,
-                confidence_threshold=confidence_threshold
+                confidence_threshold=confidence_threshold,
+                top_k=top_k,
+                owner_id=owner_id or ""
             )
             
             response = await self.stub.MatchFaces(request, timeout=30.0)
@@ -205,7 +277,11 @@ class ImageVisionClient:
                 matches.append({
                     "face_index": match.face_index,
                     "matched_identity": match.matched_identity,
-                    "confidence": match.confidence
+                    "confidence": match.confidence,
+                    "candidates": [
+                        {"identity_name": candidate.identity_name, "confidence": candidate.confidence}
+                        for candidate in match.candidates
+                    ]
                 })
             
             return matches
@@ -419,14 +419,16 @@ class VectorServiceClient:
     async def delete_vectors(
         self,
         collection_name: str,
-        filters: List[Dict[str, str]]
+        filters: Optional[List[Dict[str, str]]] = None,
+        point_ids: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
-        Delete vectors by filter via Vector Service with concurrency control
+        Delete vectors by filter or by point ID via Vector Service with concurrency control
         
         Args:
             collection_name: Collection to delete from
             filters: List of filter dicts with 'field', 'value', 'operator' keys
+            point_ids: Explicit point IDs to delete (takes precedence over filters)
             
         Returns:
             Dict with success, points_deleted, error
@@ -439,7 +441,7 @@ class VectorServiceClient:
             try:
                 # Convert filters to VectorFilter messages
                 vector_filters = []
-                for f in filters:
+                for f in filters or []:
                     vector_filters.append(
                         vector_service_pb2.VectorFilter(
                             field=f.get("field", ""),
@@ -450,7 +452,8 @@ class VectorServiceClient:
                 
                 request = vector_service_pb2.DeleteVectorsRequest(
                     collection_name=collection_name,
-                    filters=vector_filters
+                    filters=vector_filters,
+                    point_ids=[str(point_id) for point_id in point_ids or []]
                 )
                 
                 # Increase timeout to 120s for bulk operations
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "bastion-jwt-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 1440  # 24 hours
+    AUTH_LOCAL_CACHE_SIZE: int = 10000  # Verified sessions kept per process in front of Redis
+    AUTH_LOCAL_CACHE_TTL_SECONDS: int = 60  # Backstop if a revocation broadcast is missed
     
     # Default Admin User (created at startup)
     ADMIN_USERNAME: str = "admin"
@@ -45,6 +47,13 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379"
     SEARXNG_URL: str = "http://localhost:8888"  # SearXNG search engine
     
+    # WebSocket fan-out across backend workers: redis | local (in-process only) | none
+    WEBSOCKET_FANOUT_BACKEND: str = "redis"
+    # Per-connection outbound queue: drop_oldest | coalesce | disconnect when full
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 256
+    WEBSOCKET_BACKPRESSURE_POLICY: str = "coalesce"
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = 10.0  # A send stuck this long marks the client dead
+    
     # Microservices
     VECTOR_SERVICE_URL: str = "vector-service:50053"
     DATA_SERVICE_HOST: str = "data-service"
@@ -86,6 +95,11 @@ class Settings(BaseSettings):
     WEBDAV_HOST: str = "0.0.0.0"
     WEBDAV_PORT: int = 8001
     WEBDAV_ENABLED: bool = True
+    WEBDAV_DB_POOL_SIZE: int = 10  # Matches the Cheroot worker thread count
+    WEBDAV_AUTH_CACHE_TTL_SECONDS: int = 60  # Verified Basic credentials skip bcrypt for this long
+    WEBDAV_AUTH_CACHE_SIZE: int = 1024
+    WEBDAV_ORG_LISTING_MAX_AGE_SECONDS: int = 300  # Backstop for a missed listing invalidation
+    WEBDAV_ORG_LISTING_FALLBACK_SECONDS: int = 5  # Snapshot lifetime while Redis versions are unavailable
     
     # PostgreSQL Configuration (parsed from DATABASE_URL)
     @property
@@ -149,6 +163,12 @@ class Settings(BaseSettings):
     PROCESSING_TIMEOUT: int = 3600   # 60 minutes for large ZIP file processing
     QUALITY_THRESHOLD: float = 0.7
     EMBEDDING_BATCH_SIZE: int = 100
+    # Warm worker processes for extraction/chunking/NER (0 = off, run in-process).
+    # Each worker loads its own spaCy en_core_web_lg (~0.5-1 GB RSS), so memory grows per worker.
+    DOCUMENT_WORKER_POOL_SIZE: int = 0
+    DOCUMENT_WORKER_BATCH_MAX_DOCS: int = 8  # Small documents packed into one worker call
+    DOCUMENT_WORKER_SMALL_DOC_BYTES: int = 512 * 1024  # Files at or below this size are batched
+    DOCUMENT_WORKER_BATCH_WINDOW_MS: int = 25  # How long to wait for more small documents
     
     # Feature Flags
     USE_VECTOR_SERVICE: bool = False  # Use new Vector Service for embeddings (gradual rollout)
@@ -170,6 +190,14 @@ class Settings(BaseSettings):
     PROCESSED_DIR: str = "/app/processed"
     LOGS_DIR: str = "/app/logs"
     
+    # Settings table cache: each process polls settings_version this often
+    SETTINGS_VERSION_POLL_SECONDS: float = 1.0
+
+    # File Watcher Startup Scan
+    FILE_WATCHER_STARTUP_MODE: str = "reconcile"  # "reconcile" (bulk diff) or "legacy" (per-file lookups)
+    FILE_WATCHER_RECONCILE_CONCURRENCY: int = 4  # New/changed files processed in parallel after a reconcile
+    FILE_WATCHER_MTIME_TOLERANCE_SECONDS: float = 2.0  # Disk mtime must exceed updated_at by this to count as changed
+
     # Messaging Attachment Configuration
     MESSAGING_ATTACHMENT_MAX_SIZE: int = 10 * 1024 * 1024  # 10MB
     MESSAGING_ATTACHMENT_ALLOWED_TYPES: List[str] = [
@@ -217,10 +245,22 @@ class Settings(BaseSettings):
     MAX_RETRIEVAL_RESULTS: int = 500  # Increased query results limit
     MAX_ENTITY_RESULTS: int = 200  # Increased entity results limit
     
+    # Crawl Cache (shared across API/Celery processes via Redis)
+    CRAWL_CACHE_ENABLED: bool = True
+    CRAWL_CACHE_TTL_SECONDS: int = 3600  # Fresh lifetime of a crawled page
+    CRAWL_CACHE_STALE_GRACE_SECONDS: int = 86400  # Stale entries kept for conditional revalidation
+    CRAWL_CACHE_MAX_ENTRIES: int = 5000  # Oldest entries evicted beyond this
+    CRAWL_CACHE_MAX_ENTRY_BYTES: int = 2 * 1024 * 1024  # Compressed size limit per entry
+    
     # Weather Configuration
     WEATHER_UNITS: str = "imperial"  # imperial, metric, or kelvin
     WEATHER_CACHE_MINUTES: int = 10  # Cache weather data for 10 minutes
     WEATHER_DEFAULT_LOCATION: str = ""  # Default ZIP code if none provided
+    WEATHER_GEOCODE_CACHE_DAYS: int = 30  # Location → coordinates cache lifetime (Redis)
+    WEATHER_GEOCODE_LOCAL_CACHE_SIZE: int = 1024  # Geocodes kept in process memory (LRU)
+    WEATHER_HISTORY_CACHE_DAYS: int = 365  # Past-date history never changes; cached durably (Redis)
+    WEATHER_MAX_CONCURRENT_REQUESTS: int = 8  # Concurrent OpenWeatherMap calls per process
+    WEATHER_REQUESTS_PER_SECOND: float = 20.0  # Request start rate limit per process
     
     # Deduplication Configuration
     DEDUPLICATION_ENABLED: bool = True
@@ -245,8 +285,12 @@ class Settings(BaseSettings):
     MESSAGE_ENCRYPTION_MASTER_KEY: str = ""  # Fernet key from environment (optional)
     MESSAGE_MAX_LENGTH: int = 10000  # Maximum message content length
     MESSAGE_RETENTION_DAYS: int = 0  # 0 = indefinite retention
+    MESSAGE_BULK_DECRYPT_THREAD_MIN: int = 16  # Pages at least this long decrypt in a worker thread
     PRESENCE_HEARTBEAT_SECONDS: int = 30  # How often clients should ping presence
     PRESENCE_OFFLINE_THRESHOLD_SECONDS: int = 90  # When to mark user offline
+    PRESENCE_BROADCAST_DEBOUNCE_SECONDS: float = 1.5  # Presence flaps within this window collapse into one update
+    ROOM_PARTICIPANT_CACHE_SIZE: int = 10000  # Rooms whose participant lists are kept in memory
+    ROOM_PARTICIPANT_CACHE_TTL_SECONDS: int = 300  # Backstop for profile changes / missed invalidations
     
     # Email Configuration (SMTP)
     # Configure for your SMTP service (SendGrid, Mailgun, Postfix, etc.)
@@ -175,6 +175,14 @@ async def lifespan(app: FastAPI):
         conversation_service = service_container.conversation_service
         embedding_manager = service_container.embedding_manager
         websocket_manager = service_container.websocket_manager
+        
+        # Receive WebSocket sends published by other backend workers / Celery processes
+        if websocket_manager:
+            try:
+                await websocket_manager.start_fanout()
+            except Exception as e:
+                logger.error(f"❌ Failed to start WebSocket fan-out (sends stay local to this worker): {e}")
+        
         folder_service = service_container.folder_service
         
         # Initialize migration service separately (not in container)
@@ -353,6 +361,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error stopping File System Watcher: {e}")
     
+    # Stop WebSocket fan-out subscription
+    if websocket_manager:
+        try:
+            await websocket_manager.stop_fanout()
+        except Exception as e:
+            logger.error(f"❌ Error stopping WebSocket fan-out: {e}")
+    
     # Close migration service
     if migration_service:
         await migration_service.close()
@@ -922,6 +937,7 @@ async def root():
 @app.get("/api/health/websockets")
 async def websocket_health():
     """Health check for WebSocket connections"""
+    from services.messaging.messaging_service import messaging_service
     return {
         "status": "healthy",
         "total_connections": websocket_manager.get_connection_count(),
@@ -929,7 +945,10 @@ async def websocket_health():
         "job_connections": len(websocket_manager.job_connections),
         "job_connection_details": {
             job_id: len(connections) for job_id, connections in websocket_manager.job_connections.items()
-        }
+        },
+        "send_queues": websocket_manager.get_send_queue_stats(),
+        "room_participant_cache": messaging_service.participant_cache.get_stats(),
+        "presence": websocket_manager.get_presence_stats()
     }
 
 
@@ -18,6 +18,7 @@ from models.api_models import (
     QualityMetrics, DocumentFilterRequest
 )
 from repositories.document_repository_extensions import DocumentRepositoryZipExtensions
+from utils.webdav_listing_version import bump_org_listing_version, is_org_filename, touches_listing
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +161,8 @@ class DocumentRepository:
             )
             
             logger.info(f"📝 Created document record: {doc_info.document_id} for user: {getattr(doc_info, 'user_id', None)} with collection_type: {getattr(doc_info, 'collection_type', 'user')}")
+            if is_org_filename(doc_info.filename):
+                await bump_org_listing_version(getattr(doc_info, 'user_id', None))
             return True
             
         except Exception as e:
@@ -249,6 +252,8 @@ class DocumentRepository:
                 logger.info(f"📁 Assigned document {doc_info.document_id} to folder {folder_id} in creation transaction")
             if exempt_from_vectorization:
                 logger.info(f"🚫 Document {doc_info.document_id} created with vectorization exemption")
+            if is_org_filename(doc_info.filename):
+                await bump_org_listing_version(user_id)
             
             return True
             
@@ -369,6 +374,10 @@ class DocumentRepository:
             rows_updated = int(result.split()[-1])
             if rows_updated > 0:
                 logger.debug(f"📝 Updated document: {document_id}")
+                if touches_listing(updates):
+                    # A change of owner moves the file between two users' listings
+                    owner = None if 'user_id' in updates else rls_context['user_id'] or None
+                    await bump_org_listing_version(owner)
                 return True
             else:
                 logger.warning(f"⚠️ No document found to update: {document_id}")
@@ -407,6 +416,7 @@ class DocumentRepository:
             rows_deleted = int(result.split()[-1])
             if rows_deleted > 0:
                 logger.debug(f"🗑️ Deleted document record: {document_id}")
+                await bump_org_listing_version(user_id)
                 return True
             else:
                 logger.warning(f"⚠️ No document found to delete: {document_id}")
@@ -778,6 +788,7 @@ class DocumentRepository:
             """, new_filename, document_id, rls_context=rls_context)
             
             logger.info(f"✅ Updated filename for document {document_id}: {new_filename}")
+            await bump_org_listing_version()
             return True
             
         except Exception as e:
@@ -1808,7 +1819,69 @@ class DocumentRepository:
         except Exception as e:
             logger.error(f"❌ Failed to get folders for teams: {e}")
             return []
-    
+
+    async def get_folder_tree_rows(self, user_id: str = None) -> List[Dict[str, Any]]:
+        """
+        Every folder in a user's tree (own, global, and their teams') with
+        document and subfolder counts, in one query under the user's RLS context.
+
+        Rows come back user, global, team; each group ordered by name.
+        """
+        try:
+            from services.database_manager.database_helpers import fetch_all
+
+            # Counts use the plain 'user' role so admins see the same numbers as the
+            # folder owner (RLS hides other users' docs; team docs need membership)
+            rls_context = {
+                'user_id': user_id if user_id else '',
+                'user_role': 'user'
+            }
+
+            rows = await fetch_all("""
+                WITH tree AS (
+                    SELECT folder_id, name, parent_folder_id, user_id, team_id, collection_type,
+                           exempt_from_vectorization, created_at, updated_at
+                    FROM document_folders
+                    WHERE (collection_type = 'user' AND user_id = $1)
+                       OR collection_type = 'global'
+                       OR (collection_type = 'team' AND team_id IN (
+                              SELECT team_id FROM team_members WHERE user_id = $1
+                          ))
+                ),
+                document_counts AS (
+                    SELECT folder_id, COUNT(*) AS document_count
+                    FROM document_metadata
+                    WHERE folder_id IN (SELECT folder_id FROM tree)
+                    GROUP BY folder_id
+                ),
+                subfolder_counts AS (
+                    SELECT parent_folder_id AS folder_id, COUNT(*) AS subfolder_count
+                    FROM document_folders
+                    WHERE parent_folder_id IN (SELECT folder_id FROM tree)
+                    GROUP BY parent_folder_id
+                )
+                SELECT t.*,
+                       COALESCE(dc.document_count, 0) AS document_count,
+                       COALESCE(sc.subfolder_count, 0) AS subfolder_count
+                FROM tree t
+                LEFT JOIN document_counts dc ON dc.folder_id = t.folder_id
+                LEFT JOIN subfolder_counts sc ON sc.folder_id = t.folder_id
+                ORDER BY CASE t.collection_type WHEN 'user' THEN 0 WHEN 'global' THEN 1 ELSE 2 END, t.name
+            """, user_id, rls_context=rls_context)
+
+            # Convert UUID to string for team_id (asyncpg returns UUID objects)
+            result = []
+            for row in rows:
+                row_dict = dict(row)
+                if row_dict.get('team_id') and not isinstance(row_dict['team_id'], str):
+                    row_dict['team_id'] = str(row_dict['team_id'])
+                result.append(row_dict)
+
+            return result
+        except Exception as e:
+            logger.error(f"❌ Failed to get folder tree for user {user_id}: {e}")
+            return []
+
     async def get_subfolders(self, parent_folder_id: str, user_id: str = None, user_role: str = 'user') -> List[Dict[str, Any]]:
         """Get subfolders of a folder"""
         try:
@@ -22,6 +22,9 @@ from models.api_models import (
     LoginRequest, LoginResponse, UserCreateRequest, UserUpdateRequest, 
     PasswordChangeRequest, UserResponse, UsersListResponse, AuthenticatedUserResponse
 )
+from services.auth_session_cache import LocalSessionCache, REVOCATION_CHANNEL
+from utils.redis_backoff import RedisBackoff
+from utils.websocket_fanout import RedisFanout
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +42,16 @@ class AuthenticationService:
         self.redis_client = None
         self.cache_ttl = 300  # 5 minutes cache TTL
         self._initialized = False
-        # Emergency in-memory cache for session timing issues
-        self._emergency_session_cache = {}  # token_hash -> (user_data, expiry_time)
+        # In-process tier in front of Redis; also covers the window right after login
+        self._local_sessions = LocalSessionCache(
+            max_size=settings.AUTH_LOCAL_CACHE_SIZE,
+            ttl=settings.AUTH_LOCAL_CACHE_TTL_SECONDS
+        )
+        # The local tier and the database keep auth working while Redis is bypassed
+        self._redis = RedisBackoff("Auth session cache")
+        # Revocations (logout, password/role change) reach every worker's local tier
+        self._revocations: Optional[RedisFanout] = None
+        self._revocations_started = False
     
     async def initialize(self, shared_db_pool=None):
         """Initialize the authentication service"""
@@ -86,8 +97,9 @@ class AuthenticationService:
             
             # Initialize Redis for caching
             if settings.REDIS_URL:
-                self.redis_client = redis.from_url(settings.REDIS_URL)
+                self.redis_client = self._redis.get_client()
                 await self.redis_client.ping()
+                self._revocations = RedisFanout(settings.REDIS_URL, channel=REVOCATION_CHANNEL)
                 logger.info("✅ Authentication Redis connection established")
             else:
                 logger.warning("⚠️ No Redis URL configured - authentication caching disabled")
@@ -107,8 +119,12 @@ class AuthenticationService:
     
     async def close(self):
         """Close the authentication service"""
+        if self._revocations:
+            await self._revocations.stop()
+            self._revocations_started = False
+        
         if self.redis_client:
-            await self.redis_client.close()
+            await self._redis.close()
             logger.info("✅ Authentication Redis connection closed")
         
         if self.db_pool:
@@ -362,7 +378,6 @@ class AuthenticationService:
                 
                 # IMMEDIATE CACHE: Cache the user session immediately to avoid database lookup timing issues
                 try:
-                    cache_key = f"auth:user:{token_hash}"
                     cached_user = AuthenticatedUserResponse(
                         user_id=user_row["user_id"],
                         username=user_row["username"],
@@ -371,20 +386,8 @@ class AuthenticationService:
                         display_name=user_row["display_name"],
                         preferences=user_row["preferences"]
                     )
-                    
-                    # Cache in Redis if available
-                    if self.redis_client:
-                        await self.redis_client.setex(
-                            cache_key, 
-                            self.cache_ttl, 
-                            cached_user.model_dump_json()
-                        )
-                        logger.info(f"✅ IMMEDIATE CACHE (Redis): User session cached for token: {token_hash[:20]}...")
-                    
-                    # EMERGENCY FALLBACK: Also cache in memory for immediate access
-                    expiry_time = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
-                    self._emergency_session_cache[token_hash] = (cached_user, expiry_time)
-                    logger.info(f"✅ EMERGENCY CACHE: User session cached in memory for token: {token_hash[:20]}...")
+                    await self._cache_user(token_hash, cached_user, int(expiration.timestamp()))
+                    logger.info(f"✅ IMMEDIATE CACHE: User session cached for token: {token_hash[:20]}...")
                     
                 except Exception as cache_e:
                     logger.warning(f"⚠️ Failed to immediately cache user session: {cache_e}")
@@ -398,58 +401,108 @@ class AuthenticationService:
             logger.error(f"❌ Full traceback: {traceback.format_exc()}")
             return None
     
-    async def _get_cached_user(self, token_hash: str) -> Optional[AuthenticatedUserResponse]:
-        """Get user from cache"""
-        
-        # EMERGENCY CACHE CHECK FIRST: Check in-memory cache for immediate post-login access
-        if token_hash in self._emergency_session_cache:
-            cached_user, expiry_time = self._emergency_session_cache[token_hash]
-            if datetime.utcnow() < expiry_time:
-                logger.info(f"✅ EMERGENCY CACHE HIT: Retrieved user from emergency cache for token: {token_hash[:20]}...")
-                return cached_user
-            else:
-                # Expired, remove from cache
-                del self._emergency_session_cache[token_hash]
-                logger.info(f"🧹 EMERGENCY CACHE CLEANUP: Removed expired session from emergency cache")
-        
-        # Regular Redis cache check
-        if not self.redis_client:
+    def _get_redis(self) -> Optional[redis.Redis]:
+        """Redis client, or None while unconfigured or in the post-error bypass window"""
+        if self.redis_client is None:
             return None
-        
+        return self._redis.get_client()
+    
+    @staticmethod
+    def _user_sessions_key(user_id: str) -> str:
+        return f"auth:user_sessions:{user_id}"
+    
+    async def _ensure_revocation_listener(self):
+        """Subscribe to revocations before this process serves anything from its local tier"""
+        if self._revocations is None or self._revocations_started:
+            return
+        await self._revocations.start(self._handle_revocation)
+        self._revocations_started = True
+    
+    async def _handle_revocation(self, envelope: Dict[str, Any]):
+        """Apply a revocation published by any worker (including this one)"""
+        op = envelope.get("op")
+        if op == "revoke_token":
+            self._local_sessions.evict_token(envelope.get("token_hash", ""))
+        elif op == "revoke_user":
+            self._local_sessions.evict_user(envelope.get("user_id", ""))
+    
+    async def _publish_revocation(self, envelope: Dict[str, Any]):
+        if self._revocations is None or self._get_redis() is None:
+            return
         try:
-            cached_data = await self.redis_client.get(f"auth:user:{token_hash}")
-            if cached_data:
-                user_data = json.loads(cached_data)
-                return AuthenticatedUserResponse(**user_data)
+            await self._revocations.publish(envelope)
+        except Exception as e:
+            # Other workers fall back to the local TTL
+            self._redis.mark_unavailable(e)
+    
+    async def _get_cached_user(self, token_hash: str, token_exp: Optional[float] = None) -> Optional[AuthenticatedUserResponse]:
+        """Get user from the Redis tier, promoting hits into the local tier"""
+        client = self._get_redis()
+        if client is None:
             return None
+        
+        try:
+            cached_data = await client.get(f"auth:user:{token_hash}")
         except Exception as e:
-            logger.debug(f"Cache read failed: {e}")
+            self._redis.mark_unavailable(e)
             return None
+        
+        if not cached_data:
+            return None
+        user = AuthenticatedUserResponse(**json.loads(cached_data))
+        await self._ensure_revocation_listener()
+        self._local_sessions.put(token_hash, user, token_exp)
+        return user
     
-    async def _cache_user(self, token_hash: str, user: AuthenticatedUserResponse):
-        """Cache user data"""
-        if not self.redis_client:
+    async def _cache_user(self, token_hash: str, user: AuthenticatedUserResponse, token_exp: Optional[float] = None):
+        """Cache user data in both tiers"""
+        await self._ensure_revocation_listener()
+        self._local_sessions.put(token_hash, user, token_exp)
+        
+        client = self._get_redis()
+        if client is None:
             return
         
         try:
-            user_data = user.dict()
-            await self.redis_client.setex(
-                f"auth:user:{token_hash}",
-                self.cache_ttl,
-                json.dumps(user_data)
-            )
+            # Track the user's cached tokens so revoking a user needs no KEYS scan
+            sessions_key = self._user_sessions_key(user.user_id)
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.setex(f"auth:user:{token_hash}", self.cache_ttl, user.model_dump_json())
+                pipe.sadd(sessions_key, token_hash)
+                pipe.expire(sessions_key, self.cache_ttl)
+                await pipe.execute()
         except Exception as e:
-            logger.debug(f"Cache write failed: {e}")
+            self._redis.mark_unavailable(e)
     
     async def _invalidate_user_cache(self, token_hash: str):
-        """Invalidate user cache"""
-        if not self.redis_client:
-            return
+        """Invalidate one session in every tier and every worker"""
+        self._local_sessions.evict_token(token_hash)
         
-        try:
-            await self.redis_client.delete(f"auth:user:{token_hash}")
-        except Exception as e:
-            logger.debug(f"Cache invalidation failed: {e}")
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.delete(f"auth:user:{token_hash}")
+            except Exception as e:
+                self._redis.mark_unavailable(e)
+        
+        await self._publish_revocation({"op": "revoke_token", "token_hash": token_hash})
+    
+    async def _invalidate_user_sessions(self, user_id: str):
+        """Invalidate every cached session of a user (password/role change, deletion)"""
+        self._local_sessions.evict_user(user_id)
+        
+        client = self._get_redis()
+        if client is not None:
+            try:
+                sessions_key = self._user_sessions_key(user_id)
+                token_hashes = await client.smembers(sessions_key)
+                keys = [f"auth:user:{h.decode() if isinstance(h, bytes) else h}" for h in token_hashes]
+                await client.delete(sessions_key, *keys)
+                logger.debug(f"Invalidated {len(keys)} cached sessions for user {user_id}")
+            except Exception as e:
+                self._redis.mark_unavailable(e)
+        
+        await self._publish_revocation({"op": "revoke_user", "user_id": user_id})
 
     async def refresh_token(self, token: str) -> Optional[LoginResponse]:
         """Refresh JWT token if it's still valid or recently expired"""
@@ -544,7 +597,6 @@ class AuthenticationService:
                 
                 # Cache new session
                 try:
-                    cache_key = f"auth:user:{new_token_hash}"
                     cached_user = AuthenticatedUserResponse(
                         user_id=user_row["user_id"],
                         username=user_row["username"],
@@ -553,16 +605,7 @@ class AuthenticationService:
                         display_name=user_row["display_name"],
                         preferences=preferences
                     )
-                    
-                    if self.redis_client:
-                        await self.redis_client.setex(
-                            cache_key,
-                            self.cache_ttl,
-                            cached_user.model_dump_json()
-                        )
-                    
-                    expiry_time = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
-                    self._emergency_session_cache[new_token_hash] = (cached_user, expiry_time)
+                    await self._cache_user(new_token_hash, cached_user, int(expiration.timestamp()))
                 except Exception as cache_e:
                     logger.warning(f"Failed to cache refreshed session: {cache_e}")
                 
@@ -587,6 +630,13 @@ class AuthenticationService:
                 logger.error("❌ Auth service not initialized")
                 return None
                 
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            
+            # Local tier first: entries were verified before and never outlive the token's exp
+            cached_user = self._local_sessions.get(token_hash)
+            if cached_user:
+                return cached_user
+            
             logger.debug(f"🔍 Verifying JWT token: {token[:50]}...")
             payload = self.verify_jwt_token(token)
             if not payload:
@@ -594,11 +644,10 @@ class AuthenticationService:
                 return None
             
             logger.debug(f"✅ JWT token verified for user: {payload.get('username', 'unknown')}")
+            token_exp = payload.get('exp')
             
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
-            
-            # Try cache first
-            cached_user = await self._get_cached_user(token_hash)
+            # Then Redis
+            cached_user = await self._get_cached_user(token_hash, token_exp)
             if cached_user:
                 logger.debug(f"✅ User cache hit for {cached_user.user_id}")
                 return cached_user
@@ -655,7 +704,7 @@ class AuthenticationService:
                             )
                             
                             # Cache the user data
-                            await self._cache_user(token_hash, user)
+                            await self._cache_user(token_hash, user, token_exp)
                             logger.info(f"✅ JWT-only authentication successful for user: {user.username}")
                             
                             return user
@@ -698,7 +747,7 @@ class AuthenticationService:
                 )
                 
                 # Cache the user data
-                await self._cache_user(token_hash, user)
+                await self._cache_user(token_hash, user, token_exp)
                 logger.debug(f"✅ User cached for {user.user_id}")
                 
                 return user
@@ -902,21 +951,8 @@ class AuthenticationService:
                     last_login=row["last_login"]
                 )
                 
-                # Invalidate any cached sessions for this user
-                if self.redis_client:
-                    try:
-                        # Get all cached sessions for this user and invalidate them
-                        pattern = f"auth:user:*"
-                        keys = await self.redis_client.keys(pattern)
-                        for key in keys:
-                            cached_data = await self.redis_client.get(key)
-                            if cached_data:
-                                user_data = json.loads(cached_data)
-                                if user_data.get("user_id") == user_id:
-                                    await self.redis_client.delete(key)
-                                    logger.debug(f"Invalidated cache for updated user {user_id}")
-                    except Exception as e:
-                        logger.debug(f"Cache invalidation failed during user update: {e}")
+                # Invalidate any cached sessions for this user (role, is_active, profile)
+                await self._invalidate_user_sessions(user_id)
                 
                 return updated_user
                 
@@ -959,6 +995,7 @@ class AuthenticationService:
                     "DELETE FROM user_sessions WHERE user_id = $1",
                     user_id
                 )
+                await self._invalidate_user_sessions(user_id)
                 
                 logger.info(f"✅ Password changed for user: {user_id}")
                 return True
@@ -978,19 +1015,7 @@ class AuthenticationService:
                 
                 if result != "DELETE 0":
                     # Invalidate all cached sessions for this user
-                    if self.redis_client:
-                        try:
-                            pattern = f"auth:user:*"
-                            keys = await self.redis_client.keys(pattern)
-                            for key in keys:
-                                cached_data = await self.redis_client.get(key)
-                                if cached_data:
-                                    user_data = json.loads(cached_data)
-                                    if user_data.get("user_id") == user_id:
-                                        await self.redis_client.delete(key)
-                                        logger.debug(f"Invalidated cache for deleted user {user_id}")
-                        except Exception as e:
-                            logger.debug(f"Cache invalidation failed during user deletion: {e}")
+                    await self._invalidate_user_sessions(user_id)
                     
                     return True
                 
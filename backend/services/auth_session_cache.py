@@ -0,0 +1,90 @@
+"""
+Auth Session Cache - In-process tier in front of the Redis session cache
+
+get_current_user runs on every authenticated request. Verified sessions are kept
+in a bounded per-process LRU so a repeat request costs a dict lookup instead of
+a JWT decode, a Redis GET and a JSON decode.
+
+Entries never outlive the token's own exp claim and are capped at a short TTL.
+Logout, password change, role change and user deletion evict them in every
+process via the auth revocation channel (see AuthenticationService).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from models.api_models import AuthenticatedUserResponse
+
+# Redis pub/sub channel carrying revocations between backend workers
+REVOCATION_CHANNEL = "auth_revocations"
+
+
+class LocalSessionCache:
+    """Bounded LRU of token_hash -> verified user, indexed by user_id for revocation"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[AuthenticatedUserResponse, float]]" = OrderedDict()
+        self._user_tokens: Dict[str, Set[str]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token_hash: str) -> Optional[AuthenticatedUserResponse]:
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+        user, deadline = entry
+        if time.time() >= deadline:
+            self._remove(token_hash)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token_hash)
+        self.hits += 1
+        return user
+
+    def put(self, token_hash: str, user: AuthenticatedUserResponse, token_exp: Optional[float] = None) -> None:
+        """Cache a verified session until the TTL or the token's exp, whichever is first"""
+        deadline = time.time() + self.ttl
+        if token_exp is not None:
+            deadline = min(deadline, token_exp)
+        self._remove(token_hash)
+        self._entries[token_hash] = (user, deadline)
+        self._user_tokens.setdefault(user.user_id, set()).add(token_hash)
+        while len(self._entries) > self.max_size:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+
+    def evict_token(self, token_hash: str) -> None:
+        self._remove(token_hash)
+
+    def evict_user(self, user_id: str) -> None:
+        for token_hash in list(self._user_tokens.get(user_id, ())):
+            self._remove(token_hash)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._user_tokens.clear()
+
+    def _remove(self, token_hash: str) -> None:
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        tokens = self._user_tokens.get(entry[0].user_id)
+        if tokens is not None:
+            tokens.discard(token_hash)
+            if not tokens:
+                del self._user_tokens[entry[0].user_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "users": len(self._user_tokens),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -6,7 +6,7 @@ Background task processing for the "Big Stick" Orchestrator
 import os
 import logging
 from celery import Celery
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import worker_ready, worker_shutdown, worker_process_init, worker_process_shutdown
 from kombu import Queue
 
 logger = logging.getLogger(__name__)
@@ -86,10 +86,11 @@ celery_app.conf.update(
     # Celery Beat Schedule Configuration
     # Schedule for automatic RSS feed polling and other periodic tasks
     beat_schedule={
-        # RSS feed polling - run every 5 minutes
+        # RSS feed dispatch - every minute, lease feeds falling due and queue one poll per feed
+        # (per-feed cadence is adaptive; see tools_service.services.rss_poll_scheduler)
         'poll-rss-feeds': {
             'task': 'services.celery_tasks.rss_tasks.scheduled_rss_poll_task',
-            'schedule': 300.0,  # 5 minutes in seconds
+            'schedule': 60.0,  # 1 minute in seconds
         },
         # RSS health check - run every 30 minutes
         'rss-health-check': {
@@ -118,7 +119,7 @@ celery_app.conf.update(
         },
     },
     # Beat scheduler settings
-    beat_max_loop_interval=300,  # Check for new tasks every 5 minutes
+    beat_max_loop_interval=60,  # Check for new tasks every minute
 )
 
 # Worker lifecycle events
@@ -173,13 +174,14 @@ def update_task_progress(task, current_step: int, total_steps: int, message: str
 @celery_app.task(bind=True, name="worker.warmup")
 def warmup_worker_task(self):
     """Task to warm up worker on startup"""
-    import asyncio
+    from services.celery_async_runtime import run_async
     from services.worker_warmup import worker_warmup_service
     
     logger.info("🔥 WORKER WARMUP TASK: Starting...")
     
     try:
-        result = asyncio.run(worker_warmup_service.warmup_worker())
+        # Run on the persistent loop so warmed pools survive for later tasks
+        result = run_async(worker_warmup_service.warmup_worker())
         logger.info(f"🔥 WORKER WARMUP RESULT: {result}")
         return result
     except Exception as e:
@@ -231,6 +233,27 @@ def on_worker_shutdown(sender, **kwargs):
         logger.error(f"❌ Worker shutdown cleanup failed: {e}")
 
 
+# Worker process init signal - start the persistent per-process event loop
+@worker_process_init.connect
+def on_worker_process_init(sender=None, **kwargs):
+    """Start the shared async runtime in each pool child"""
+    os.environ['CELERY_WORKER_RUNNING'] = 'true'
+    try:
+        from services.celery_async_runtime import worker_async_runtime
+        worker_async_runtime.start()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to start worker async runtime: {e}")
+
+# Worker process shutdown signal - release per-process async resources
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(sender=None, **kwargs):
+    """Close the shared async runtime (DB pool, HTTP session, gRPC channels) when a pool child exits"""
+    try:
+        from services.celery_async_runtime import worker_async_runtime
+        worker_async_runtime.shutdown()
+    except Exception as e:
+        logger.warning(f"⚠️ Worker async runtime cleanup failed: {e}")
+
 if __name__ == "__main__":
     # For running Celery worker directly
     celery_app.start()
@@ -0,0 +1,175 @@
+"""
+Celery Worker Async Runtime
+Persistent per-worker-process event loop and shared async resources for Celery tasks
+
+Tasks used to create a fresh event loop per invocation, which forced every DB pool,
+aiohttp session and gRPC channel to be rebuilt (and torn down) for each task.
+The runtime keeps ONE loop alive for the lifetime of the worker process so those
+resources are created once and reused by every task the process executes.
+
+The loop is driven from the task's own thread (run_until_complete), so Celery's
+thread-local task context (self.request, update_state) keeps working inside coroutines.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerAsyncRuntime:
+    """Per-process event loop runner with shared async resources"""
+
+    def __init__(self):
+        # One loop per thread: prefork/solo workers have exactly one,
+        # threads pools get one per pool thread instead of a shared, re-entered loop.
+        self._local = threading.local()
+        self._pid: Optional[int] = None
+        self.tasks_run = 0
+
+    # ----- Loop lifecycle -----
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Create the loop for the current thread (called on worker_process_init)"""
+        loop = self.get_loop()
+        logger.info(f"🔁 Celery async runtime started (pid={os.getpid()})")
+        return loop
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return this thread's persistent loop, creating it if needed"""
+        pid = os.getpid()
+        if self._pid != pid:
+            # Forked child: loops and resources inherited from the parent are unusable
+            self._local = threading.local()
+            self._pid = pid
+
+        loop = getattr(self._local, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+            self._local.http_session = None
+            self._local.grpc_channels = {}
+        asyncio.set_event_loop(loop)
+        return loop
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine to completion on the persistent loop
+
+        Unlike asyncio.run / new_event_loop, the loop is NOT closed afterwards,
+        so pools, sessions and channels created by the coroutine stay warm.
+        """
+        loop = self.get_loop()
+        if loop.is_running():
+            raise RuntimeError("Celery async runtime loop is already running in this thread")
+
+        self.tasks_run += 1
+        return loop.run_until_complete(coro)
+
+    def shutdown(self) -> None:
+        """Close shared resources and the loop (called on worker_process_shutdown)"""
+        loop = getattr(self._local, "loop", None)
+        if loop is None or loop.is_closed() or self._pid != os.getpid():
+            return
+
+        try:
+            loop.run_until_complete(self._close_resources())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        except Exception as e:
+            logger.warning(f"⚠️ Celery async runtime cleanup error: {e}")
+        finally:
+            loop.close()
+            self._local.loop = None
+            logger.info(f"🛑 Celery async runtime stopped after {self.tasks_run} tasks (pid={os.getpid()})")
+
+    # ----- Shared resources -----
+
+    async def get_db_pool(self):
+        """Per-process asyncpg pool (see celery_database_helpers)"""
+        from services.database_manager.celery_database_helpers import get_celery_pool
+        return await get_celery_pool()
+
+    async def get_http_session(self):
+        """Shared aiohttp session with a pooled connector for the current loop"""
+        import aiohttp
+
+        session = getattr(self._local, "http_session", None)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=int(os.getenv("CELERY_HTTP_POOL_LIMIT", "100")),
+                limit_per_host=int(os.getenv("CELERY_HTTP_POOL_LIMIT_PER_HOST", "8")),
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._local.http_session = session
+        return session
+
+    def get_grpc_channel(self, target: str, options: Optional[List[Tuple[str, Any]]] = None):
+        """Shared grpc.aio channel per target for the current loop"""
+        import grpc
+
+        channels: Dict[str, Any] = getattr(self._local, "grpc_channels", None)
+        if channels is None:
+            channels = {}
+            self._local.grpc_channels = channels
+
+        channel = channels.get(target)
+        if channel is None:
+            channel = grpc.aio.insecure_channel(target, options=options or [])
+            channels[target] = channel
+        return channel
+
+    async def get_vector_service_client(self):
+        """Process-wide Vector Service client (channel stays bound to the persistent loop)"""
+        from clients.vector_service_client import get_vector_service_client
+        return await get_vector_service_client()
+
+    async def get_tool_service_client(self):
+        """Process-wide Tool Service client (channel stays bound to the persistent loop)"""
+        from clients.tool_service_client import get_tool_service_client
+        return await get_tool_service_client()
+
+    async def _close_resources(self) -> None:
+        session = getattr(self._local, "http_session", None)
+        if session is not None and not session.closed:
+            await session.close()
+        self._local.http_session = None
+
+        for target, channel in list((getattr(self._local, "grpc_channels", None) or {}).items()):
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.debug(f"Ignoring gRPC channel close error for {target}: {e}")
+        self._local.grpc_channels = {}
+
+        try:
+            import clients.vector_service_client as vector_module
+            if vector_module._vector_service_client is not None:
+                await vector_module._vector_service_client.close()
+                vector_module._vector_service_client = None
+        except Exception as e:
+            logger.debug(f"Ignoring vector client close error: {e}")
+
+        try:
+            from clients.tool_service_client import close_tool_service_client
+            await close_tool_service_client()
+        except Exception as e:
+            logger.debug(f"Ignoring tool client close error: {e}")
+
+        try:
+            from services.database_manager.celery_database_helpers import close_celery_pool
+            await close_celery_pool()
+        except Exception as e:
+            logger.debug(f"Ignoring Celery DB pool close error: {e}")
+
+
+# Global runtime instance (one per worker process after fork)
+worker_async_runtime = WorkerAsyncRuntime()
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """Submit a coroutine to the worker's persistent event loop and wait for the result"""
+    return worker_async_runtime.run(coro)
@@ -5,12 +5,11 @@ Uses gRPC orchestrator for all agent processing
 """
 
 import logging
-import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional
-import grpc
 
 from services.celery_app import celery_app, update_task_progress, TaskStatus
+from services.celery_async_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -63,65 +62,67 @@ async def _call_grpc_orchestrator(
             ('grpc.max_receive_message_length', 100 * 1024 * 1024),  # 100 MB
         ]
         
-        async with grpc.aio.insecure_channel(f'{orchestrator_host}:{orchestrator_port}', options=options) as channel:
-            stub = orchestrator_pb2_grpc.OrchestratorServiceStub(channel)
-            
-            # Use context gatherer to build comprehensive request
-            from services.grpc_context_gatherer import get_context_gatherer
-            context_gatherer = get_context_gatherer()
-            
-            # Build request context
-            request_context = {}
-            if persona:
-                request_context["persona"] = persona
-            
-            grpc_request = await context_gatherer.build_chat_request(
-                query=query,
-                user_id=user_id,
-                conversation_id=conversation_id,
-                session_id="background_task",
-                request_context=request_context if request_context else None,
-                state=None,
-                agent_type=agent_type,
-                routing_reason=f"Background task: {agent_type or 'auto'}"
-            )
-            
-            logger.info(f"📤 Background task forwarding to gRPC orchestrator: {query[:100]}")
-            
-            # Collect all chunks from streaming response
-            full_response = ""
-            agent_name = None
-            status_messages = []
-            
-            async for chunk in stub.StreamChat(grpc_request):
-                if chunk.type == "status":
-                    status_messages.append(chunk.message)
-                    if chunk.agent_name:
-                        agent_name = chunk.agent_name
-                    logger.debug(f"📊 Status: {chunk.message}")
-                
-                elif chunk.type == "content":
-                    full_response += chunk.message
-                    if chunk.agent_name:
-                        agent_name = chunk.agent_name
-                
-                elif chunk.type == "error":
-                    logger.error(f"❌ gRPC orchestrator error: {chunk.message}")
-                    return {
-                        "success": False,
-                        "error": chunk.message,
-                        "message": "Background task processing failed"
-                    }
-            
-            logger.info(f"✅ Background task received response from {agent_name or 'orchestrator'}: {len(full_response)} chars")
+        # Reuse the worker's orchestrator channel instead of dialing per task
+        from services.celery_async_runtime import worker_async_runtime
+        channel = worker_async_runtime.get_grpc_channel(f'{orchestrator_host}:{orchestrator_port}', options=options)
+        stub = orchestrator_pb2_grpc.OrchestratorServiceStub(channel)
+        
+        # Use context gatherer to build comprehensive request
+        from services.grpc_context_gatherer import get_context_gatherer
+        context_gatherer = get_context_gatherer()
+        
+        # Build request context
+        request_context = {}
+        if persona:
+            request_context["persona"] = persona
+        
+        grpc_request = await context_gatherer.build_chat_request(
+            query=query,
+            user_id=user_id,
+            conversation_id=conversation_id,
+            session_id="background_task",
+            request_context=request_context if request_context else None,
+            state=None,
+            agent_type=agent_type,
+            routing_reason=f"Background task: {agent_type or 'auto'}"
+        )
+        
+        logger.info(f"📤 Background task forwarding to gRPC orchestrator: {query[:100]}")
+        
+        # Collect all chunks from streaming response
+        full_response = ""
+        agent_name = None
+        status_messages = []
+        
+        async for chunk in stub.StreamChat(grpc_request):
+            if chunk.type == "status":
+                status_messages.append(chunk.message)
+                if chunk.agent_name:
+                    agent_name = chunk.agent_name
+                logger.debug(f"📊 Status: {chunk.message}")
             
-            return {
-                "success": True,
-                "response": full_response,
-                "agent_type": agent_name or agent_type or "unknown",
-                "status_messages": status_messages
-            }
+            elif chunk.type == "content":
+                full_response += chunk.message
+                if chunk.agent_name:
+                    agent_name = chunk.agent_name
             
+            elif chunk.type == "error":
+                logger.error(f"❌ gRPC orchestrator error: {chunk.message}")
+                return {
+                    "success": False,
+                    "error": chunk.message,
+                    "message": "Background task processing failed"
+                }
+        
+        logger.info(f"✅ Background task received response from {agent_name or 'orchestrator'}: {len(full_response)} chars")
+        
+        return {
+            "success": True,
+            "response": full_response,
+            "agent_type": agent_name or agent_type or "unknown",
+            "status_messages": status_messages
+        }
+        
     except Exception as e:
         logger.error(f"❌ Background task gRPC orchestrator error: {e}")
         return {
@@ -146,7 +147,7 @@ def research_background_task(
         update_task_progress(self, 1, 4, "Initializing research agent...")
         
         # Run async research processing
-        result = asyncio.run(_async_research_processing(
+        result = run_async(_async_research_processing(
             self, user_id, conversation_id, query, persona
         ))
         
@@ -253,7 +254,7 @@ def coding_background_task(
         
         update_task_progress(self, 1, 3, "Initializing coding agent...")
         
-        result = asyncio.run(_async_coding_processing(
+        result = run_async(_async_coding_processing(
             self, user_id, conversation_id, query, persona
         ))
         
@@ -365,11 +366,11 @@ def batch_agent_processing(
             persona = task_config.get("persona")
             
             if agent_type == "research":
-                result = asyncio.run(_async_research_processing(
+                result = run_async(_async_research_processing(
                     self, user_id, conversation_id, query, persona
                 ))
             elif agent_type == "coding":
-                result = asyncio.run(_async_coding_processing(
+                result = run_async(_async_coding_processing(
                     self, user_id, conversation_id, query, persona
                 ))
             else:
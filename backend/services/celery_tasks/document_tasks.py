@@ -4,11 +4,11 @@ Background reprocessing after document content save so the save response returns
 """
 
 import logging
-import asyncio
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from services.celery_app import celery_app
+from services.celery_async_runtime import run_async
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -16,7 +16,8 @@ logger = logging.getLogger(__name__)
 
 async def _async_reprocess_document_after_save(doc_id: str, user_id: str) -> Dict[str, Any]:
     """
-    Resolve document file path and run full reprocess (re-embed + entity extraction).
+    Resolve document file path and run a diff-based re-index (only changed chunks are
+    embedded, only vanished chunks deleted, entities extracted from changed chunks).
     Called from Celery after content has been written to disk by update_document_content.
     """
     from services.service_container import get_service_container
@@ -64,8 +65,8 @@ async def _async_reprocess_document_after_save(doc_id: str, user_id: str) -> Dic
         return {"success": False, "error": "File not found on disk", "document_id": doc_id}
 
     doc_type = document_service._detect_document_type(doc_info.filename)
-    await document_service._process_document_async(doc_id, file_path, doc_type, user_id)
-    return {"success": True, "document_id": doc_id}
+    reindex = await document_service.reindex_document_incremental(doc_id, file_path, doc_type, user_id)
+    return {"success": True, **reindex}
 
 
 @celery_app.task(bind=True, name="services.celery_tasks.document_tasks.reprocess_document_after_save")
@@ -76,12 +77,8 @@ def reprocess_document_after_save_task(self, doc_id: str, user_id: str) -> Dict[
     """
     try:
         logger.info(f"Document reprocess task started: {doc_id}")
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_reprocess_document_after_save(doc_id, user_id))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_reprocess_document_after_save(doc_id, user_id))
         logger.info(f"Document reprocess task completed: {doc_id}")
         return result
     except Exception as e:
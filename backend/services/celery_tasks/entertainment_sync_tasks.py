@@ -4,12 +4,12 @@ Background processing for Sonarr/Radarr content synchronization
 """
 
 import logging
-import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 
 from services.celery_app import celery_app, update_task_progress, TaskStatus
+from services.celery_async_runtime import run_async
 from celery.exceptions import SoftTimeLimitExceeded
 
 logger = logging.getLogger(__name__)
@@ -28,13 +28,8 @@ def scheduled_entertainment_sync_task(self) -> Dict[str, Any]:
         
         update_task_progress(self, 1, 3, "Fetching enabled sync configurations...")
         
-        # Create new event loop
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_scheduled_sync(self))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_scheduled_sync(self))
         
         logger.info("✅ ENTERTAINMENT SYNC: Scheduled sync task completed")
         return result
@@ -102,13 +97,8 @@ def sync_entertainment_source_task(self, config_id: str) -> Dict[str, Any]:
         
         update_task_progress(self, 1, 5, "Initializing sync...")
         
-        # Create new event loop
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_sync_source(self, config_id))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_sync_source(self, config_id))
         
         logger.info(f"✅ ENTERTAINMENT SYNC: Completed sync for config {config_id}")
         return result
@@ -387,13 +377,8 @@ def process_entertainment_item_task(
     try:
         logger.info(f"🎬 PROCESSING: Starting item processing for config {config_id}")
         
-        # Create new event loop
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_process_item(self, config_id, item_data, source_type))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_process_item(self, config_id, item_data, source_type))
         
         logger.info(f"✅ PROCESSING: Completed item processing")
         return result
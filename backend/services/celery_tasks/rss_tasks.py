@@ -5,10 +5,12 @@ Background processing for RSS feed monitoring and article processing
 
 import logging
 import asyncio
-from datetime import datetime
+import heapq
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
 from services.celery_app import celery_app, update_task_progress, TaskStatus
+from services.celery_async_runtime import run_async
 from celery.exceptions import SoftTimeLimitExceeded
 from services.celery_utils import (
     safe_serialize_error, 
@@ -37,15 +39,10 @@ def extract_full_content_task(
         
         update_task_progress(self, 1, 4, "Initializing Crawl4AI extraction...")
         
-        # Create new event loop for this task to avoid "Event loop is closed" errors
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_extract_full_content(
-                self, user_id, article_ids
-            ))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_extract_full_content(
+            self, user_id, article_ids
+        ))
         
         logger.info(f"✅ RSS TASK: Completed full content extraction successfully")
         return result
@@ -85,53 +82,6 @@ async def _cleanup_stuck_polling_feeds():
         return 0
 
 
-async def _get_feeds_summary():
-    """Get a summary of RSS feeds status for monitoring"""
-    try:
-        from tools_service.services.rss_service import get_rss_service
-        rss_service = await get_rss_service()
-
-        # Get total feeds count
-        from services.database_manager.database_helpers import fetch_value
-        try:
-            total_feeds = await fetch_value("SELECT COUNT(*) FROM rss_feeds")
-        except Exception:
-            total_feeds = 0
-
-        # Get feeds needing poll
-        feeds_needing_poll = await rss_service.get_feeds_needing_poll()
-        feeds_needing_poll_count = len(feeds_needing_poll)
-
-        # Get feeds currently being polled
-        try:
-            polling_feeds = await fetch_value("SELECT COUNT(*) FROM rss_feeds WHERE is_polling = true")
-        except Exception:
-            polling_feeds = 0
-
-        # Get feeds by check interval distribution
-        interval_counts = {}
-        from services.database_manager.database_helpers import fetch_all
-        rows = await fetch_all("SELECT check_interval, COUNT(*) as count FROM rss_feeds GROUP BY check_interval ORDER BY check_interval")
-        for row in rows:
-            interval_minutes = row['check_interval'] // 60
-            interval_counts[f"{interval_minutes}min"] = row['count']
-
-        return {
-            "total_feeds": total_feeds,
-            "feeds_needing_poll": feeds_needing_poll_count,
-            "polling_feeds": polling_feeds,
-            "interval_distribution": interval_counts
-        }
-    except Exception as e:
-        logger.error(f"❌ RSS TASK ERROR: Failed to get feeds summary: {e}")
-        return {
-            "total_feeds": 0,
-            "feeds_needing_poll": 0,
-            "polling_feeds": 0,
-            "interval_distribution": {}
-        }
-
-
 @celery_app.task(bind=True, name="services.celery_tasks.rss_tasks.poll_rss_feeds_task", rate_limit="1/m")  # Limit to 1 poll per minute
 def poll_rss_feeds_task(
     self,
@@ -149,27 +99,18 @@ def poll_rss_feeds_task(
         
         # First, cleanup any stuck polling feeds
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            cleaned_count = loop.run_until_complete(_cleanup_stuck_polling_feeds())
+            cleaned_count = run_async(_cleanup_stuck_polling_feeds())
             if cleaned_count > 0:
                 logger.info(f"🧹 RSS TASK: Cleaned up {cleaned_count} stuck polling feeds before polling")
         except Exception as e:
             logger.warning(f"⚠️ RSS TASK: Failed to cleanup stuck polling feeds: {e}")
-        finally:
-            loop.close()
         
         update_task_progress(self, 1, 4, "Initializing RSS background agent...")
         
-        # Create new event loop for this task to avoid "Event loop is closed" errors
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_poll_rss_feeds(
-                self, user_id, feed_ids, force_poll
-            ))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_poll_rss_feeds(
+            self, user_id, feed_ids, force_poll
+        ))
         
         logger.info(f"✅ RSS TASK: Completed RSS feed polling successfully")
         return result
@@ -235,15 +176,10 @@ def process_rss_article_task(
         
         update_task_progress(self, 1, 5, "Initializing article processing...")
         
-        # Create new event loop for this task to avoid "Event loop is closed" errors
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_process_rss_article(
-                self, article_id, user_id, collection_name
-            ))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_process_rss_article(
+            self, article_id, user_id, collection_name
+        ))
         
         logger.info(f"✅ RSS TASK: Completed article processing successfully")
         return result
@@ -280,13 +216,8 @@ def cleanup_stuck_rss_feeds_task(self) -> Dict[str, Any]:
 
         update_task_progress(self, 1, 2, "Cleaning up stuck RSS feeds...")
 
-        # Create new event loop for this task to avoid "Event loop is closed" errors
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            cleaned_count = loop.run_until_complete(_cleanup_stuck_polling_feeds())
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        cleaned_count = run_async(_cleanup_stuck_polling_feeds())
 
         update_task_progress(self, 2, 2, "Cleanup completed")
 
@@ -330,13 +261,8 @@ def rss_health_check_task(self) -> Dict[str, Any]:
         
         update_task_progress(self, 1, 3, "Checking RSS feed health...")
         
-        # Create new event loop for this task to avoid "Event loop is closed" errors
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(_async_rss_health_check(self))
-        finally:
-            loop.close()
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        result = run_async(_async_rss_health_check(self))
         
         logger.info(f"✅ RSS TASK: Completed RSS health check successfully")
         return result
@@ -447,12 +373,37 @@ async def _async_process_rss_article(
         import re
         from bs4 import BeautifulSoup
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(article.link, timeout=30) as response:
-                if response.status != 200:
+        # Shared crawl cache: reuse a page the RSS agent or a crawl tool already fetched,
+        # or revalidate a stale copy with a conditional GET
+        from services.crawl_cache import get_crawl_cache, RAW_HTML_VARIANT
+        crawl_cache = get_crawl_cache()
+        cached_page = await crawl_cache.get_html(article.link, source="rss_article")
+        
+        if cached_page and cached_page["fresh"]:
+            content = cached_page["data"]["html"]
+        else:
+            # Shared per-worker session: keep-alive connections are reused across tasks
+            from services.celery_async_runtime import worker_async_runtime
+            session = await worker_async_runtime.get_http_session()
+            async with session.get(
+                article.link,
+                headers=crawl_cache.validator_headers(cached_page),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 304 and cached_page:
+                    content = cached_page["data"]["html"]
+                    await crawl_cache.refresh(article.link, RAW_HTML_VARIANT, cached_page, source="rss_article")
+                elif response.status != 200:
                     raise Exception(f"Failed to download article: HTTP {response.status}")
-                
-                content = await response.text()
+                else:
+                    content = await response.text()
+                    await crawl_cache.put(
+                        article.link,
+                        RAW_HTML_VARIANT,
+                        {"html": content},
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
         
         # Use universal content extractor for better results
         from services.universal_content_extractor import get_universal_content_extractor
@@ -882,10 +833,14 @@ async def _async_rss_health_check(task) -> Dict[str, Any]:
         # TODO: Implement RSS feed health analysis
         # health_results = await analyze_rss_feed_health()
         
+        from services.crawl_cache import get_crawl_cache
+        crawl_cache_stats = await get_crawl_cache().get_stats()
+        
         update_task_progress(task, 3, 3, "Health check completed")
         
         # For now, return placeholder result
         return {
+            "crawl_cache": crawl_cache_stats,
             "success": True,
             "task_id": task.request.id,
             "timestamp": datetime.now().isoformat(),
@@ -900,49 +855,105 @@ async def _async_rss_health_check(task) -> Dict[str, Any]:
         raise e
 
 
+async def _claim_due_feeds(lookahead_seconds: int) -> List[Dict[str, Any]]:
+    """Lease feeds due within the lookahead window (adaptive scheduler)"""
+    from tools_service.services.rss_service import get_rss_service
+    rss_service = await get_rss_service()
+    return await rss_service.claim_due_feeds(lookahead_seconds=lookahead_seconds)
+
+
+async def _async_poll_single_feed(task, feed_id: str) -> Dict[str, Any]:
+    """Poll exactly one feed through the RSS background agent"""
+    from services.langgraph_agents.rss_background_agent import RSSBackgroundAgent
+    rss_agent = RSSBackgroundAgent()
+    
+    result = await rss_agent.process({
+        "user_id": None,
+        "feeds_to_poll": [feed_id],
+        "force_poll": False,
+        "task_id": task.request.id
+    })
+    
+    return {
+        "success": True,
+        "task_id": task.request.id,
+        "feed_id": feed_id,
+        "timestamp": datetime.now().isoformat(),
+        "result": clean_result_for_storage(result)
+    }
+
+
+@celery_app.task(bind=True, name="services.celery_tasks.rss_tasks.poll_single_rss_feed_task")
+def poll_single_rss_feed_task(self, feed_id: str) -> Dict[str, Any]:
+    """
+    Poll one RSS feed at its scheduled due time
+    
+    Dispatched individually by scheduled_rss_poll_task with an ETA, so each feed
+    is fetched on its own learned cadence instead of in a monolithic sweep.
+    """
+    try:
+        logger.info(f"📡 RSS TASK: Polling feed {feed_id} (Task ID: {self.request.id})")
+        return run_async(_async_poll_single_feed(self, feed_id))
+    except Exception as e:
+        logger.error(f"❌ RSS TASK ERROR: Single feed poll failed for {feed_id}: {e}")
+        return {
+            "success": False,
+            "feed_id": feed_id,
+            "error": str(e),
+            "message": "Single RSS feed poll failed"
+        }
+
+
 # Scheduled task for automatic RSS feed polling
 @celery_app.task(bind=True, name="services.celery_tasks.rss_tasks.scheduled_rss_poll_task")
-def scheduled_rss_poll_task(self) -> Dict[str, Any]:
+def scheduled_rss_poll_task(self, lookahead_seconds: int = 60) -> Dict[str, Any]:
     """
     Scheduled task for automatic RSS feed polling
 
     **BULLY!** This is the scheduled cavalry charge that keeps RSS feeds fresh!
-    This task is triggered by Celery Beat to poll all active feeds
+    Triggered by Celery Beat every minute: leases feeds that fall due within the
+    lookahead window and dispatches one poll task per feed at its due time,
+    highest-demand feeds first.
     """
     try:
-        logger.info(f"⏰ RSS TASK: Starting scheduled RSS feed polling - cavalry charge commencing!")
-
-        update_task_progress(self, 1, 3, "Checking feeds needing poll...")
-
-        # First, get a summary of feeds that need polling for better logging
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            feeds_summary = loop.run_until_complete(_get_feeds_summary())
-        finally:
-            loop.close()
-
-        logger.info(f"📊 RSS TASK: Found {feeds_summary['total_feeds']} total feeds, {feeds_summary['feeds_needing_poll']} need polling")
-
-        update_task_progress(self, 2, 3, f"Polling {feeds_summary['feeds_needing_poll']} RSS feeds...")
-
-        # Poll all active feeds
-        result = poll_rss_feeds_task.delay(
-            user_id=None,  # Global polling
-            feed_ids=None,  # All feeds
-            force_poll=False
-        )
+        logger.info(f"⏰ RSS TASK: Dispatching RSS feeds due in the next {lookahead_seconds}s")
+
+        update_task_progress(self, 1, 2, "Claiming due feeds...")
+
+        # Run on the worker's persistent event loop (shared pools/sessions stay warm)
+        due_feeds = run_async(_claim_due_feeds(lookahead_seconds))
+
+        from tools_service.services.rss_poll_scheduler import dispatch_priority
+
+        # Priority queue ordered by due time, then demand (higher demand first)
+        queue = []
+        for row in due_feeds:
+            demand = float(row.get("demand") or 0)
+            heapq.heappush(queue, (row["due_at"], -demand, row["feed_id"]))
+
+        now = datetime.utcnow()
+        dispatched = 0
+        while queue:
+            due_at, neg_demand, feed_id = heapq.heappop(queue)
+            if due_at is not None and due_at.tzinfo is not None:
+                due_at = due_at.astimezone(timezone.utc).replace(tzinfo=None)
+            countdown = max(0.0, (due_at - now).total_seconds()) if due_at else 0.0
+            poll_single_rss_feed_task.apply_async(
+                args=[feed_id],
+                countdown=countdown,
+                priority=dispatch_priority(-neg_demand)
+            )
+            dispatched += 1
 
-        update_task_progress(self, 3, 3, "RSS polling task queued")
+        update_task_progress(self, 2, 2, f"Dispatched {dispatched} feed polls")
 
-        logger.info(f"✅ RSS TASK: Scheduled RSS polling initiated - task {result.id} queued")
+        logger.info(f"✅ RSS TASK: Dispatched {dispatched} individually scheduled feed polls")
 
         return {
             "success": True,
-            "scheduled_task_id": result.id,
             "timestamp": datetime.now().isoformat(),
-            "feeds_summary": feeds_summary,
-            "message": f"Scheduled RSS polling initiated - {feeds_summary['feeds_needing_poll']} feeds queued for polling"
+            "feeds_dispatched": dispatched,
+            "message": f"Scheduled RSS polling dispatched {dispatched} feeds"
         }
 
     except Exception as e:
@@ -959,47 +970,41 @@ def scheduled_rss_poll_task(self) -> Dict[str, Any]:
 def purge_old_news_task(self):
     """Purge synthesized news articles older than retention_days."""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        def _run():
-            async def _purge():
-                try:
-                    from services.settings_service import settings_service
-                    from services.database_manager.database_helpers import execute
-                    
-                    if not getattr(settings_service, "_initialized", False):
-                        await settings_service.initialize()
-                    days = await settings_service.get_setting("news.retention_days", 14)
-                    days = int(days or 14)
-                    # First fetch file paths to delete from disk
-                    from services.database_manager.database_helpers import fetch_all
-                    rows = await fetch_all(
-                        "SELECT file_path FROM news_articles WHERE updated_at < (NOW() - ($1 || ' days')::interval)",
-                        days,
-                    )
-                    import os
-                    deleted_files = 0
-                    for row in rows or []:
-                        p = row.get("file_path")
-                        try:
-                            if p and os.path.exists(p):
-                                os.remove(p)
-                                deleted_files += 1
-                        except Exception:
-                            pass
-                    # Then delete SQL rows
-                    await execute(
-                        "DELETE FROM news_articles WHERE updated_at < (NOW() - ($1 || ' days')::interval)",
-                        days,
-                    )
-                    return {"status": "ok", "purged": True, "retention_days": days, "files_deleted": deleted_files}
-                except Exception as e:
-                    return {"status": "error", "error": str(e)}
-            return loop.run_until_complete(_purge())
-        try:
-            result = _run()
-        finally:
-            loop.close()
+        async def _purge():
+            try:
+                from services.settings_service import settings_service
+                from services.database_manager.database_helpers import execute
+                
+                if not getattr(settings_service, "_initialized", False):
+                    await settings_service.initialize()
+                days = await settings_service.get_setting("news.retention_days", 14)
+                days = int(days or 14)
+                # First fetch file paths to delete from disk
+                from services.database_manager.database_helpers import fetch_all
+                rows = await fetch_all(
+                    "SELECT file_path FROM news_articles WHERE updated_at < (NOW() - ($1 || ' days')::interval)",
+                    days,
+                )
+                import os
+                deleted_files = 0
+                for row in rows or []:
+                    p = row.get("file_path")
+                    try:
+                        if p and os.path.exists(p):
+                            os.remove(p)
+                            deleted_files += 1
+                    except Exception:
+                        pass
+                # Then delete SQL rows
+                await execute(
+                    "DELETE FROM news_articles WHERE updated_at < (NOW() - ($1 || ' days')::interval)",
+                    days,
+                )
+                return {"status": "ok", "purged": True, "retention_days": days, "files_deleted": deleted_files}
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
+
+        result = run_async(_purge())
         return result
     except Exception as e:
         logger.error(f"❌ PURGE NEWS TASK ERROR: {e}")
@@ -0,0 +1,230 @@
+"""
+Crawl Cache - Shared, size-bounded cache of fetched/extracted web pages
+
+The same article URL is fetched by the RSS agent, the RSS article task, the
+CrawlWebContent/CrawlSite tools and research agents, often minutes apart and in
+different processes (API, Celery workers). Entries live in Redis keyed by the
+normalized URL (tracking params stripped) plus a variant describing how the page
+was extracted, so every process shares one copy.
+
+Entries are zlib-compressed JSON with a TTL. They are kept for a stale grace
+period after expiry so raw fetches can revalidate with ETag / Last-Modified
+instead of downloading again. Total entries are capped via a stored-at index.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+
+from config import settings
+from utils.redis_backoff import RedisBackoff
+from utils.url_normalization import normalize_url
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "crawl_cache"
+INDEX_KEY = f"{KEY_PREFIX}:index"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# Variant for the raw HTML of a page fetched directly over HTTP
+RAW_HTML_VARIANT = "raw_html"
+
+
+class CrawlCache:
+    """Redis-backed crawl result cache shared by every crawl entry point"""
+
+    def __init__(self):
+        self.enabled = settings.CRAWL_CACHE_ENABLED
+        self.ttl_seconds = settings.CRAWL_CACHE_TTL_SECONDS
+        self.stale_grace_seconds = settings.CRAWL_CACHE_STALE_GRACE_SECONDS
+        self.max_entries = settings.CRAWL_CACHE_MAX_ENTRIES
+        self.max_entry_bytes = settings.CRAWL_CACHE_MAX_ENTRY_BYTES
+
+        # Back off instead of failing every crawl on a Redis outage
+        self._redis = RedisBackoff("Crawl cache")
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        if not self.enabled:
+            return None
+        return self._redis.get_client()
+
+    @staticmethod
+    def _key(url: str, variant: str) -> str:
+        digest = hashlib.sha256(f"{normalize_url(url)}|{variant}".encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:entry:{digest}"
+
+    @staticmethod
+    def _html_alias_key(url: str) -> str:
+        digest = hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:html:{digest}"
+
+    async def _count(self, client: redis.Redis, source: str, outcome: str) -> None:
+        try:
+            await client.hincrby(STATS_KEY, f"{source}:{outcome}", 1)
+        except Exception:
+            pass
+
+    async def _lookup(self, client: redis.Redis, key: str) -> Optional[Dict[str, Any]]:
+        raw = await client.get(key)
+        if not raw:
+            return None
+        entry = json.loads(zlib.decompress(raw))
+        entry["fresh"] = time.time() < entry["expires_at"]
+        return entry
+
+    async def get(self, url: str, variant: str, source: str = "crawl", allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Cached entry for a URL/variant, or None
+
+        The entry dict has "data", "etag", "last_modified", "stored_at" and "fresh".
+        Stale entries (past TTL, within grace) are only returned with allow_stale.
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            entry = await self._lookup(client, self._key(url, variant))
+            if entry is not None and not entry["fresh"] and not allow_stale:
+                entry = None
+            await self._count(client, source, "hits" if entry and entry["fresh"] else "misses")
+            return entry
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+            return None
+
+    async def put(
+        self,
+        url: str,
+        variant: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """Store a fetched/extracted page; oversized entries are skipped"""
+        client = self._get_client()
+        if client is None:
+            return
+        now = time.time()
+        ttl = ttl_seconds or self.ttl_seconds
+        entry = {
+            "url": url,
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": now,
+            "expires_at": now + ttl,
+        }
+        payload = zlib.compress(json.dumps(entry, default=str).encode("utf-8"))
+        if len(payload) > self.max_entry_bytes:
+            logger.debug(f"Crawl cache: skipping {url} ({len(payload)} bytes compressed)")
+            return
+
+        key = self._key(url, variant)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(key, payload, ex=ttl + self.stale_grace_seconds)
+                pipe.zadd(INDEX_KEY, {key: now})
+                if data.get("html") and variant != RAW_HTML_VARIANT:
+                    # Lets raw-HTML readers reuse a page another path already crawled
+                    pipe.set(self._html_alias_key(url), key, ex=ttl)
+                pipe.zcard(INDEX_KEY)
+                results = await pipe.execute()
+            overflow = results[-1] - self.max_entries
+            if overflow > 0:
+                await self._evict(client, overflow)
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+
+    async def refresh(self, url: str, variant: str, entry: Dict[str, Any], source: str = "crawl") -> None:
+        """Extend a stale entry after the origin answered 304 Not Modified"""
+        await self.put(url, variant, entry["data"], etag=entry.get("etag"), last_modified=entry.get("last_modified"))
+        client = self._get_client()
+        if client is not None:
+            await self._count(client, source, "revalidated")
+
+    async def get_html(self, url: str, source: str = "raw_html") -> Optional[Dict[str, Any]]:
+        """
+        Raw HTML for a URL from any path that fetched it
+
+        Prefers a fresh raw-HTML entry, then the HTML of a fresh crawl4ai result
+        for the same page, then a stale raw-HTML entry (its validators allow a
+        conditional GET).
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            entry = await self._lookup(client, self._key(url, RAW_HTML_VARIANT))
+            if entry is None or not entry["fresh"]:
+                alias = await client.get(self._html_alias_key(url))
+                crawled = await self._lookup(client, alias.decode()) if alias else None
+                if crawled and crawled["fresh"] and crawled["data"].get("html"):
+                    entry = {**crawled, "data": {"html": crawled["data"]["html"]}, "etag": None, "last_modified": None}
+            await self._count(client, source, "hits" if entry and entry["fresh"] else "misses")
+            return entry
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+            return None
+
+    @staticmethod
+    def validator_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional-GET headers for a (stale) cached entry"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def _evict(self, client: redis.Redis, count: int) -> None:
+        """Drop the oldest entries beyond max_entries"""
+        oldest = await client.zpopmin(INDEX_KEY, count)
+        keys = [key for key, _ in oldest]
+        if keys:
+            await client.delete(*keys)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per source plus overall hit rate"""
+        client = self._get_client()
+        if client is None:
+            return {"enabled": self.enabled, "available": False}
+        try:
+            raw_stats = await client.hgetall(STATS_KEY)
+            entries = await client.zcard(INDEX_KEY)
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+            return {"enabled": self.enabled, "available": False}
+
+        sources: Dict[str, Dict[str, int]] = {}
+        for field, value in raw_stats.items():
+            source, _, outcome = field.decode().rpartition(":")
+            sources.setdefault(source, {})[outcome] = int(value)
+
+        total_hits = sum(counts.get("hits", 0) for counts in sources.values())
+        total_lookups = total_hits + sum(counts.get("misses", 0) for counts in sources.values())
+        return {
+            "enabled": self.enabled,
+            "available": True,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hit_rate": round(total_hits / total_lookups, 3) if total_lookups else 0.0,
+            "sources": sources,
+        }
+
+
+_crawl_cache: Optional[CrawlCache] = None
+
+
+def get_crawl_cache() -> CrawlCache:
+    """Get the process-wide crawl cache"""
+    global _crawl_cache
+    if _crawl_cache is None:
+        _crawl_cache = CrawlCache()
+    return _crawl_cache
@@ -0,0 +1,72 @@
+"""
+Document Chunk Index - Tracks which chunks are embedded for each document
+
+Every successful vector upsert records (content_hash -> point_id) per document,
+so re-indexing after a save can diff the new chunking against what is stored and
+only embed added chunks / delete vanished ones. Point IDs are deterministic, so a
+missed index write is self-healing: the chunk is simply re-embedded to the same ID.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from services.database_manager.database_helpers import fetch_all, execute
+
+logger = logging.getLogger(__name__)
+
+
+async def get_chunk_index(document_id: str) -> Dict[str, Dict[str, str]]:
+    """Return {content_hash: {"point_id", "collection_name"}} for a document"""
+    rows = await fetch_all("""
+        SELECT content_hash, point_id::text AS point_id, collection_name
+        FROM document_chunk_index
+        WHERE document_id = $1
+    """, document_id)
+    return {
+        row["content_hash"]: {"point_id": row["point_id"], "collection_name": row["collection_name"]}
+        for row in rows
+    }
+
+
+async def record_stored_chunks(document_id: str, entries: List[Tuple[str, str, int]], collection_name: str) -> None:
+    """Upsert (content_hash, point_id, chunk_index) rows for chunks just stored in a collection"""
+    if not entries:
+        return
+
+    try:
+        await execute("""
+            INSERT INTO document_chunk_index (document_id, content_hash, point_id, chunk_index, collection_name)
+            SELECT $1, e.content_hash, e.point_id::uuid, e.chunk_index, $5
+            FROM unnest($2::text[], $3::text[], $4::int[]) AS e(content_hash, point_id, chunk_index)
+            ON CONFLICT (document_id, content_hash) DO UPDATE SET
+                point_id = EXCLUDED.point_id,
+                chunk_index = EXCLUDED.chunk_index,
+                collection_name = EXCLUDED.collection_name,
+                updated_at = NOW()
+        """, document_id,
+            [entry[0] for entry in entries],
+            [entry[1] for entry in entries],
+            [entry[2] for entry in entries],
+            collection_name)
+    except Exception as e:
+        # Index is an optimization - deterministic IDs make a missed row harmless
+        logger.warning(f"⚠️ Failed to record chunk index for {document_id}: {e}")
+
+
+async def remove_chunk_hashes(document_id: str, content_hashes: List[str]) -> None:
+    """Drop index rows for chunks deleted from the vector store"""
+    if not content_hashes:
+        return
+
+    await execute("""
+        DELETE FROM document_chunk_index
+        WHERE document_id = $1 AND content_hash = ANY($2::text[])
+    """, document_id, content_hashes)
+
+
+async def clear_chunk_index(document_id: str) -> None:
+    """Forget every indexed chunk for a document (all its vectors were deleted)"""
+    try:
+        await execute("DELETE FROM document_chunk_index WHERE document_id = $1", document_id)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to clear chunk index for {document_id}: {e}")
@@ -33,6 +33,8 @@ from utils.parallel_document_processor import ParallelDocumentProcessor, Process
 from services.knowledge_graph_service import KnowledgeGraphService
 from services.embedding_service_wrapper import get_embedding_service
 from services.link_extraction_service import get_link_extraction_service
+from services.document_chunk_index import clear_chunk_index, get_chunk_index, remove_chunk_hashes
+from utils.chunk_hashing import diff_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -764,6 +766,95 @@ class DocumentService:
         if result.quality_metrics:
             await self.document_repository.update_quality_metrics(document_id, result.quality_metrics)
     
+    async def reindex_document_incremental(self, document_id: str, file_path: Path, doc_type: str, user_id: str = None) -> Dict[str, Any]:
+        """
+        Re-index a document after an edit by diffing chunks against what is already stored
+        
+        Chunks are identified by content hash, so only added chunks are embedded and
+        upserted and only vanished chunks are deleted. Documents without a chunk index
+        (indexed before deterministic IDs) get a one-time full rebuild.
+        """
+        # Structured/binary types and exempt documents keep their dedicated handling
+        if doc_type in ('org', 'image') or await self.document_repository.is_document_exempt(document_id, user_id):
+            await self._process_document_async(document_id, file_path, doc_type, user_id)
+            return {"mode": "full", "document_id": document_id}
+        
+        if not self.document_processor:
+            self.document_processor = DocumentProcessor.get_instance()
+            await self.document_processor.initialize()
+        if not self.embedding_manager:
+            self.embedding_manager = await get_embedding_service()
+        
+        try:
+            doc_info = await self.document_repository.get_by_id(document_id)
+            document_category = doc_info.category.value if doc_info and doc_info.category else None
+            document_tags = doc_info.tags if doc_info else None
+            team_id = doc_info.team_id if doc_info and hasattr(doc_info, 'team_id') else None
+            collection_name = self.embedding_manager.get_collection_name(user_id, team_id)
+            
+            # Entities come from changed chunks only - skip NER over the whole file
+            result = await self.document_processor.process_document(
+                str(file_path), doc_type, document_id, extract_entities=False
+            )
+            
+            stored = await get_chunk_index(document_id)
+            stale_collections = {row["collection_name"] for row in stored.values()} - {collection_name}
+            if not stored or stale_collections:
+                # Legacy points (random IDs) or the document moved collections: rebuild once
+                logger.info(f"🔄 No usable chunk index for {document_id} - full rebuild")
+                for target_collection in stale_collections | {collection_name}:
+                    await self.embedding_manager.vector_store.delete_points_by_filter(
+                        document_id=document_id, collection_name=target_collection
+                    )
+                await clear_chunk_index(document_id)
+                stored = {}
+            
+            diff = diff_chunks(result.chunks, stored.keys())
+            logger.info(
+                f"🧮 Chunk diff for {document_id}: {len(diff.added)} added, "
+                f"{len(diff.removed_hashes)} removed, {len(diff.unchanged)} unchanged"
+            )
+            
+            if diff.added:
+                await self.embedding_manager.embed_and_store_chunks(
+                    diff.added,
+                    user_id=user_id,
+                    team_id=team_id,
+                    document_category=document_category,
+                    document_tags=document_tags
+                )
+            
+            if diff.removed_hashes:
+                point_ids = [stored[content_hash]["point_id"] for content_hash in diff.removed_hashes]
+                if await self.embedding_manager.delete_chunk_points(point_ids, user_id=user_id, team_id=team_id):
+                    await remove_chunk_hashes(document_id, diff.removed_hashes)
+            
+            if diff.added and self.kg_service:
+                entities = await self.document_processor._extract_entities(
+                    "\n\n".join(chunk.content for chunk in diff.added), diff.added
+                )
+                if entities:
+                    await self.kg_service.store_entities(entities, document_id)
+            
+            await self.document_repository.update_status(document_id, ProcessingStatus.COMPLETED)
+            await self._emit_document_status_update(document_id, ProcessingStatus.COMPLETED.value, user_id)
+            if result.quality_metrics:
+                await self.document_repository.update_quality_metrics(document_id, result.quality_metrics)
+            
+            return {
+                "mode": "incremental",
+                "document_id": document_id,
+                "chunks_added": len(diff.added),
+                "chunks_removed": len(diff.removed_hashes),
+                "chunks_unchanged": len(diff.unchanged)
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Incremental re-index failed for {document_id}: {e}")
+            await self.document_repository.update_status(document_id, ProcessingStatus.FAILED)
+            await self._emit_document_status_update(document_id, ProcessingStatus.FAILED.value, user_id)
+            raise
+    
     async def import_from_url(self, url: str, content_type: str = "html") -> DocumentUploadResponse:
         """Import content from URL"""
         document_id = str(uuid4())
@@ -13,6 +13,8 @@ from config import get_settings, settings
 from clients.vector_service_client import get_vector_service_client
 from services.vector_store_service import get_vector_store
 from models.api_models import Chunk
+from utils.chunk_hashing import chunk_content_hash, chunk_point_id
+from services.document_chunk_index import clear_chunk_index, record_stored_chunks
 from qdrant_client.models import PointStruct
 
 logger = logging.getLogger(__name__)
@@ -195,10 +197,48 @@ class EmbeddingServiceWrapper:
         if not self._initialized:
             await self.initialize()
         
-        return await self.vector_store.delete_points_by_filter(
+        success = await self.vector_store.delete_points_by_filter(
             document_id=document_id,
             user_id=user_id
         )
+        if success:
+            await clear_chunk_index(document_id)
+        return success
+    
+    async def delete_chunk_points(
+        self,
+        point_ids: List[str],
+        user_id: Optional[str] = None,
+        team_id: Optional[str] = None
+    ) -> bool:
+        """
+        Delete specific chunk embeddings by point ID
+        
+        Used by incremental re-indexing to drop only chunks that vanished from a document.
+        
+        Args:
+            point_ids: Deterministic point IDs (see utils.chunk_hashing.chunk_point_id)
+            user_id: Optional user ID for user-specific collection
+            team_id: Optional team ID for team collection (takes precedence)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        return await self.vector_store.delete_points_by_ids(
+            point_ids=point_ids,
+            collection_name=self.get_collection_name(user_id, team_id)
+        )
+    
+    def get_collection_name(self, user_id: Optional[str] = None, team_id: Optional[str] = None) -> str:
+        """Resolve the vector collection chunks for this owner are stored in"""
+        if team_id:
+            return self.vector_store._get_team_collection_name(team_id)
+        if user_id:
+            return self.vector_store._get_user_collection_name(user_id)
+        return settings.VECTOR_COLLECTION_NAME
     
     async def get_collection_stats(self, collection_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -247,14 +287,13 @@ class EmbeddingServiceWrapper:
             elif user_id:
                 await self.vector_store.ensure_user_collection_exists(user_id)
             
-            # Deduplicate chunks by content hash
+            # Deduplicate chunks by (deterministic) content hash within each document
             unique_chunks = []
             seen_hashes = set()
             for chunk in chunks:
-                normalized_content = ' '.join(chunk.content.split()).lower()
-                content_hash = hash(normalized_content)
-                if content_hash not in seen_hashes:
-                    seen_hashes.add(content_hash)
+                key = (chunk.document_id, chunk_content_hash(chunk.content))
+                if key not in seen_hashes:
+                    seen_hashes.add(key)
                     unique_chunks.append(chunk)
             
             logger.info(
@@ -265,8 +304,7 @@ class EmbeddingServiceWrapper:
             # Build mapping of unique chunks to embeddings
             chunk_to_embedding = {}
             for chunk, embedding in zip(chunks, embeddings):
-                content_hash = abs(hash(chunk.content))
-                chunk_to_embedding[content_hash] = embedding
+                chunk_to_embedding[(chunk.document_id, chunk_content_hash(chunk.content))] = embedding
             
             # Log metadata info
             metadata_info = ""
@@ -287,8 +325,8 @@ class EmbeddingServiceWrapper:
             # Prepare points for storage
             points = []
             for chunk in unique_chunks:
-                content_hash = abs(hash(chunk.content))
-                embedding = chunk_to_embedding.get(content_hash)
+                content_hash = chunk_content_hash(chunk.content)
+                embedding = chunk_to_embedding.get((chunk.document_id, content_hash))
                 
                 if not embedding:
                     logger.warning(f"No embedding found for chunk {chunk.chunk_id}, skipping")
@@ -320,19 +358,16 @@ class EmbeddingServiceWrapper:
                 if document_filename:
                     payload["document_filename"] = document_filename
                 
+                # Stable across workers: same document + content -> same point
                 point = PointStruct(
-                    id=content_hash,
+                    id=chunk_point_id(chunk.document_id, content_hash),
                     vector=embedding,
                     payload=payload
                 )
                 points.append(point)
             
             # Store via VectorStoreService
-            collection_name = None
-            if team_id:
-                collection_name = self.vector_store._get_team_collection_name(team_id)
-            elif user_id:
-                collection_name = self.vector_store._get_user_collection_name(user_id)
+            collection_name = self.get_collection_name(user_id, team_id)
             
             success = await self.vector_store.insert_points(
                 points=points,
@@ -340,6 +375,15 @@ class EmbeddingServiceWrapper:
             )
             
             if success:
+                # Remember what is stored so re-indexing can diff instead of re-embedding
+                stored_by_document: Dict[str, List] = {}
+                for point in points:
+                    stored_by_document.setdefault(point.payload["document_id"], []).append(
+                        (point.payload["content_hash"], point.id, point.payload["chunk_index"])
+                    )
+                for document_id, entries in stored_by_document.items():
+                    await record_stored_chunks(document_id, entries, collection_name)
+                
                 if team_id:
                     collection_type = "team"
                 elif user_id:
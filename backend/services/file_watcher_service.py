@@ -5,14 +5,16 @@ Monitors uploads directory for changes and syncs with database and vector store
 
 import logging
 import asyncio
+import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 from config import settings
+from utils.webdav_listing_version import bump_org_listing_version, is_org_filename
 
 logger = logging.getLogger(__name__)
 
@@ -430,6 +432,12 @@ class DocumentFileHandler(FileSystemEventHandler):
             traceback.print_exc()
             return None
     
+    def _notify_org_listing_change(self, *paths: str):
+        """Invalidate WebDAV org-mode listing snapshots when an .org file changed on disk"""
+        if any(is_org_filename(path) for path in paths if path):
+            # The path does not tell us the owner's user_id; bump the global version
+            asyncio.run_coroutine_threadsafe(bump_org_listing_version(), self.event_loop)
+    
     def on_modified(self, event: FileSystemEvent):
         """Handle file modification"""
         if event.is_directory or self._should_ignore_path(event.src_path, event.is_directory):
@@ -471,6 +479,7 @@ class DocumentFileHandler(FileSystemEventHandler):
             )
         else:
             logger.info(f"🗑️ File deleted: {event.src_path}")
+            self._notify_org_listing_change(event.src_path)
             # Schedule coroutine in main event loop from watchdog thread
             asyncio.run_coroutine_threadsafe(
                 self._handle_file_deleted(event.src_path),
@@ -492,6 +501,7 @@ class DocumentFileHandler(FileSystemEventHandler):
         else:
             # File move/rename
             logger.info(f"📦 File moved: {event.src_path} -> {event.dest_path}")
+            self._notify_org_listing_change(event.src_path, event.dest_path)
             asyncio.run_coroutine_threadsafe(
                 self._handle_file_moved(event.src_path, event.dest_path),
                 self.event_loop
@@ -1624,6 +1634,10 @@ class DocumentFileHandler(FileSystemEventHandler):
         
         logger.info(f"🔄 Processing {len(paths_to_process)} debounced file events")
         
+        # Created/modified .org content changes WebDAV size/mtime/ETag
+        if any(is_org_filename(path) for path in paths_to_process):
+            await bump_org_listing_version()
+        
         # **BULLY!** Process files in parallel with error isolation!
         # Each file gets its own async task so one failure doesn't block others
         async def process_with_error_handling(path):
@@ -1966,6 +1980,24 @@ class FileWatcherService:
             import traceback
             traceback.print_exc()
     
+    async def _delete_orphaned_document(self, document_id: str, user_id: Optional[str], filename: str) -> bool:
+        """Remove a document whose file is gone from disk (vectors, then database row)"""
+        logger.debug(f"🗑️ Deleting from database: {filename} ({document_id})")
+        
+        # Delete from vector store
+        try:
+            await self.document_service.embedding_manager.delete_document_chunks(document_id, user_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to delete embeddings for {document_id}: {e}")
+        
+        # Delete from database with proper user context
+        success = await self.document_service.document_repository.delete(document_id, user_id)
+        if success:
+            logger.debug(f"✅ Deleted orphaned document: {filename} ({document_id})")
+        else:
+            logger.warning(f"⚠️ Failed to delete document {document_id} from database")
+        return success
+    
     async def _cleanup_missing_files(self, uploads_dir):
         """
         Clean up document records for files that no longer exist on disk.
@@ -2034,21 +2066,9 @@ class FileWatcherService:
                         # Check if file exists on disk
                         if not file_path.exists():
                             logger.debug(f"🗑️ File missing on disk: {file_path}")
-                            logger.debug(f"🗑️ Deleting from database: {filename} ({document_id})")
-                            
-                            # Delete from vector store
-                            try:
-                                await self.document_service.embedding_manager.delete_document_chunks(document_id, user_id)
-                            except Exception as e:
-                                logger.warning(f"⚠️ Failed to delete embeddings for {document_id}: {e}")
-                            
-                            # Delete from database with proper user context
-                            success = await self.document_service.document_repository.delete(document_id, user_id)
-                            if success:
+                            if await self._delete_orphaned_document(document_id, user_id, filename):
                                 cleaned_count += 1
-                                logger.debug(f"✅ Deleted orphaned document: {filename} ({document_id})")
                             else:
-                                logger.warning(f"⚠️ Failed to delete document {document_id} from database")
                                 error_count += 1
                         else:
                             logger.debug(f"✅ File exists: {file_path}")
@@ -2078,83 +2098,329 @@ class FileWatcherService:
             import traceback
             traceback.print_exc()
     
-    async def _perform_startup_scan(self):
+    @staticmethod
+    def _walk_uploads_tree(uploads_dir: str) -> Dict[str, Tuple[int, float]]:
+        """
+        Stat every file under uploads_dir with an os.scandir walk.
+        
+        Runs in a worker thread (blocking I/O). Returns uploads-relative
+        '/'-separated path -> (size, mtime).
+        
+        Directory symlinks are followed, like the Path.exists() check in
+        _cleanup_missing_files; visited (device, inode) pairs guard against loops.
+        """
+        files = {}
+        try:
+            root_stat = os.stat(uploads_dir)
+            visited = {(root_stat.st_dev, root_stat.st_ino)}
+        except OSError:
+            visited = set()
+        stack = [(uploads_dir, "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = rel_dir + entry.name
+                        try:
+                            if entry.is_dir():
+                                stat = entry.stat()
+                                key = (stat.st_dev, stat.st_ino)
+                                if key in visited:
+                                    logger.debug(f"Skipping already-visited directory {entry.path}")
+                                    continue
+                                visited.add(key)
+                                stack.append((entry.path, rel_path + "/"))
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                files[rel_path] = (stat.st_size, stat.st_mtime)
+                        except OSError:
+                            # Vanished or unreadable mid-walk
+                            continue
+            except OSError as e:
+                logger.warning(f"⚠️ Could not scan directory {dir_path}: {e}")
+        return files
+    
+    async def _load_document_paths(self) -> List[Dict[str, Any]]:
+        """
+        Every document row with what is needed to rebuild its on-disk path,
+        in one query (folder paths come from a recursive CTE).
+        """
+        from services.database_manager.database_helpers import fetch_all
+        
+        # Same visibility as _cleanup_missing_files: user and global documents
+        rls_context = {'user_id': '', 'user_role': 'admin'}
+        return await fetch_all("""
+            WITH RECURSIVE folder_paths AS (
+                SELECT folder_id, name::text AS path
+                FROM document_folders
+                WHERE parent_folder_id IS NULL
+                UNION ALL
+                SELECT f.folder_id, fp.path || '/' || f.name
+                FROM document_folders f
+                JOIN folder_paths fp ON f.parent_folder_id = fp.folder_id
+            )
+            SELECT d.document_id, d.filename, d.user_id, d.collection_type,
+                   d.team_id::text AS team_id, d.file_size, d.updated_at,
+                   fp.path AS folder_path,
+                   f.user_id AS folder_user_id,
+                   f.team_id::text AS folder_team_id,
+                   f.collection_type AS folder_collection_type,
+                   du.username, fu.username AS folder_username
+            FROM document_metadata d
+            LEFT JOIN folder_paths fp ON fp.folder_id = d.folder_id
+            LEFT JOIN document_folders f ON f.folder_id = d.folder_id
+            LEFT JOIN users du ON du.user_id = d.user_id
+            LEFT JOIN users fu ON fu.user_id = f.user_id
+        """, rls_context=rls_context)
+    
+    @staticmethod
+    def _document_relative_path(row: Dict[str, Any]) -> Optional[str]:
+        """Uploads-relative path of a document row (mirrors FolderService.get_document_file_path)"""
+        filename = row.get('filename')
+        if not filename:
+            return None
+        
+        if row.get('folder_path'):
+            # Base directory comes from the folder, as in get_folder_physical_path
+            team_id = row.get('folder_team_id')
+            collection_type = row.get('folder_collection_type') or 'user'
+            user_id = row.get('folder_user_id')
+            username = row.get('folder_username')
+            folder_path = row['folder_path']
+        else:
+            # No folder (or folder gone): file sits at the collection root
+            team_id = row.get('team_id')
+            collection_type = row.get('collection_type') or 'user'
+            user_id = row.get('user_id')
+            username = row.get('username')
+            folder_path = None
+        
+        if team_id:
+            base = f"Teams/{team_id}/documents"
+        elif collection_type == 'global':
+            base = "Global"
+        else:
+            base = f"Users/{(username or user_id) if user_id else 'unknown'}"
+        
+        return f"{base}/{folder_path}/{filename}" if folder_path else f"{base}/{filename}"
+    
+    async def _reconcile_startup_files(self, uploads_dir: Path) -> Dict[str, Any]:
+        """
+        Bring document records in line with the uploads tree using one disk
+        walk (in a thread) and one bulk query, diffed in memory.
+        
+        Only new, changed and missing files cost any further work:
+        - new: on disk, no record -> _handle_new_file
+        - changed: size differs from file_size, or mtime is newer than
+          updated_at -> _handle_file_modified, then file_size is refreshed
+        - missing: record, no file -> deleted (returned for the caller to
+          remove after the folder passes, like _cleanup_missing_files)
+        .metadata.json sidecars are matched through their JSON, so they keep
+        the per-file lookup.
+        """
+        started = time.monotonic()
+        uploads_root = str(uploads_dir)
+        disk_files = await asyncio.to_thread(self._walk_uploads_tree, uploads_root)
+        walked = time.monotonic()
+        
+        rows = await self._load_document_paths()
+        loaded = time.monotonic()
+        
+        known = {}
+        missing = []
+        for row in rows:
+            rel_path = self._document_relative_path(row)
+            if rel_path is None:
+                logger.warning(f"⚠️ Document {row.get('document_id')} has no filename - skipping")
+                continue
+            known[rel_path] = row
+            if rel_path not in disk_files:
+                missing.append(row)
+        
+        tolerance = settings.FILE_WATCHER_MTIME_TOLERANCE_SECONDS
+        new_files = []
+        changed_files = []
+        sidecars = []
+        tracked_count = 0
+        for rel_path, (size, mtime) in disk_files.items():
+            name = rel_path.rsplit("/", 1)[-1]
+            if name.startswith('.') or name.startswith('~'):
+                continue
+            file_path = os.path.join(uploads_root, rel_path)
+            if self.event_handler._should_ignore_path(file_path, is_directory=False):
+                continue
+            if name.lower().endswith('.metadata.json'):
+                sidecars.append(file_path)
+                continue
+            
+            row = known.get(rel_path)
+            if row is None:
+                new_files.append(file_path)
+                continue
+            
+            updated_at = row.get('updated_at')
+            # file_size 0 is the column default, i.e. unknown
+            size_changed = bool(row.get('file_size')) and row['file_size'] != size
+            if size_changed or (updated_at and mtime > updated_at.timestamp() + tolerance):
+                changed_files.append((file_path, row, size))
+            else:
+                tracked_count += 1
+        
+        logger.info(
+            f"🔍 Reconciled {len(disk_files)} files against {len(rows)} records "
+            f"(walk {walked - started:.2f}s, query {loaded - walked:.2f}s, diff {time.monotonic() - loaded:.2f}s): "
+            f"{len(new_files)} new, {len(changed_files)} changed, {len(missing)} missing, {len(sidecars)} sidecars"
+        )
+        
+        semaphore = asyncio.Semaphore(max(1, settings.FILE_WATCHER_RECONCILE_CONCURRENCY))
+        error_count = 0
+        
+        async def process(file_path, handler):
+            nonlocal error_count
+            async with semaphore:
+                try:
+                    await handler()
+                except Exception as e:
+                    logger.error(f"❌ Error reconciling {file_path}: {e}")
+                    error_count += 1
+        
+        async def handle_changed(file_path, row, size):
+            await self.event_handler._handle_file_modified(file_path)
+            # Record the size we reconciled against so the file is not picked up again
+            await self.document_service.document_repository.update_file_size(
+                row['document_id'], size, row.get('user_id')
+            )
+        
+        async def handle_sidecar(file_path):
+            doc_info = await self.event_handler._get_document_by_path(file_path)
+            if not doc_info:
+                await self.event_handler._handle_new_file(file_path)
+        
+        tasks = [process(path, lambda path=path: self.event_handler._handle_new_file(path)) for path in new_files]
+        tasks += [process(path, lambda path=path, row=row, size=size: handle_changed(path, row, size))
+                  for path, row, size in changed_files]
+        tasks += [process(path, lambda path=path: handle_sidecar(path)) for path in sidecars]
+        await asyncio.gather(*tasks)
+        
+        # Rewritten .org content changes WebDAV size/mtime/ETag
+        if any(is_org_filename(path) for path, _, _ in changed_files):
+            await bump_org_listing_version()
+        
+        return {
+            "scanned_count": len(disk_files),
+            "new_count": len(new_files),
+            "changed_count": len(changed_files),
+            "skipped_count": tracked_count,
+            "error_count": error_count,
+            "missing": missing,
+        }
+    
+    async def _delete_missing_documents(self, uploads_dir: Path, missing: List[Dict[str, Any]]):
+        """Delete records whose files the reconcile pass found missing on disk"""
+        cleaned_count = 0
+        error_count = 0
+        for row in missing:
+            # Re-check before deleting: the file may have appeared since the walk,
+            # or be reachable by a path the walk did not take
+            rel_path = self._document_relative_path(row)
+            if rel_path and await asyncio.to_thread(os.path.exists, os.path.join(str(uploads_dir), rel_path)):
+                logger.debug(f"Document {row['document_id']} is present on disk - keeping it")
+                continue
+            try:
+                if await self._delete_orphaned_document(row['document_id'], row.get('user_id'), row['filename']):
+                    cleaned_count += 1
+                else:
+                    error_count += 1
+            except Exception as e:
+                logger.error(f"❌ Error deleting orphaned document {row.get('document_id')}: {e}")
+                error_count += 1
+        logger.info(f"🧹 Removed {cleaned_count} orphaned documents ({error_count} errors)")
+    
+    async def _legacy_startup_files(self, uploads_dir: Path) -> Dict[str, Any]:
+        """Per-file startup scan: rglob the tree and look each file up in the database"""
+        scanned_count = 0
+        new_count = 0
+        skipped_count = 0  # Already tracked files (duplicates prevented)
+        error_count = 0
+        
+        # Walk the entire uploads directory tree
+        for file_path in uploads_dir.rglob('*'):
+            if not file_path.is_file():
+                continue
+            
+            # Use the same ignore logic as the file handler
+            file_path_str = str(file_path)
+            if self.event_handler._should_ignore_path(file_path_str, is_directory=False):
+                continue
+            
+            # Skip temp/hidden files
+            if file_path.name.startswith('.') or file_path.name.startswith('~'):
+                continue
+            
+            scanned_count += 1
+            
+            try:
+                # Check if this file already has a database record
+                # This prevents duplicates by comparing filename + user + folder context
+                doc_info = await self.event_handler._get_document_by_path(str(file_path))
+                
+                if not doc_info:
+                    # File exists on disk but NOT in database!
+                    logger.debug(f"📄 NEW FILE FOUND: {file_path.relative_to(uploads_dir)}")
+                    await self.event_handler._handle_new_file(str(file_path))
+                    new_count += 1
+                else:
+                    # File already tracked - skip to prevent duplicate
+                    logger.debug(f"⏭️  SKIP (already in DB): {file_path.name} (doc_id: {doc_info.get('document_id', 'unknown')})")
+                    skipped_count += 1
+            
+            except Exception as e:
+                logger.error(f"❌ Error scanning {file_path}: {e}")
+                import traceback
+                traceback.print_exc()
+                error_count += 1
+        
+        return {
+            "scanned_count": scanned_count,
+            "new_count": new_count,
+            "changed_count": 0,
+            "skipped_count": skipped_count,
+            "error_count": error_count,
+        }
+    
+    async def _perform_startup_scan(self) -> Dict[str, Any]:
         """
         Scan the uploads directory on startup and create database records
         for any files that were added while the app was down.
         
         This ensures the database always matches the filesystem.
+        FILE_WATCHER_STARTUP_MODE selects the bulk reconcile pass (default)
+        or the legacy per-file scan.
         """
+        stats = {"scanned_count": 0, "new_count": 0}
         try:
-            from pathlib import Path
-            from config import settings
-            
             uploads_dir = Path(settings.UPLOAD_DIR)
             
             if not uploads_dir.exists():
                 logger.info("📁 No uploads directory found - nothing to scan")
-                return
+                return stats
             
-            logger.info(f"🔍 Scanning uploads directory: {uploads_dir}")
-            
-            # Supported file extensions
-            valid_extensions = [
-                '.md', '.org', '.txt', '.pdf', '.docx', '.html', '.htm', '.epub', '.eml',  # Documents
-                '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'  # Images
-            ]
-            
-            scanned_count = 0
-            new_count = 0
-            skipped_count = 0  # Already tracked files (duplicates prevented)
-            error_count = 0
+            reconcile = settings.FILE_WATCHER_STARTUP_MODE != "legacy"
+            logger.info(f"🔍 Scanning uploads directory: {uploads_dir} ({'reconcile' if reconcile else 'legacy'} mode)")
+            started = time.monotonic()
             
-            # Walk the entire uploads directory tree
-            for file_path in uploads_dir.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                
-                # Use the same ignore logic as the file handler
-                file_path_str = str(file_path)
-                if self.event_handler._should_ignore_path(file_path_str, is_directory=False):
-                    continue
-                
-                # Skip temp/hidden files
-                if file_path.name.startswith('.') or file_path.name.startswith('~'):
-                    continue
-                
-                scanned_count += 1
-                
-                try:
-                    # Check if this file already has a database record
-                    # This prevents duplicates by comparing filename + user + folder context
-                    doc_info = await self.event_handler._get_document_by_path(str(file_path))
-                    
-                    if not doc_info:
-                        # File exists on disk but NOT in database!
-                        logger.debug(f"📄 NEW FILE FOUND: {file_path.relative_to(uploads_dir)}")
-                        await self.event_handler._handle_new_file(str(file_path))
-                        new_count += 1
-                    else:
-                        # File already tracked - skip to prevent duplicate
-                        logger.debug(f"⏭️  SKIP (already in DB): {file_path.name} (doc_id: {doc_info.get('document_id', 'unknown')})")
-                        skipped_count += 1
-                
-                except Exception as e:
-                    logger.error(f"❌ Error scanning {file_path}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    error_count += 1
-            
-            logger.info(f"🎯 Startup scan complete")
-            logger.info(f"   📊 Files scanned: {scanned_count}")
-            logger.info(f"   ✅ New files added: {new_count}")
-            logger.info(f"   ⏭️  Already tracked (duplicates prevented): {skipped_count}")
-            logger.info(f"   ❌ Errors: {error_count}")
+            if reconcile:
+                stats = await self._reconcile_startup_files(uploads_dir)
+            else:
+                stats = await self._legacy_startup_files(uploads_dir)
             
-            if new_count > 0:
-                logger.info(f"   ✅ {new_count} files recovered and added to the database")
-            if skipped_count > 0:
-                logger.info(f"   ⏭️  {skipped_count} duplicates prevented")
+            logger.info(f"🎯 Startup scan complete in {time.monotonic() - started:.2f}s")
+            logger.info(f"   📊 Files scanned: {stats['scanned_count']}")
+            logger.info(f"   ✅ New files added: {stats['new_count']}")
+            logger.info(f"   ♻️ Changed files re-processed: {stats['changed_count']}")
+            logger.info(f"   ⏭️  Already tracked (duplicates prevented): {stats['skipped_count']}")
+            logger.info(f"   ❌ Errors: {stats['error_count']}")
             
             # Scan for folders on disk that aren't in database
             await self._scan_and_import_folders(uploads_dir)
@@ -2163,14 +2429,17 @@ class FileWatcherService:
             await self._cleanup_missing_folders(uploads_dir)
             
             # Clean up files that no longer exist on disk
-            await self._cleanup_missing_files(uploads_dir)
+            if reconcile:
+                await self._delete_missing_documents(uploads_dir, stats.pop("missing"))
+            else:
+                await self._cleanup_missing_files(uploads_dir)
             
         except Exception as e:
             logger.error(f"❌ Startup scan failed: {e}")
             import traceback
             traceback.print_exc()
             # Don't fail startup if scan fails
-            pass
+        return stats
 
     async def run_rescan(self) -> Dict[str, Any]:
         """Re-scan uploads directory and add any files on disk that are not in the database.
@@ -2178,8 +2447,8 @@ class FileWatcherService:
         if not getattr(self, "event_handler", None):
             return {"success": False, "error": "File watcher not started", "new_count": 0, "scanned_count": 0}
         try:
-            await self._perform_startup_scan()
-            return {"success": True, "new_count": 0, "scanned_count": 0}
+            stats = await self._perform_startup_scan()
+            return {"success": True, "new_count": stats.get("new_count", 0), "scanned_count": stats.get("scanned_count", 0)}
         except Exception as e:
             logger.error(f"Rescan failed: {e}")
             return {"success": False, "error": str(e), "new_count": 0, "scanned_count": 0}
@@ -426,60 +426,17 @@ class FolderService:
     async def get_folder_tree(self, user_id: str = None, collection_type: str = "user") -> List[DocumentFolder]:
         """Get the complete folder tree for a user - always fresh from database"""
         try:
-            logger.info(f"📁 Building fresh folder tree for user_id: {user_id}, collection_type: {collection_type}")
+            logger.debug(f"📁 Building fresh folder tree for user_id: {user_id}, collection_type: {collection_type}")
             
             # Database is the source of truth - no caching needed
             
-            # Get user folders
-            user_folders_data = await self.document_repository.get_folders_by_user(user_id, "user")
-            logger.info(f"📁 Found {len(user_folders_data)} user folders for user {user_id}")
-            for folder in user_folders_data:
-                logger.info(f"📁 User folder: {folder.get('name')} (ID: {folder.get('folder_id')}, parent: {folder.get('parent_folder_id')})")
+            # User, global (read-only for everyone) and team folders with their
+            # document/subfolder counts, all in one query under the user's RLS context
+            all_folders_data = await self.document_repository.get_folder_tree_rows(user_id)
+            logger.debug(f"📁 Found {len(all_folders_data)} folders for user {user_id}")
             
-            # Get global folders (always include for all users - read-only access)
-            global_folders_data = []
             is_admin = await self._is_admin(user_id) if user_id else False
             
-            # Always fetch global folders for all users (read-only access)
-            global_folders_data = await self.document_repository.get_folders_by_user(None, "global")
-            logger.debug(f"📁 Found {len(global_folders_data)} global folders")
-            
-            # Get team folders for user's teams
-            team_folders_data = []
-            if user_id:
-                try:
-                    from services.team_service import TeamService
-                    team_service = TeamService()
-                    await team_service.initialize()
-                    user_teams = await team_service.list_user_teams(user_id)
-                    team_ids = [team['team_id'] for team in user_teams]
-                    if team_ids:
-                        team_folders_data = await self.document_repository.get_folders_by_teams(team_ids, user_id=user_id)
-                        logger.info(f"📁 Found {len(team_folders_data)} team folders for user {user_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to get team folders for user {user_id}: {e}")
-            
-            # Combine all folders
-            all_folders_data = user_folders_data + global_folders_data + team_folders_data
-            
-            # Add counts for each folder with RLS context
-            for folder_data in all_folders_data:
-                # Determine RLS context based on folder's collection type
-                # For global folders, use user context so RLS allows read access (RLS policy allows global docs for all users)
-                if folder_data.get('collection_type') == 'global':
-                    count_user_id = user_id  # Use user_id so RLS allows access to global docs
-                    count_role = 'user'  # Use 'user' role - RLS policy allows global docs for all users
-                else:
-                    count_user_id = user_id
-                    count_role = 'user'
-                
-                folder_data["document_count"] = await self.document_repository.get_document_count_in_folder(
-                    folder_data["folder_id"], count_user_id, count_role
-                )
-                folder_data["subfolder_count"] = await self.document_repository.get_subfolder_count(
-                    folder_data["folder_id"], count_user_id, count_role
-                )
-            
             folders = [DocumentFolder(**folder_data) for folder_data in all_folders_data]
             
             # Build hierarchical structure
@@ -501,9 +458,9 @@ class FolderService:
             
             # Create "My Documents" root node with virtual sources for all users
             user_root_folders = [f for f in root_folders if f.collection_type == "user"]
-            logger.info(f"🔍 Found {len(user_root_folders)} user root folders for user {user_id}")
+            logger.debug(f"🔍 Found {len(user_root_folders)} user root folders for user {user_id}")
             for folder in user_root_folders:
-                logger.info(f"🔍 User root folder: {folder.name} (ID: {folder.folder_id})")
+                logger.debug(f"🔍 User root folder: {folder.name} (ID: {folder.folder_id})")
             
             # Create virtual sources based on collection type
             virtual_sources = []
@@ -541,13 +498,13 @@ class FolderService:
                 children=all_my_documents_children
             )
             virtual_roots.append(my_documents_root)
-            logger.info(f"✅ Created My Documents virtual root with {len(all_my_documents_children)} children (including virtual sources)")
+            logger.debug(f"✅ Created My Documents virtual root with {len(all_my_documents_children)} children (including virtual sources)")
             
             # Create "Global Documents" root node with virtual sources (for all users - read-only access)
             global_root_folders = [f for f in root_folders if f.collection_type == "global"]
-            logger.info(f"🔍 Found {len(global_root_folders)} global root folders")
+            logger.debug(f"🔍 Found {len(global_root_folders)} global root folders")
             
-            logger.info(f"🔍 User {user_id} admin status: {is_admin}")
+            logger.debug(f"🔍 User {user_id} admin status: {is_admin}")
             
             # Always create Global Documents root for all users (read-only access)
             # Only admins get virtual sources like RSS Feeds for global collection
@@ -586,15 +543,15 @@ class FolderService:
                 children=all_global_children
             )
             virtual_roots.append(global_documents_root)
-            logger.info(f"✅ Created Global Documents virtual root with {len(all_global_children)} children (read-only access for all users)")
+            logger.debug(f"✅ Created Global Documents virtual root with {len(all_global_children)} children (read-only access for all users)")
             
             # Add team folders as virtual roots
             team_root_folders = [f for f in root_folders if f.collection_type == "team"]
-            logger.info(f"🔍 Found {len(team_root_folders)} team root folders for user {user_id}")
+            logger.debug(f"🔍 Found {len(team_root_folders)} team root folders for user {user_id}")
             
             for team_folder in team_root_folders:
                 virtual_roots.append(team_folder)
-                logger.info(f"✅ Added team folder: {team_folder.name} (ID: {team_folder.folder_id})")
+                logger.debug(f"✅ Added team folder: {team_folder.name} (ID: {team_folder.folder_id})")
             
             # If no virtual roots were created, return the original root folders
             if not virtual_roots:
@@ -602,7 +559,7 @@ class FolderService:
             else:
                 result = virtual_roots
             
-            logger.info(f"📁 Built fresh folder tree with {len(result)} root folders")
+            logger.debug(f"📁 Built fresh folder tree with {len(result)} root folders")
             return result
             
         except Exception as e:
@@ -6,14 +6,17 @@ Handles background RSS feed polling and article processing
 import logging
 import asyncio
 import hashlib
+import os
 import re
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-import aiohttp
 import feedparser
 
 from services.langgraph_agents.base_agent import BaseAgent
 from tools_service.models.rss_models import RSSFeed, RSSArticle, RSSFeedPollResult
+from tools_service.services.rss_poll_scheduler import (
+    OUTCOME_NEW_ITEMS, OUTCOME_UNCHANGED, OUTCOME_NOT_MODIFIED, OUTCOME_ERROR
+)
 from models.agent_response_models import RSSManagementResult
 
 logger = logging.getLogger(__name__)
@@ -33,6 +36,9 @@ class RSSBackgroundAgent(BaseAgent):
         # **ROOSEVELT FIX**: Cache service container to avoid repeated async calls
         self._service_container = None
         self._current_user_id = None
+        # Bounded fan-out for full-content extraction / News upserts across all feeds in a poll
+        self._content_worker_limit = int(os.getenv("RSS_FULL_CONTENT_WORKERS", "4"))
+        self._content_semaphore = asyncio.Semaphore(self._content_worker_limit)
     
     def _build_system_prompt(self) -> str:
         """
@@ -258,6 +264,7 @@ This agent performs direct RSS parsing without LLM inference.
         """Poll a single RSS feed for new articles with concurrency control"""
         # **ROOSEVELT FIX**: Get cached RSS service once at the start
         rss_service = await self._get_rss_service()
+        polling_marked = False
         
         try:
             logger.debug(f"📡 RSS AGENT: Polling feed {feed.feed_id}")
@@ -271,6 +278,18 @@ This agent performs direct RSS parsing without LLM inference.
                     error_message="Invalid feed URL"
                 )
             
+            # Check if feed needs polling (unless forced) before claiming it, so a skipped
+            # poll never holds the polling flag; release the scheduler's dispatch lease so
+            # the feed is re-dispatched when it actually falls due
+            if not force_poll and not self._feed_needs_polling(feed):
+                await rss_service.release_poll_lease(feed.feed_id)
+                return RSSFeedPollResult(
+                    feed_id=feed.feed_id,
+                    status="no_new_articles",
+                    articles_found=0,
+                    articles_added=0
+                )
+            
             # Try to mark feed as polling
             polling_marked = await rss_service.mark_feed_polling(feed.feed_id, is_polling=True)
             if not polling_marked:
@@ -282,98 +301,79 @@ This agent performs direct RSS parsing without LLM inference.
                     articles_added=0
                 )
             
-            # Check if feed needs polling (unless forced)
-            if not force_poll and not self._feed_needs_polling(feed):
+            # Conditional GET through the shared, connection-pooled client
+            from services.rss_http_client import get_rss_http_client
+            fetch_result = await get_rss_http_client().fetch_feed(
+                feed.feed_url,
+                etag=feed.etag,
+                last_modified=feed.last_modified
+            )
+            
+            if fetch_result.not_modified:
+                logger.debug(f"📡 RSS AGENT: Feed {feed.feed_id} not modified (304), skipping download and parse")
+                await rss_service.record_poll_outcome(
+                    feed, OUTCOME_NOT_MODIFIED,
+                    etag=fetch_result.etag, last_modified=fetch_result.last_modified
+                )
                 return RSSFeedPollResult(
                     feed_id=feed.feed_id,
-                    status="no_new_articles",
+                    status="not_modified",
                     articles_found=0,
                     articles_added=0
                 )
             
-            # Parse RSS feed (set headers to avoid 403 from some hosts)
-            headers = {
-                "User-Agent": "Mozilla/5.0 (compatible; PlatoRSS/1.0; +https://example.local)",
-                "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
-            }
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(feed.feed_url, timeout=30) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}: {response.reason}")
-                    
-                    content = await response.text()
-            
-            # Parse RSS content
-            parsed_feed = feedparser.parse(content)
+            # feedparser and entry normalization are pure CPU work - keep them off the event loop
+            loop = asyncio.get_running_loop()
+            parsed_feed, candidates = await loop.run_in_executor(
+                None, self._parse_feed_content, fetch_result.content, feed, user_id
+            )
             
-            if parsed_feed.bozo:
+            if parsed_feed.bozo and not parsed_feed.entries:
                 raise Exception(f"Invalid RSS feed: {parsed_feed.bozo_exception}")
             
-            # Process articles
             articles_found = len(parsed_feed.entries)
-            articles_added = 0
-            
             logger.info(f"📡 RSS AGENT: Found {articles_found} articles in feed {feed.feed_id}")
             
-            for entry in parsed_feed.entries:
-                try:
-                    # Create RSS article
-                    article = RSSArticle(
-                        article_id=self._generate_article_id(entry.link),
-                        feed_id=feed.feed_id,
-                        title=entry.title,
-                        description=getattr(entry, 'description', None) or getattr(entry, 'summary', None),
-                        link=entry.link,
-                        published_date=self._parse_published_date(entry),
-                        user_id=user_id
-                    )
-                    
-                    # Generate content hash for duplicate detection
-                    article.content_hash = article.generate_content_hash()
-                    
-                    # Check for duplicates
-                    is_duplicate = await self._is_duplicate_article(article)
-                    if is_duplicate:
-                        continue
-                    
-                    # Clean description HTML before storage
-                    if article.description:
-                        try:
-                            article.description = self._html_to_plain_text(self._clean_html_remove_media_and_boilerplate(article.description))
-                        except Exception:
-                            pass
-
-                    # Check if content is truncated and extract full content if needed
-                    if self._is_content_truncated(article.description):
-                        logger.debug(f"🕷️ RSS AGENT: Detected truncated content for {article.title}, extracting full content")
-                        full_content, full_content_html, images = await self._extract_full_content_with_crawl4ai(article.link)
-                        if full_content:
-                            # Clean both full text and HTML before saving
-                            article.full_content = self._html_to_plain_text(full_content)
-                            if full_content_html:
-                                article.full_content_html = self._clean_html_remove_media_and_boilerplate(full_content_html)
-                            if images:
-                                article.images = images
-                            logger.debug(f"✅ RSS AGENT: Successfully extracted full content for {article.title}")
-                    
-                    # Save article to database
-                    save_success = await self._save_article(article)
-                    if save_success:
-                        articles_added += 1
-                        # Also upsert a simple News headline so it surfaces in News API
-                        try:
-                            await self._upsert_news_from_rss(article, feed)
-                        except Exception as news_e:
-                            logger.warning(f"⚠️ RSS AGENT: Failed to upsert news from RSS article {article.article_id}: {news_e}")
-                    else:
-                        logger.error(f"📡 RSS AGENT: Failed to save article: {article.title}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ RSS AGENT ERROR: Failed to process article {entry.link}: {e}")
-                    continue
+            # One bulk dedupe query per feed instead of one per entry
+            existing = await rss_service.get_existing_article_keys(
+                feed.feed_id,
+                [article.link for article in candidates],
+                [article.content_hash for article in candidates]
+            )
+            new_articles = [
+                article for article in candidates
+                if article.link not in existing["links"] and article.content_hash not in existing["content_hashes"]
+            ]
             
-            # Update feed last_check timestamp (this also sets is_polling=false)
-            await self._update_feed_last_check(feed.feed_id)
+            if new_articles:
+                # Clean description HTML before storage (BeautifulSoup - off-loop as well)
+                await loop.run_in_executor(None, self._clean_article_descriptions, new_articles)
+                
+                # Fan truncated articles out to the bounded full-content worker pool
+                truncated = [article for article in new_articles if self._is_content_truncated(article.description)]
+                await self._run_bounded_workers(truncated, self._fill_full_content)
+            
+            # Save all new articles in one batched insert; a failed insert raises into the
+            # OUTCOME_ERROR path below so the validators are not persisted and the next poll
+            # re-downloads the feed instead of getting a 304 for articles we never stored
+            inserted_ids = set(await rss_service.save_articles_batch(new_articles))
+            articles_added = len(inserted_ids)
+            if len(new_articles) > articles_added:
+                logger.debug(f"📡 RSS AGENT: {len(new_articles) - articles_added} articles were inserted concurrently by another poll")
+            
+            # Also upsert a simple News headline so it surfaces in News API
+            saved_articles = [article for article in new_articles if article.article_id in inserted_ids]
+            await self._run_bounded_workers(saved_articles, lambda article: self._upsert_news_from_rss(article, feed))
+            
+            # Update last_check, validators and the adaptive next-poll time (this also sets is_polling=false)
+            await rss_service.record_poll_outcome(
+                feed,
+                OUTCOME_NEW_ITEMS if articles_added > 0 else OUTCOME_UNCHANGED,
+                new_items=articles_added,
+                etag=fetch_result.etag,
+                last_modified=fetch_result.last_modified,
+                content_length=len(fetch_result.content) if fetch_result.content else None
+            )
             
             return RSSFeedPollResult(
                 feed_id=feed.feed_id,
@@ -384,7 +384,12 @@ This agent performs direct RSS parsing without LLM inference.
         
         except Exception as e:
             logger.error(f"❌ RSS AGENT ERROR: Failed to poll feed {feed.feed_id}: {e}")
-            # **ROOSEVELT FIX**: Don't cleanup here - let finally block handle it to avoid double cleanup
+            # Back off the next poll without touching the stored validators; polling flag
+            # cleanup is left to the finally block
+            try:
+                await rss_service.record_poll_outcome(feed, OUTCOME_ERROR)
+            except Exception as schedule_error:
+                logger.error(f"❌ RSS AGENT ERROR: Failed to reschedule feed {feed.feed_id}: {schedule_error}")
             return RSSFeedPollResult(
                 feed_id=feed.feed_id,
                 status="error",
@@ -392,12 +397,98 @@ This agent performs direct RSS parsing without LLM inference.
             )
         finally:
             # **ROOSEVELT FIX**: Cleanup polling status in finally block (runs on success AND error)
-            # This was previously done in both except and finally, causing redundant calls
-            try:
-                await rss_service.mark_feed_polling(feed.feed_id, is_polling=False)
-            except Exception as cleanup_error:
-                logger.error(f"❌ RSS AGENT ERROR: Failed to cleanup polling status for {feed.feed_id}: {cleanup_error}")
+            # This was previously done in both except and finally, causing redundant calls.
+            # Only release a flag this poll set - never another process's
+            if polling_marked:
+                try:
+                    await rss_service.mark_feed_polling(feed.feed_id, is_polling=False)
+                except Exception as cleanup_error:
+                    logger.error(f"❌ RSS AGENT ERROR: Failed to cleanup polling status for {feed.feed_id}: {cleanup_error}")
 
+    def _parse_feed_content(self, content: bytes, feed: RSSFeed, user_id: Optional[str]):
+        """Parse feed bytes and build candidate articles (runs in a worker thread)"""
+        parsed_feed = feedparser.parse(content)
+        
+        candidates: List[RSSArticle] = []
+        seen_links = set()
+        for entry in parsed_feed.entries:
+            try:
+                link = entry.link
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                
+                article = RSSArticle(
+                    article_id=self._generate_article_id(link),
+                    feed_id=feed.feed_id,
+                    title=entry.title,
+                    description=getattr(entry, 'description', None) or getattr(entry, 'summary', None),
+                    link=link,
+                    published_date=self._parse_published_date(entry),
+                    user_id=user_id
+                )
+                
+                # Generate content hash for duplicate detection
+                article.content_hash = article.generate_content_hash()
+                candidates.append(article)
+            except Exception as e:
+                logger.error(f"❌ RSS AGENT ERROR: Failed to process article {getattr(entry, 'link', '?')}: {e}")
+                continue
+        
+        return parsed_feed, candidates
+    
+    def _clean_article_descriptions(self, articles: List[RSSArticle]) -> None:
+        """Strip media/boilerplate from descriptions in place (runs in a worker thread)"""
+        for article in articles:
+            if article.description:
+                try:
+                    article.description = self._html_to_plain_text(self._clean_html_remove_media_and_boilerplate(article.description))
+                except Exception:
+                    pass
+    
+    async def _fill_full_content(self, article: RSSArticle) -> None:
+        """Extract full content for a truncated article and attach it"""
+        logger.debug(f"🕷️ RSS AGENT: Detected truncated content for {article.title}, extracting full content")
+        full_content, full_content_html, images = await self._extract_full_content_with_crawl4ai(article.link)
+        if full_content:
+            # Clean both full text and HTML before saving
+            article.full_content = self._html_to_plain_text(full_content)
+            if full_content_html:
+                article.full_content_html = self._clean_html_remove_media_and_boilerplate(full_content_html)
+            if images:
+                article.images = images
+            logger.debug(f"✅ RSS AGENT: Successfully extracted full content for {article.title}")
+    
+    async def _run_bounded_workers(self, items: List[Any], handler) -> None:
+        """
+        Drain items through a small pool of queue workers
+        
+        Worker count is capped per call and the shared semaphore caps crawls
+        across all feeds polled concurrently, so one busy feed can't start
+        hundreds of Crawl4AI requests at once.
+        """
+        if not items:
+            return
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        
+        async def worker():
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    async with self._content_semaphore:
+                        await handler(item)
+                except Exception as e:
+                    logger.error(f"❌ RSS AGENT ERROR: Content worker failed: {e}")
+        
+        worker_count = min(len(items), self._content_worker_limit)
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+    
     async def _upsert_news_from_rss(self, article: "RSSArticle", feed: "RSSFeed") -> None:
         """Create a minimal News article from an RSS article and upsert into NewsService."""
         try:
@@ -489,7 +580,11 @@ This agent performs direct RSS parsing without LLM inference.
             logger.warning(f"⚠️ Failed to upsert News from RSS: {e}")
     
     def _feed_needs_polling(self, feed: RSSFeed) -> bool:
-        """Check if a feed needs polling based on its check interval"""
+        """Check if a feed needs polling based on its adaptive due time (or check interval)"""
+        if feed.next_poll_at:
+            # Tolerate small clock skew between the scheduler's ETA and this worker
+            return datetime.utcnow() + timedelta(seconds=60) >= feed.next_poll_at
+        
         if not feed.last_check:
             return True
         
@@ -531,16 +626,6 @@ This agent performs direct RSS parsing without LLM inference.
             logger.error(f"❌ RSS AGENT ERROR: Failed to save article: {e}")
             return False
     
-    async def _update_feed_last_check(self, feed_id: str) -> bool:
-        """Update feed last_check timestamp"""
-        try:
-            # **ROOSEVELT FIX**: Use cached service instead of repeated lookups
-            rss_service = await self._get_rss_service()
-            return await rss_service.update_feed_last_check(feed_id)
-        except Exception as e:
-            logger.error(f"❌ RSS AGENT ERROR: Failed to update feed last_check: {e}")
-            return False
-    
     def _is_content_truncated(self, description: Optional[str]) -> bool:
         """Detect if RSS content is truncated and needs full extraction"""
         if not description:
@@ -5,10 +5,11 @@ Handles at-rest message encryption with master key management
 BULLY! Keep your messages secure like a well-guarded cavalry fort!
 """
 
+import asyncio
 import logging
 import base64
 import secrets
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -28,6 +29,7 @@ class EncryptionService:
     - Master key from environment
     - Key derivation for room-specific keys
     - Version support for key rotation
+    - Bulk page decryption off the event loop
     """
     
     def __init__(self):
@@ -127,9 +129,38 @@ class EncryptionService:
             # Return as-is if encryption disabled
             return encrypted_text
         
+        return self._decrypt(self._fernet, encrypted_text)
+    
+    async def decrypt_messages(self, encrypted_texts: List[str]) -> List[Optional[str]]:
+        """
+        Decrypt a page of messages, off the event loop for larger pages
+        
+        Args:
+            encrypted_texts: Base64-encoded encrypted messages
+        
+        Returns:
+            Plaintexts in input order (None where decryption fails)
+        """
+        self._initialize()
+        
+        if not settings.MESSAGE_ENCRYPTION_AT_REST:
+            return list(encrypted_texts)
+        
+        fernet = self._fernet
+        
+        def decrypt_all() -> List[Optional[str]]:
+            return [self._decrypt(fernet, text) for text in encrypted_texts]
+        
+        # A thread hop costs more than decrypting a handful of short messages
+        if len(encrypted_texts) < settings.MESSAGE_BULK_DECRYPT_THREAD_MIN:
+            return decrypt_all()
+        return await asyncio.to_thread(decrypt_all)
+    
+    @staticmethod
+    def _decrypt(fernet: Fernet, encrypted_text: str) -> Optional[str]:
         try:
             encrypted_bytes = base64.b64decode(encrypted_text.encode('utf-8'))
-            decrypted_bytes = self._fernet.decrypt(encrypted_bytes)
+            decrypted_bytes = fernet.decrypt(encrypted_bytes)
             return decrypted_bytes.decode('utf-8')
         except (InvalidToken, ValueError) as e:
             logger.error(f"❌ Failed to decrypt message: {e}")
@@ -5,6 +5,7 @@ Core service for user-to-user messaging operations
 BULLY! A well-organized messaging system is like a well-organized cavalry charge!
 """
 
+import base64
 import logging
 import json
 import uuid
@@ -14,10 +15,30 @@ import asyncpg
 
 from config import settings
 from .encryption_service import encryption_service
+from .room_participant_cache import RoomParticipantCache
 from utils.shared_db_pool import get_shared_db_pool
 
 logger = logging.getLogger(__name__)
 
+# Characters of the last message shown under each room in the room list
+ROOM_LIST_PREVIEW_LENGTH = 120
+
+
+def encode_message_cursor(created_at: datetime, message_id: Any) -> str:
+    """Opaque keyset cursor for the message page ending at (created_at, message_id)"""
+    raw = f"{created_at.isoformat()}|{message_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_message_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_message_cursor; raises ValueError on a malformed cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        created_at, message_id = raw.split('|', 1)
+        return datetime.fromisoformat(created_at), str(uuid.UUID(message_id))
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid message cursor: {cursor!r}") from e
+
 
 class MessagingService:
     """
@@ -33,6 +54,10 @@ class MessagingService:
     
     def __init__(self):
         self.db_pool = None
+        self.participant_cache = RoomParticipantCache(
+            max_rooms=settings.ROOM_PARTICIPANT_CACHE_SIZE,
+            ttl_seconds=settings.ROOM_PARTICIPANT_CACHE_TTL_SECONDS
+        )
     
     async def initialize(self, shared_db_pool=None):
         """Initialize with database pool"""
@@ -186,72 +211,72 @@ class MessagingService:
                 # Set user context for RLS
                 await conn.execute("SELECT set_config('app.current_user_id', $1, false)", user_id)
                 
-                # Get rooms
+                # One indexed read: unread/message counters and the last-message
+                # summary are maintained by chat_messages triggers, and participants
+                # are aggregated per room instead of fetched room by room
                 rows = await conn.fetch("""
                     SELECT 
                         r.room_id, r.room_name, r.room_type, r.created_by,
-                        r.created_at, r.last_message_at,
-                        (SELECT COUNT(*) FROM chat_messages cm 
-                         WHERE cm.room_id = r.room_id 
-                         AND cm.deleted_at IS NULL) as message_count
-                    FROM chat_rooms r
-                    JOIN room_participants rp ON r.room_id = rp.room_id
+                        r.created_at, r.last_message_at, r.message_count,
+                        rp.unread_count, rp.notification_settings,
+                        lm.message_id AS last_message_id,
+                        lm.sender_id AS last_message_sender_id,
+                        lm.message_type AS last_message_type,
+                        lm.message_content AS last_message_content,
+                        lm.created_at AS last_message_created_at,
+                        CASE WHEN $3 THEN (
+                            SELECT json_agg(json_build_object(
+                                'user_id', u.user_id,
+                                'username', u.username,
+                                'display_name', u.display_name,
+                                'avatar_url', u.avatar_url
+                            ))
+                            FROM room_participants p
+                            JOIN users u ON p.user_id = u.user_id
+                            WHERE p.room_id = r.room_id
+                        ) END AS participants_json
+                    FROM room_participants rp
+                    JOIN chat_rooms r ON r.room_id = rp.room_id
+                    LEFT JOIN chat_messages lm ON lm.message_id = r.last_message_id
                     WHERE rp.user_id = $1
                     ORDER BY r.last_message_at DESC
                     LIMIT $2
-                """, user_id, limit)
+                """, user_id, limit, include_participants)
                 
                 rooms = []
                 for row in rows:
                     room_dict = dict(row)
+                    participants_json = room_dict.pop('participants_json')
+                    last_message_content = room_dict.pop('last_message_content')
+                    last_message = {
+                        "message_id": room_dict.pop('last_message_id'),
+                        "sender_id": room_dict.pop('last_message_sender_id'),
+                        "message_type": room_dict.pop('last_message_type'),
+                        "created_at": room_dict.pop('last_message_created_at'),
+                    }
+                    if last_message["message_id"] is not None:
+                        preview = encryption_service.decrypt_message(last_message_content) or ''
+                        last_message["preview"] = preview[:ROOM_LIST_PREVIEW_LENGTH]
+                        room_dict['last_message'] = last_message
+                    else:
+                        room_dict['last_message'] = None
                     
                     # Get participants if requested
                     if include_participants:
-                        participants = await conn.fetch("""
-                            SELECT 
-                                u.user_id, u.username, u.display_name, u.avatar_url
-                            FROM room_participants rp
-                            JOIN users u ON rp.user_id = u.user_id
-                            WHERE rp.room_id = $1
-                        """, room_dict['room_id'])
-                        room_dict['participants'] = [dict(p) for p in participants]
-                        logger.info(f"👥 Room {room_dict['room_id']} has {len(room_dict['participants'])} visible participants")
+                        room_dict['participants'] = json.loads(participants_json) if participants_json else []
                         
                         # For direct rooms without custom name, use other person's name
                         if room_dict['room_type'] == 'direct' and not room_dict['room_name']:
                             other_participant = [p for p in room_dict['participants'] if p['user_id'] != user_id]
                             if other_participant:
                                 room_dict['display_name'] = other_participant[0].get('display_name') or other_participant[0].get('username') or 'Unknown User'
-                                logger.info(f"🏷️ Set direct room {room_dict['room_id']} display_name to '{room_dict['display_name']}'")
                             else:
                                 room_dict['display_name'] = 'Unnamed Room'
                                 logger.warning(f"⚠️ No other participant found for direct room {room_dict['room_id']}")
                         else:
                             room_dict['display_name'] = room_dict['room_name'] or 'Unnamed Room'
-                            logger.info(f"🏷️ Room {room_dict['room_id']} display_name set to '{room_dict['display_name']}'")
                     
-                    # Get unread count
-                    unread_count = await conn.fetchval("""
-                        SELECT COUNT(*)
-                        FROM chat_messages cm
-                        WHERE cm.room_id = $1
-                        AND cm.created_at > (
-                            SELECT COALESCE(last_read_at, '1970-01-01')
-                            FROM room_participants
-                            WHERE room_id = $1 AND user_id = $2
-                        )
-                        AND cm.sender_id != $2
-                        AND cm.deleted_at IS NULL
-                    """, room_dict['room_id'], user_id)
-                    room_dict['unread_count'] = unread_count
-                    
-                    # Get notification settings for this user
-                    notification_settings = await conn.fetchval("""
-                        SELECT notification_settings
-                        FROM room_participants
-                        WHERE room_id = $1 AND user_id = $2
-                    """, room_dict['room_id'], user_id)
-                    room_dict['notification_settings'] = notification_settings or {}
+                    room_dict['notification_settings'] = room_dict['notification_settings'] or {}
                     
                     rooms.append(room_dict)
                 
@@ -396,6 +421,7 @@ class MessagingService:
                 
                 if result == "DELETE 1":
                     logger.info(f"🗑️ Deleted room {room_id}")
+                    await self.invalidate_room_participants(room_id)
                     return True
                 
                 return False
@@ -478,7 +504,8 @@ class MessagingService:
                     WHERE room_id = $1
                 """, room_id)
                 
-                return True
+            await self.invalidate_room_participants(room_id)
+            return True
         
         except Exception as e:
             logger.error(f"❌ Failed to add participant: {e}")
@@ -536,12 +563,8 @@ class MessagingService:
                     RETURNING message_id, created_at
                 """, message_id, room_id, sender_id, encrypted_content, message_type, metadata_json)
                 
-                # Update room's last_message_at
-                await conn.execute("""
-                    UPDATE chat_rooms
-                    SET last_message_at = NOW()
-                    WHERE room_id = $1
-                """, room_id)
+                # chat_message_inserted trigger updates the room's last_message_at/summary
+                # and bumps unread_count for the other participants in the same statement
                 
                 logger.info(f"✅ Message sent to room {room_id} by {sender_id}")
                 
@@ -564,19 +587,22 @@ class MessagingService:
         room_id: str,
         user_id: str,
         limit: int = 50,
-        before_message_id: Optional[str] = None
+        before_message_id: Optional[str] = None,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get messages from a room (paginated)
+        Get messages from a room (keyset paginated, newest page first)
         
         Args:
             room_id: Room UUID
             user_id: User requesting messages
             limit: Maximum messages to return
             before_message_id: For pagination, get messages before this ID
+            before: Keyset cursor (created_at, message_id) from decode_message_cursor;
+                takes precedence over before_message_id
         
         Returns:
-            List of message dicts
+            List of message dicts in chronological order
         """
         await self._ensure_initialized()
         
@@ -585,52 +611,57 @@ class MessagingService:
                 # Set user context for RLS
                 await conn.execute("SELECT set_config('app.current_user_id', $1, false)", user_id)
                 
-                # Build query based on pagination
-                if before_message_id:
-                    rows = await conn.fetch("""
-                        SELECT 
-                            m.message_id, m.sender_id, m.message_content, 
-                            m.message_type, m.metadata, m.created_at,
-                            u.username, u.display_name, u.avatar_url
-                        FROM chat_messages m
-                        JOIN users u ON m.sender_id = u.user_id
-                        WHERE m.room_id = $1
-                        AND m.deleted_at IS NULL
-                        AND m.created_at < (
-                            SELECT created_at FROM chat_messages WHERE message_id = $2
-                        )
-                        ORDER BY m.created_at DESC
-                        LIMIT $3
-                    """, room_id, before_message_id, limit)
-                else:
-                    rows = await conn.fetch("""
-                        SELECT 
-                            m.message_id, m.sender_id, m.message_content, 
-                            m.message_type, m.metadata, m.created_at,
-                            u.username, u.display_name, u.avatar_url
-                        FROM chat_messages m
-                        JOIN users u ON m.sender_id = u.user_id
-                        WHERE m.room_id = $1
-                        AND m.deleted_at IS NULL
-                        ORDER BY m.created_at DESC
-                        LIMIT $2
-                    """, room_id, limit)
+                # (created_at, message_id) keyset: ties on created_at cannot skip or
+                # repeat rows, and the bound is a single index range scan
+                params: List[Any] = [room_id, limit]
+                keyset_clause = ""
+                if before is not None:
+                    keyset_clause = "AND (m.created_at, m.message_id) < ($3, $4::uuid)"
+                    params.extend(before)
+                elif before_message_id:
+                    keyset_clause = """AND (m.created_at, m.message_id) < (
+                            SELECT created_at, message_id FROM chat_messages WHERE message_id = $3::uuid
+                        )"""
+                    params.append(before_message_id)
+                
+                rows = await conn.fetch(f"""
+                    SELECT 
+                        m.message_id, m.sender_id, m.message_content, 
+                        m.message_type, m.metadata, m.created_at,
+                        u.username, u.display_name, u.avatar_url
+                    FROM chat_messages m
+                    JOIN users u ON m.sender_id = u.user_id
+                    WHERE m.room_id = $1
+                    AND m.deleted_at IS NULL
+                    {keyset_clause}
+                    ORDER BY m.created_at DESC, m.message_id DESC
+                    LIMIT $2
+                """, *params)
+                
+                # Reactions for the whole page in one query
+                reactions_by_message: Dict[Any, List[Dict[str, Any]]] = {}
+                if rows:
+                    reaction_rows = await conn.fetch("""
+                        SELECT message_id, emoji, user_id, reaction_id
+                        FROM message_reactions
+                        WHERE message_id = ANY($1::uuid[])
+                        ORDER BY created_at
+                    """, [row['message_id'] for row in rows])
+                    for reaction in reaction_rows:
+                        reaction = dict(reaction)
+                        reactions_by_message.setdefault(reaction.pop('message_id'), []).append(reaction)
+                
+                # Decrypt the whole page in one call (worker thread for larger pages)
+                contents = await encryption_service.decrypt_messages(
+                    [row['message_content'] for row in rows]
+                )
                 
                 messages = []
-                for row in rows:
+                for row, content in zip(rows, contents):
                     msg_dict = dict(row)
-                    # Decrypt content
-                    msg_dict['content'] = encryption_service.decrypt_message(msg_dict['message_content'])
+                    msg_dict['content'] = content
                     del msg_dict['message_content']  # Remove encrypted version
-                    
-                    # Get reactions
-                    reactions = await conn.fetch("""
-                        SELECT emoji, user_id, reaction_id
-                        FROM message_reactions
-                        WHERE message_id = $1
-                    """, msg_dict['message_id'])
-                    msg_dict['reactions'] = [dict(r) for r in reactions]
-                    
+                    msg_dict['reactions'] = reactions_by_message.get(msg_dict['message_id'], [])
                     messages.append(msg_dict)
                 
                 # Reverse to get chronological order
@@ -639,7 +670,7 @@ class MessagingService:
                 # Mark as read
                 await conn.execute("""
                     UPDATE room_participants
-                    SET last_read_at = NOW()
+                    SET last_read_at = NOW(), unread_count = 0
                     WHERE room_id = $1 AND user_id = $2
                 """, room_id, user_id)
                 
@@ -937,17 +968,11 @@ class MessagingService:
                 # Set user context for RLS
                 await conn.execute("SELECT set_config('app.current_user_id', $1, false)", user_id)
                 
+                # Counters are maintained by chat_messages triggers
                 rows = await conn.fetch("""
-                    SELECT 
-                        rp.room_id,
-                        COUNT(cm.message_id) as unread_count
-                    FROM room_participants rp
-                    LEFT JOIN chat_messages cm ON cm.room_id = rp.room_id
-                        AND cm.created_at > COALESCE(rp.last_read_at, '1970-01-01')
-                        AND cm.sender_id != $1
-                        AND cm.deleted_at IS NULL
-                    WHERE rp.user_id = $1
-                    GROUP BY rp.room_id
+                    SELECT room_id, unread_count
+                    FROM room_participants
+                    WHERE user_id = $1
                 """, user_id)
                 
                 return {row['room_id']: row['unread_count'] for row in rows}
@@ -958,7 +983,7 @@ class MessagingService:
 
     async def get_room_participants(self, room_id: str) -> List[Dict[str, Any]]:
         """
-        Get all participants in a specific room
+        Get all participants in a specific room (served from the participant cache)
         
         Args:
             room_id: Room UUID
@@ -966,6 +991,10 @@ class MessagingService:
         Returns:
             List of participant dicts
         """
+        cached = self.participant_cache.get(room_id)
+        if cached is not None:
+            return cached
+        
         await self._ensure_initialized()
         
         try:
@@ -981,10 +1010,66 @@ class MessagingService:
                     WHERE rp.room_id = $1
                 """, room_id)
                 
-                return [dict(row) for row in rows]
+                participants = [dict(row) for row in rows]
+                self.participant_cache.put(room_id, participants)
+                return participants
         except Exception as e:
             logger.error(f"❌ Failed to get room participants: {e}")
             return []
+    
+    async def get_presence_audience(self, user_id: str) -> Dict[str, List[str]]:
+        """
+        Rooms a user belongs to and the users who share a room or team with them
+        
+        Presence changes are only delivered to this audience instead of every
+        connected user.
+        
+        Args:
+            user_id: User whose presence changed
+        
+        Returns:
+            Dict with "room_ids" and "user_ids" (the subject excluded)
+        """
+        await self._ensure_initialized()
+        
+        try:
+            async with self.db_pool.acquire() as conn:
+                # Admin context: the audience spans rooms/teams the caller cannot see via RLS
+                await conn.execute("SELECT set_config('app.current_user_role', 'admin', false)")
+                
+                row = await conn.fetchrow("""
+                    SELECT
+                        ARRAY(
+                            SELECT room_id::text FROM room_participants WHERE user_id = $1
+                        ) AS room_ids,
+                        ARRAY(
+                            SELECT rp.user_id FROM room_participants rp
+                            WHERE rp.room_id IN (SELECT room_id FROM room_participants WHERE user_id = $1)
+                              AND rp.user_id <> $1
+                            UNION
+                            SELECT tm.user_id FROM team_members tm
+                            WHERE tm.team_id IN (SELECT team_id FROM team_members WHERE user_id = $1)
+                              AND tm.user_id <> $1
+                        ) AS user_ids
+                """, user_id)
+                
+                return {"room_ids": list(row["room_ids"]), "user_ids": list(row["user_ids"])}
+        except Exception as e:
+            logger.error(f"❌ Failed to get presence audience for user {user_id}: {e}")
+            return {"room_ids": [], "user_ids": []}
+    
+    async def invalidate_room_participants(self, room_id: str) -> None:
+        """
+        Drop a room's cached participants here and on every other backend process
+        
+        Call after any change to room_participants (join, leave, room deletion).
+        """
+        self.participant_cache.invalidate(room_id)
+        try:
+            from utils.websocket_manager import get_websocket_manager
+        except ImportError:
+            return
+        await get_websocket_manager().publish_cache_invalidation("room_participants", room_id)
 
     async def mark_room_as_read(self, room_id: str, user_id: str) -> bool:
         """
@@ -1006,7 +1091,7 @@ class MessagingService:
                 
                 result = await conn.execute("""
                     UPDATE room_participants
-                    SET last_read_at = NOW()
+                    SET last_read_at = NOW(), unread_count = 0
                     WHERE room_id = $1 AND user_id = $2
                 """, room_id, user_id)
                 
@@ -0,0 +1,72 @@
+"""
+Room Participant Cache - In-memory room → participants index
+
+Every message broadcast to a room needs its participant list to reach the members
+who do not have the room open. The list changes rarely (add participant, team
+membership change, room deletion), so it is kept per process and invalidated on
+those events; other workers are told through the WebSocket fan-out. A TTL bounds
+staleness of profile fields (display name, avatar) and any missed invalidation.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RoomParticipantCache:
+    """LRU of room_id → participant dicts with TTL and hit/miss counters"""
+
+    def __init__(self, max_rooms: int, ttl_seconds: float):
+        self.max_rooms = max(1, max_rooms)
+        self.ttl_seconds = ttl_seconds
+        self._rooms: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, room_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached participants (copies) or None on miss/expiry"""
+        with self._lock:
+            cached = self._rooms.get(room_id)
+            if cached is None or cached[0] < time.monotonic():
+                if cached is not None:
+                    del self._rooms[room_id]
+                self.misses += 1
+                return None
+            self._rooms.move_to_end(room_id)
+            self.hits += 1
+            return [dict(participant) for participant in cached[1]]
+
+    def put(self, room_id: str, participants: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._rooms[room_id] = (
+                time.monotonic() + self.ttl_seconds,
+                [dict(participant) for participant in participants],
+            )
+            self._rooms.move_to_end(room_id)
+            while len(self._rooms) > self.max_rooms:
+                self._rooms.popitem(last=False)
+
+    def invalidate(self, room_id: str) -> None:
+        with self._lock:
+            if self._rooms.pop(room_id, None) is not None:
+                self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "rooms": len(self._rooms),
+                "max_rooms": self.max_rooms,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,126 @@
+"""
+RSS HTTP Client
+Shared, connection-pooled HTTP client for RSS feed polling
+
+One aiohttp session per event loop (not per feed), with total and per-host
+connection limits so polling hundreds of feeds reuses keep-alive connections
+without hammering any single publisher. Supports conditional GET via stored
+ETag / Last-Modified validators.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; PlatoRSS/1.0; +https://example.local)",
+    "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
+}
+
+
+@dataclass
+class FeedFetchResult:
+    """Outcome of one (possibly conditional) feed fetch"""
+    status: int
+    content: Optional[bytes] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class RSSHttpClient:
+    """Connection-pooled feed fetcher bound to a single event loop"""
+
+    def __init__(self, total_limit: Optional[int] = None, per_host_limit: Optional[int] = None, timeout: float = 30.0):
+        self.total_limit = total_limit or int(os.getenv("RSS_HTTP_POOL_LIMIT", "64"))
+        self.per_host_limit = per_host_limit or int(os.getenv("RSS_HTTP_PER_HOST_LIMIT", "4"))
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Simple counters for observability
+        self.requests = 0
+        self.not_modified = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.total_limit,
+                limit_per_host=self.per_host_limit,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_FEED_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def fetch_feed(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FeedFetchResult:
+        """
+        Fetch a feed, sending If-None-Match / If-Modified-Since when validators are known
+
+        Returns a 304 result with no content when the feed is unchanged.
+        Raises on non-200/304 responses, matching the previous polling behaviour.
+        """
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        session = await self._get_session()
+        started = time.monotonic()
+        self.requests += 1
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                self.not_modified += 1
+                return FeedFetchResult(
+                    status=304,
+                    etag=response.headers.get("ETag") or etag,
+                    last_modified=response.headers.get("Last-Modified") or last_modified,
+                    elapsed=time.monotonic() - started,
+                )
+
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}: {response.reason}")
+
+            content = await response.read()
+            return FeedFetchResult(
+                status=200,
+                content=content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                elapsed=time.monotonic() - started,
+            )
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# One client per event loop - aiohttp sessions cannot be shared across loops
+_rss_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RSSHttpClient]" = weakref.WeakKeyDictionary()
+
+
+def get_rss_http_client() -> RSSHttpClient:
+    """Get the shared RSS HTTP client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _rss_http_clients.get(loop)
+    if client is None:
+        client = RSSHttpClient()
+        _rss_http_clients[loop] = client
+    return client
@@ -119,8 +119,9 @@ class ServiceContainer:
         
         # Single WebSocket manager instance (optional: not available in Celery worker - no FastAPI)
         try:
-            from utils.websocket_manager import WebSocketManager
-            self.websocket_manager = WebSocketManager()
+            # Same instance as get_websocket_manager() so the process has one fan-out subscriber
+            from utils.websocket_manager import get_websocket_manager
+            self.websocket_manager = get_websocket_manager()
         except ImportError:
             self.websocket_manager = None
             logger.debug("WebSocket manager unavailable (e.g. Celery worker); real-time updates disabled")
@@ -1,10 +1,17 @@
 """
 Settings Service - Handles persistent application configuration
+
+Each process (uvicorn worker, Celery worker) serves settings from an in-memory
+copy of the settings table. A trigger bumps settings_version on every write;
+reads poll that one row at most once per SETTINGS_VERSION_POLL_SECONDS and
+reload the table when it moved, so writes made by any process show up
+everywhere within the poll interval.
 """
 
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from services.database_manager.database_helpers import fetch_all, fetch_one, execute
@@ -22,6 +29,10 @@ class SettingsService:
         # Use shared database manager helpers to avoid extra connection pools
         self._settings_cache = {}
         self._initialized = False
+        # True once the whole table is in memory (an absent key then means no such setting)
+        self._cache_loaded = False
+        self._cache_version: Optional[int] = None  # settings_version the cache was loaded at
+        self._next_version_check = 0.0
     
     async def initialize(self):
         """Initialize the settings service"""
@@ -50,18 +61,46 @@ class SettingsService:
             logger.error(f"❌ Database connection failed: {e}")
             raise
     
+    async def _fetch_settings_version(self) -> Optional[int]:
+        """Current settings_version, or None if it cannot be read (migration 047 not applied)"""
+        try:
+            row = await fetch_one("SELECT version FROM settings_version WHERE id")
+            return row["version"] if row else None
+        except Exception as e:
+            logger.debug(f"Settings version unavailable, reloading settings on every poll: {e}")
+            return None
+    
     async def _load_settings_cache(self):
-        """Load all settings into memory cache"""
+        """Load all settings into memory cache (replacing it, so deleted keys disappear)"""
         try:
+            # Read the version first: a write landing in between just triggers another reload
+            version = await self._fetch_settings_version()
             rows = await fetch_all("SELECT key, value, data_type FROM settings")
+            cache = {}
             for row in rows:
                 key, value, value_type = row["key"], row["value"], row["data_type"]
-                self._settings_cache[key] = self._convert_value(value, value_type)
-            logger.debug(f"📚 Loaded {len(self._settings_cache)} settings into cache")
+                cache[key] = self._convert_value(value, value_type)
+            self._settings_cache = cache
+            self._cache_version = version
+            self._cache_loaded = True
+            self._next_version_check = time.monotonic() + settings.SETTINGS_VERSION_POLL_SECONDS
+            logger.debug(f"📚 Loaded {len(self._settings_cache)} settings into cache (version {version})")
         except Exception as e:
             logger.error(f"❌ Failed to load settings cache: {e}")
-            # Continue with empty cache if database is not ready
-            self._settings_cache = {}
+            # Continue with empty cache if database is not ready; keep serving a stale one otherwise
+            if not self._cache_loaded:
+                self._settings_cache = {}
+    
+    async def _refresh_if_stale(self):
+        """Reload the cache if any process changed settings since it was loaded"""
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return
+        # Claim this poll before awaiting so concurrent readers don't poll too
+        self._next_version_check = now + settings.SETTINGS_VERSION_POLL_SECONDS
+        version = await self._fetch_settings_version()
+        if version is None or version != self._cache_version or not self._cache_loaded:
+            await self._load_settings_cache()
     
     def _convert_value(self, value: str, value_type: str) -> Any:
         """Convert string value to appropriate type"""
@@ -101,10 +140,16 @@ class SettingsService:
             logger.warning("⚠️ Settings service not initialized, using default")
             return default
         
+        await self._refresh_if_stale()
+        
         # Try cache first
         if key in self._settings_cache:
             return self._settings_cache[key]
         
+        # The whole table is in memory, so the key does not exist
+        if self._cache_loaded:
+            return default
+        
         # Fallback to database
         try:
             row = await fetch_one("SELECT value, data_type FROM settings WHERE key = $1", key)
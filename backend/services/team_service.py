@@ -551,6 +551,7 @@ class TeamService:
                                 VALUES ($1, $2)
                                 ON CONFLICT (room_id, user_id) DO NOTHING
                             """, room_row["room_id"], user_id)
+                            await self.messaging_service.invalidate_room_participants(str(room_row["room_id"]))
                     except Exception as e:
                         logger.warning(f"Failed to add member to team room: {e}")
                 
@@ -609,6 +610,7 @@ class TeamService:
                                 DELETE FROM room_participants
                                 WHERE room_id = $1 AND user_id = $2
                             """, room_row["room_id"], user_id)
+                            await self.messaging_service.invalidate_room_participants(str(room_row["room_id"]))
                     except Exception as e:
                         logger.warning(f"Failed to remove member from team room: {e}")
                 
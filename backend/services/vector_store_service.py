@@ -547,6 +547,46 @@ class VectorStoreService:
             logger.error(f"❌ Failed to delete points for document {document_id}: {e}")
             return False
     
+    async def delete_points_by_ids(
+        self,
+        point_ids: List[str],
+        collection_name: Optional[str] = None
+    ) -> bool:
+        """
+        Delete specific points by ID via Vector Service
+        
+        Args:
+            point_ids: Point IDs to delete
+            collection_name: Target collection (defaults to global collection)
+            
+        Returns:
+            True if successful
+        """
+        if not point_ids:
+            return True
+        
+        try:
+            if not self._initialized:
+                await self.initialize()
+            
+            target_collection = collection_name or settings.VECTOR_COLLECTION_NAME
+            
+            result = await self.vector_service_client.delete_vectors(
+                collection_name=target_collection,
+                point_ids=point_ids
+            )
+            
+            if result.get("success"):
+                logger.info(f"✅ Deleted {len(point_ids)} point(s) by ID from {target_collection}")
+                return True
+            
+            logger.error(f"❌ Failed to delete points by ID from {target_collection}: {result.get('error', 'Unknown error')}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to delete points by ID: {e}")
+            return False
+    
     async def delete_collection(self, collection_name: str) -> bool:
         """Delete an entire collection via Vector Service"""
         try:
@@ -1100,6 +1100,20 @@ CREATE TABLE IF NOT EXISTS rss_feeds (
     is_active BOOLEAN DEFAULT TRUE,
     is_polling BOOLEAN DEFAULT FALSE,
     user_id VARCHAR(255),
+    etag TEXT,
+    last_modified TEXT,
+    next_poll_at TIMESTAMP,
+    poll_interval INTEGER,
+    avg_publish_interval DOUBLE PRECISION,
+    last_new_item_at TIMESTAMP,
+    consecutive_unchanged INTEGER DEFAULT 0,
+    consecutive_failures INTEGER DEFAULT 0,
+    poll_dispatched_at TIMESTAMP,
+    fetch_count INTEGER DEFAULT 0,
+    not_modified_count INTEGER DEFAULT 0,
+    last_content_length INTEGER,
+    bytes_saved BIGINT DEFAULT 0,
+    adaptive_since TIMESTAMP DEFAULT NOW(),
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW()
 );
@@ -1137,6 +1151,7 @@ CREATE TABLE IF NOT EXISTS rss_feed_subscriptions (
 CREATE INDEX IF NOT EXISTS idx_rss_feeds_user_id ON rss_feeds(user_id);
 CREATE INDEX IF NOT EXISTS idx_rss_feeds_active ON rss_feeds(is_active);
 CREATE INDEX IF NOT EXISTS idx_rss_feeds_last_check ON rss_feeds(last_check);
+CREATE INDEX IF NOT EXISTS idx_rss_feeds_next_poll_at ON rss_feeds(next_poll_at);
 
 -- Create indexes for efficient article lookups
 CREATE INDEX IF NOT EXISTS idx_rss_articles_feed_id ON rss_articles(feed_id);
@@ -1144,6 +1159,7 @@ CREATE INDEX IF NOT EXISTS idx_rss_articles_user_id ON rss_articles(user_id);
 CREATE INDEX IF NOT EXISTS idx_rss_articles_published_date ON rss_articles(published_date);
 CREATE INDEX IF NOT EXISTS idx_rss_articles_is_read ON rss_articles(is_read);
 CREATE INDEX IF NOT EXISTS idx_rss_articles_content_hash ON rss_articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_rss_articles_feed_link ON rss_articles(feed_id, link);
 CREATE INDEX IF NOT EXISTS idx_rss_articles_full_content ON rss_articles USING GIN(to_tsvector('english', full_content)) WHERE full_content IS NOT NULL;
 
 -- Create indexes for feed subscriptions
@@ -1164,6 +1180,13 @@ COMMENT ON COLUMN rss_feeds.check_interval IS 'Interval in seconds between feed
 COMMENT ON COLUMN rss_feeds.last_check IS 'Timestamp of last feed check';
 COMMENT ON COLUMN rss_feeds.is_active IS 'Whether the feed is currently being monitored';
 COMMENT ON COLUMN rss_feeds.user_id IS 'User ID for user-specific feeds, NULL for global feeds';
+COMMENT ON COLUMN rss_feeds.etag IS 'ETag validator from the last successful fetch (conditional GET)';
+COMMENT ON COLUMN rss_feeds.last_modified IS 'Last-Modified validator from the last successful fetch (conditional GET)';
+COMMENT ON COLUMN rss_feeds.next_poll_at IS 'When the adaptive scheduler will next poll this feed';
+COMMENT ON COLUMN rss_feeds.poll_interval IS 'Current adaptive poll interval in seconds (check_interval is the floor)';
+COMMENT ON COLUMN rss_feeds.avg_publish_interval IS 'EWMA of observed seconds between new items';
+COMMENT ON COLUMN rss_feeds.poll_dispatched_at IS 'Lease set when a poll task is dispatched; cleared when the poll completes';
+COMMENT ON COLUMN rss_feeds.bytes_saved IS 'Estimated bytes not downloaded thanks to 304 Not Modified responses';
 
 COMMENT ON TABLE rss_articles IS 'RSS articles from monitored feeds';
 COMMENT ON COLUMN rss_articles.article_id IS 'Unique identifier for the RSS article';
@@ -4000,6 +4023,212 @@ CREATE POLICY document_links_insert_policy ON document_links
         ))
     );
 
+-- ========================================
+-- DOCUMENT CHUNK INDEX (incremental re-indexing)
+-- ========================================
+CREATE TABLE IF NOT EXISTS document_chunk_index (
+    document_id VARCHAR(255) NOT NULL REFERENCES document_metadata(document_id) ON DELETE CASCADE,
+    content_hash VARCHAR(64) NOT NULL,
+    point_id UUID NOT NULL,
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    collection_name VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (document_id, content_hash)
+);
+
+GRANT ALL PRIVILEGES ON document_chunk_index TO bastion_user;
+
+COMMENT ON TABLE document_chunk_index IS 'Chunks currently embedded per document (content hash -> vector point) for diff-based re-indexing';
+COMMENT ON COLUMN document_chunk_index.content_hash IS 'SHA-256 of whitespace-normalized chunk content';
+COMMENT ON COLUMN document_chunk_index.point_id IS 'Deterministic vector point ID: uuid5(document_id:content_hash)';
+
+-- ========================================
+-- ROOM UNREAD COUNTERS AND LAST-MESSAGE SUMMARY
+-- ========================================
+-- The room list used to count unread and total messages with correlated
+-- COUNT(*) subqueries over chat_messages, so it slowed down with history.
+-- Counters now live on room_participants (unread_count) and chat_rooms
+-- (message_count, last_message_id, last_message_sender_id) and are kept
+-- current by triggers on chat_messages; mark-as-read resets unread_count.
+-- The trigger functions are SECURITY DEFINER because RLS only lets a sender
+-- update their own room_participants row.
+-- Idempotent: safe to run multiple times (backfill recomputes the counters).
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/045_add_room_unread_counters.sql
+-- ========================================
+
+ALTER TABLE room_participants ADD COLUMN IF NOT EXISTS unread_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS last_message_id UUID;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS last_message_sender_id VARCHAR(255);
+
+-- New message: bump the room summary and every other participant's unread count
+CREATE OR REPLACE FUNCTION chat_message_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.deleted_at IS NOT NULL THEN
+        RETURN NEW;
+    END IF;
+
+    UPDATE chat_rooms
+    SET last_message_at = NEW.created_at,
+        last_message_id = NEW.message_id,
+        last_message_sender_id = NEW.sender_id,
+        message_count = message_count + 1
+    WHERE room_id = NEW.room_id;
+
+    UPDATE room_participants
+    SET unread_count = unread_count + 1
+    WHERE room_id = NEW.room_id
+    AND user_id <> NEW.sender_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Soft delete: undo the counts the message contributed and repoint the summary
+CREATE OR REPLACE FUNCTION chat_message_soft_deleted()
+RETURNS TRIGGER AS $$
+DECLARE
+    previous RECORD;
+BEGIN
+    IF OLD.deleted_at IS NOT NULL OR NEW.deleted_at IS NULL THEN
+        RETURN NEW;
+    END IF;
+
+    UPDATE chat_rooms
+    SET message_count = GREATEST(message_count - 1, 0)
+    WHERE room_id = NEW.room_id;
+
+    UPDATE room_participants
+    SET unread_count = unread_count - 1
+    WHERE room_id = NEW.room_id
+    AND user_id <> NEW.sender_id
+    AND unread_count > 0
+    AND NEW.created_at > COALESCE(last_read_at, '1970-01-01');
+
+    IF EXISTS (SELECT 1 FROM chat_rooms WHERE room_id = NEW.room_id AND last_message_id = NEW.message_id) THEN
+        SELECT message_id, sender_id INTO previous
+        FROM chat_messages
+        WHERE room_id = NEW.room_id AND deleted_at IS NULL
+        ORDER BY created_at DESC
+        LIMIT 1;
+
+        UPDATE chat_rooms
+        SET last_message_id = previous.message_id,
+            last_message_sender_id = previous.sender_id
+        WHERE room_id = NEW.room_id;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS chat_message_inserted_trigger ON chat_messages;
+CREATE TRIGGER chat_message_inserted_trigger
+    AFTER INSERT ON chat_messages
+    FOR EACH ROW EXECUTE FUNCTION chat_message_inserted();
+
+DROP TRIGGER IF EXISTS chat_message_soft_deleted_trigger ON chat_messages;
+CREATE TRIGGER chat_message_soft_deleted_trigger
+    AFTER UPDATE OF deleted_at ON chat_messages
+    FOR EACH ROW EXECUTE FUNCTION chat_message_soft_deleted();
+
+-- Backfill from existing history (one-time cost)
+UPDATE chat_rooms r
+SET message_count = (
+        SELECT COUNT(*) FROM chat_messages cm
+        WHERE cm.room_id = r.room_id AND cm.deleted_at IS NULL
+    ),
+    last_message_id = latest.message_id,
+    last_message_sender_id = latest.sender_id
+FROM chat_rooms r2
+LEFT JOIN LATERAL (
+    SELECT cm.message_id, cm.sender_id
+    FROM chat_messages cm
+    WHERE cm.room_id = r2.room_id AND cm.deleted_at IS NULL
+    ORDER BY cm.created_at DESC
+    LIMIT 1
+) latest ON true
+WHERE r.room_id = r2.room_id;
+
+UPDATE room_participants rp
+SET unread_count = (
+    SELECT COUNT(*)
+    FROM chat_messages cm
+    WHERE cm.room_id = rp.room_id
+    AND cm.created_at > COALESCE(rp.last_read_at, '1970-01-01')
+    AND cm.sender_id <> rp.user_id
+    AND cm.deleted_at IS NULL
+);
+
+COMMENT ON COLUMN room_participants.unread_count IS 'Messages from others since last_read_at; maintained by chat_messages triggers';
+COMMENT ON COLUMN chat_rooms.message_count IS 'Non-deleted messages in the room; maintained by chat_messages triggers';
+COMMENT ON COLUMN chat_rooms.last_message_id IS 'Most recent non-deleted message (room list preview)';
+COMMENT ON COLUMN chat_rooms.last_message_sender_id IS 'Sender of last_message_id';
+
+-- ========================================
+-- CHAT MESSAGE KEYSET INDEX
+-- ========================================
+-- Room history pages by (created_at, message_id) so messages sharing a
+-- timestamp are neither skipped nor repeated. This partial index matches that
+-- ordering over live (non-deleted) messages, so each page is one index range
+-- scan however deep the history is.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/046_add_chat_message_keyset_index.sql
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS idx_chat_messages_room_keyset
+    ON chat_messages(room_id, created_at DESC, message_id DESC)
+    WHERE deleted_at IS NULL;
+
+COMMENT ON INDEX idx_chat_messages_room_keyset IS 'Keyset pagination of live room history by (created_at, message_id)';
+
+-- ========================================
+-- SETTINGS VERSION COUNTER
+-- ========================================
+-- Every backend and Celery process serves settings from an in-memory copy of
+-- the settings table. A statement-level trigger bumps a single version row on
+-- any write, so processes poll one row (at most once per
+-- SETTINGS_VERSION_POLL_SECONDS) and reload the table only when it moved.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/047_add_settings_version.sql
+-- ========================================
+
+CREATE TABLE IF NOT EXISTS settings_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO settings_version (id, version) VALUES (TRUE, 0) ON CONFLICT (id) DO NOTHING;
+
+GRANT SELECT, UPDATE ON settings_version TO bastion_user;
+
+CREATE OR REPLACE FUNCTION bump_settings_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE settings_version
+    SET version = version + 1,
+        updated_at = NOW()
+    WHERE id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS settings_version_trigger ON settings;
+CREATE TRIGGER settings_version_trigger
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON settings
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_settings_version();
+
+COMMENT ON TABLE settings_version IS 'Single-row change counter for settings; polled by SettingsService to refresh its in-memory copy';
+
 -- ========================================
 -- DATABASE INITIALIZATION COMPLETE
 -- Roosevelt's Square Deal for Data!
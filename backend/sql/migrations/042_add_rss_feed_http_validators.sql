@@ -0,0 +1,22 @@
+-- ========================================
+-- RSS CONDITIONAL GET VALIDATORS
+-- ========================================
+-- Stores ETag / Last-Modified per feed so polls can send If-None-Match /
+-- If-Modified-Since and skip download + parse on 304 Not Modified.
+-- Adds a (feed_id, link) index for the bulk link = ANY($2) dedupe query.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/042_add_rss_feed_http_validators.sql
+-- ========================================
+
+ALTER TABLE rss_feeds
+ADD COLUMN IF NOT EXISTS etag TEXT;
+
+ALTER TABLE rss_feeds
+ADD COLUMN IF NOT EXISTS last_modified TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_rss_articles_feed_link ON rss_articles(feed_id, link);
+
+COMMENT ON COLUMN rss_feeds.etag IS 'ETag validator from the last successful fetch (conditional GET)';
+COMMENT ON COLUMN rss_feeds.last_modified IS 'Last-Modified validator from the last successful fetch (conditional GET)';
@@ -0,0 +1,31 @@
+-- ========================================
+-- RSS ADAPTIVE POLLING
+-- ========================================
+-- Per-feed scheduler state: learned publish cadence, current adaptive interval,
+-- due time, back-off counters and fetch-savings counters.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/043_add_rss_adaptive_polling.sql
+-- ========================================
+
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS next_poll_at TIMESTAMP;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS poll_interval INTEGER;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS avg_publish_interval DOUBLE PRECISION;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS last_new_item_at TIMESTAMP;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS consecutive_unchanged INTEGER DEFAULT 0;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS consecutive_failures INTEGER DEFAULT 0;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS poll_dispatched_at TIMESTAMP;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS fetch_count INTEGER DEFAULT 0;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS not_modified_count INTEGER DEFAULT 0;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS last_content_length INTEGER;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS bytes_saved BIGINT DEFAULT 0;
+ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS adaptive_since TIMESTAMP DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS idx_rss_feeds_next_poll_at ON rss_feeds(next_poll_at);
+
+COMMENT ON COLUMN rss_feeds.next_poll_at IS 'When the adaptive scheduler will next poll this feed';
+COMMENT ON COLUMN rss_feeds.poll_interval IS 'Current adaptive poll interval in seconds (check_interval is the floor)';
+COMMENT ON COLUMN rss_feeds.avg_publish_interval IS 'EWMA of observed seconds between new items';
+COMMENT ON COLUMN rss_feeds.poll_dispatched_at IS 'Lease set when a poll task is dispatched; cleared when the poll completes';
+COMMENT ON COLUMN rss_feeds.bytes_saved IS 'Estimated bytes not downloaded thanks to 304 Not Modified responses';
@@ -0,0 +1,30 @@
+-- ========================================
+-- DOCUMENT CHUNK INDEX (incremental re-indexing)
+-- ========================================
+-- Records which chunks (by content hash) are embedded for each document so a
+-- save only embeds added chunks and deletes vanished ones instead of
+-- re-embedding the whole file. Point IDs are deterministic uuid5 values.
+-- Existing documents have no rows yet; their first incremental re-index does
+-- a one-time full rebuild that fills the index.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/044_add_document_chunk_index.sql
+-- ========================================
+
+CREATE TABLE IF NOT EXISTS document_chunk_index (
+    document_id VARCHAR(255) NOT NULL REFERENCES document_metadata(document_id) ON DELETE CASCADE,
+    content_hash VARCHAR(64) NOT NULL,
+    point_id UUID NOT NULL,
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    collection_name VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (document_id, content_hash)
+);
+
+GRANT ALL PRIVILEGES ON document_chunk_index TO bastion_user;
+
+COMMENT ON TABLE document_chunk_index IS 'Chunks currently embedded per document (content hash -> vector point) for diff-based re-indexing';
+COMMENT ON COLUMN document_chunk_index.content_hash IS 'SHA-256 of whitespace-normalized chunk content';
+COMMENT ON COLUMN document_chunk_index.point_id IS 'Deterministic vector point ID: uuid5(document_id:content_hash)';
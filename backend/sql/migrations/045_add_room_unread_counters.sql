@@ -0,0 +1,125 @@
+-- ========================================
+-- ROOM UNREAD COUNTERS AND LAST-MESSAGE SUMMARY
+-- ========================================
+-- The room list used to count unread and total messages with correlated
+-- COUNT(*) subqueries over chat_messages, so it slowed down with history.
+-- Counters now live on room_participants (unread_count) and chat_rooms
+-- (message_count, last_message_id, last_message_sender_id) and are kept
+-- current by triggers on chat_messages; mark-as-read resets unread_count.
+-- The trigger functions are SECURITY DEFINER because RLS only lets a sender
+-- update their own room_participants row.
+-- Idempotent: safe to run multiple times (backfill recomputes the counters).
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/045_add_room_unread_counters.sql
+-- ========================================
+
+ALTER TABLE room_participants ADD COLUMN IF NOT EXISTS unread_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS last_message_id UUID;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS last_message_sender_id VARCHAR(255);
+
+-- New message: bump the room summary and every other participant's unread count
+CREATE OR REPLACE FUNCTION chat_message_inserted()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.deleted_at IS NOT NULL THEN
+        RETURN NEW;
+    END IF;
+
+    UPDATE chat_rooms
+    SET last_message_at = NEW.created_at,
+        last_message_id = NEW.message_id,
+        last_message_sender_id = NEW.sender_id,
+        message_count = message_count + 1
+    WHERE room_id = NEW.room_id;
+
+    UPDATE room_participants
+    SET unread_count = unread_count + 1
+    WHERE room_id = NEW.room_id
+    AND user_id <> NEW.sender_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Soft delete: undo the counts the message contributed and repoint the summary
+CREATE OR REPLACE FUNCTION chat_message_soft_deleted()
+RETURNS TRIGGER AS $$
+DECLARE
+    previous RECORD;
+BEGIN
+    IF OLD.deleted_at IS NOT NULL OR NEW.deleted_at IS NULL THEN
+        RETURN NEW;
+    END IF;
+
+    UPDATE chat_rooms
+    SET message_count = GREATEST(message_count - 1, 0)
+    WHERE room_id = NEW.room_id;
+
+    UPDATE room_participants
+    SET unread_count = unread_count - 1
+    WHERE room_id = NEW.room_id
+    AND user_id <> NEW.sender_id
+    AND unread_count > 0
+    AND NEW.created_at > COALESCE(last_read_at, '1970-01-01');
+
+    IF EXISTS (SELECT 1 FROM chat_rooms WHERE room_id = NEW.room_id AND last_message_id = NEW.message_id) THEN
+        SELECT message_id, sender_id INTO previous
+        FROM chat_messages
+        WHERE room_id = NEW.room_id AND deleted_at IS NULL
+        ORDER BY created_at DESC
+        LIMIT 1;
+
+        UPDATE chat_rooms
+        SET last_message_id = previous.message_id,
+            last_message_sender_id = previous.sender_id
+        WHERE room_id = NEW.room_id;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS chat_message_inserted_trigger ON chat_messages;
+CREATE TRIGGER chat_message_inserted_trigger
+    AFTER INSERT ON chat_messages
+    FOR EACH ROW EXECUTE FUNCTION chat_message_inserted();
+
+DROP TRIGGER IF EXISTS chat_message_soft_deleted_trigger ON chat_messages;
+CREATE TRIGGER chat_message_soft_deleted_trigger
+    AFTER UPDATE OF deleted_at ON chat_messages
+    FOR EACH ROW EXECUTE FUNCTION chat_message_soft_deleted();
+
+-- Backfill from existing history (one-time cost)
+UPDATE chat_rooms r
+SET message_count = (
+        SELECT COUNT(*) FROM chat_messages cm
+        WHERE cm.room_id = r.room_id AND cm.deleted_at IS NULL
+    ),
+    last_message_id = latest.message_id,
+    last_message_sender_id = latest.sender_id
+FROM chat_rooms r2
+LEFT JOIN LATERAL (
+    SELECT cm.message_id, cm.sender_id
+    FROM chat_messages cm
+    WHERE cm.room_id = r2.room_id AND cm.deleted_at IS NULL
+    ORDER BY cm.created_at DESC
+    LIMIT 1
+) latest ON true
+WHERE r.room_id = r2.room_id;
+
+UPDATE room_participants rp
+SET unread_count = (
+    SELECT COUNT(*)
+    FROM chat_messages cm
+    WHERE cm.room_id = rp.room_id
+    AND cm.created_at > COALESCE(rp.last_read_at, '1970-01-01')
+    AND cm.sender_id <> rp.user_id
+    AND cm.deleted_at IS NULL
+);
+
+COMMENT ON COLUMN room_participants.unread_count IS 'Messages from others since last_read_at; maintained by chat_messages triggers';
+COMMENT ON COLUMN chat_rooms.message_count IS 'Non-deleted messages in the room; maintained by chat_messages triggers';
+COMMENT ON COLUMN chat_rooms.last_message_id IS 'Most recent non-deleted message (room list preview)';
+COMMENT ON COLUMN chat_rooms.last_message_sender_id IS 'Sender of last_message_id';
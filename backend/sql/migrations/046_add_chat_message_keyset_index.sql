@@ -0,0 +1,18 @@
+-- ========================================
+-- CHAT MESSAGE KEYSET INDEX
+-- ========================================
+-- Room history pages by (created_at, message_id) so messages sharing a
+-- timestamp are neither skipped nor repeated. This partial index matches that
+-- ordering over live (non-deleted) messages, so each page is one index range
+-- scan however deep the history is.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/046_add_chat_message_keyset_index.sql
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS idx_chat_messages_room_keyset
+    ON chat_messages(room_id, created_at DESC, message_id DESC)
+    WHERE deleted_at IS NULL;
+
+COMMENT ON INDEX idx_chat_messages_room_keyset IS 'Keyset pagination of live room history by (created_at, message_id)';
@@ -0,0 +1,40 @@
+-- ========================================
+-- SETTINGS VERSION COUNTER
+-- ========================================
+-- Every backend and Celery process serves settings from an in-memory copy of
+-- the settings table. A statement-level trigger bumps a single version row on
+-- any write, so processes poll one row (at most once per
+-- SETTINGS_VERSION_POLL_SECONDS) and reload the table only when it moved.
+-- Idempotent: safe to run multiple times.
+--
+-- Run from host (postgres container must be up):
+--   docker exec -i bastion-postgres psql -U postgres -d bastion_knowledge_base < backend/sql/migrations/047_add_settings_version.sql
+-- ========================================
+
+CREATE TABLE IF NOT EXISTS settings_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO settings_version (id, version) VALUES (TRUE, 0) ON CONFLICT (id) DO NOTHING;
+
+GRANT SELECT, UPDATE ON settings_version TO bastion_user;
+
+CREATE OR REPLACE FUNCTION bump_settings_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE settings_version
+    SET version = version + 1,
+        updated_at = NOW()
+    WHERE id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS settings_version_trigger ON settings;
+CREATE TRIGGER settings_version_trigger
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON settings
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_settings_version();
+
+COMMENT ON TABLE settings_version IS 'Single-row change counter for settings; polled by SettingsService to refresh its in-memory copy';
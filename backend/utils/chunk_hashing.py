@@ -0,0 +1,72 @@
+"""
+Chunk Hashing - Deterministic chunk identities for incremental re-indexing
+
+Vector point IDs used to come from Python's built-in hash(), which is randomized
+per process (PYTHONHASHSEED), so the same chunk got a different ID in every worker
+and re-indexing could never recognise what was already stored. Chunks are now
+identified by a SHA-256 of their whitespace-normalized content, and point IDs are
+UUIDv5s derived from (document_id, content_hash) so identical paragraphs in two
+different documents never overwrite each other.
+"""
+
+import hashlib
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+from models.api_models import Chunk
+
+# Fixed namespace so point IDs are stable across processes, hosts and deploys
+CHUNK_POINT_NAMESPACE = uuid.UUID("6f1d3c52-8a4e-5b7a-9c0d-2e4f6a8b1c3d")
+
+
+def normalize_chunk_content(content: str) -> str:
+    """Collapse whitespace so reflowed-but-identical text hashes the same"""
+    return " ".join(content.split())
+
+
+def chunk_content_hash(content: str) -> str:
+    """Stable SHA-256 hex digest of a chunk's normalized content"""
+    return hashlib.sha256(normalize_chunk_content(content).encode("utf-8")).hexdigest()
+
+
+def chunk_point_id(document_id: str, content_hash: str) -> str:
+    """Deterministic vector point ID (UUID string) for a chunk of a document"""
+    return str(uuid.uuid5(CHUNK_POINT_NAMESPACE, f"{document_id}:{content_hash}"))
+
+
+@dataclass
+class ChunkDiff:
+    """Result of comparing freshly chunked content against the stored chunk index"""
+    added: List[Chunk] = field(default_factory=list)
+    unchanged: List[Chunk] = field(default_factory=list)
+    removed_hashes: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed_hashes)
+
+
+def diff_chunks(chunks: List[Chunk], stored_hashes: Iterable[str]) -> ChunkDiff:
+    """
+    Split chunks into added / unchanged against the hashes already stored
+
+    Duplicate chunks within the document collapse to one (they map to the same
+    point ID anyway). Stored hashes no longer produced by the document are removed.
+    """
+    stored = set(stored_hashes)
+    seen: Dict[str, Chunk] = {}
+    diff = ChunkDiff()
+
+    for chunk in chunks:
+        content_hash = chunk_content_hash(chunk.content)
+        if content_hash in seen:
+            continue
+        seen[content_hash] = chunk
+        if content_hash in stored:
+            diff.unchanged.append(chunk)
+        else:
+            diff.added.append(chunk)
+
+    diff.removed_hashes = [h for h in stored if h not in seen]
+    return diff
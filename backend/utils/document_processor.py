@@ -9,7 +9,7 @@ import os
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import time
 import re
 
@@ -129,15 +129,23 @@ class DocumentProcessor:
             "spacy_model": "en_core_web_lg" if self.nlp else None
         }
     
-    async def process_document(self, file_path: str, doc_type: str, document_id: str = None) -> ProcessingResult:
+    async def process_document(self, file_path: str, doc_type: str, document_id: str = None,
+                               stage_timings: Optional[Dict[str, float]] = None,
+                               extract_entities: bool = True) -> ProcessingResult:
         """Process a document and return chunks with quality metrics
         
         Args:
             file_path: Path to the document file
             doc_type: Type of document (pdf, docx, etc.)
             document_id: UUID of the document (if None, derived from filename for backward compatibility)
+            stage_timings: Optional dict filled with per-stage durations in seconds
+                (extract, quality, chunk, entities)
+            extract_entities: Run NER over the full text (incremental re-indexing skips this
+                and extracts entities from changed chunks only)
         """
         start_time = time.time()
+        if stage_timings is None:
+            stage_timings = {}
         
         # **ROOSEVELT FIX**: Use provided document_id instead of deriving from filename
         if document_id is None:
@@ -192,6 +200,7 @@ class DocumentProcessor:
                 return result
             
             # Extract text based on document type
+            stage_start = time.perf_counter()
             if doc_type == 'pdf':
                 text, ocr_confidence = await self._process_pdf(file_path, document_id)
             elif doc_type == 'docx':
@@ -212,15 +221,24 @@ class DocumentProcessor:
                 text, ocr_confidence = await self._process_srt(file_path), 1.0
             else:
                 raise ValueError(f"Unsupported document type: {doc_type}")
+            stage_timings["extract"] = time.perf_counter() - stage_start
             
             # Assess text quality
+            stage_start = time.perf_counter()
             quality_metrics = await self._assess_quality(text, ocr_confidence)
+            stage_timings["quality"] = time.perf_counter() - stage_start
             
             # Chunk the text
+            stage_start = time.perf_counter()
             chunks = await self._chunk_text(text, file_path, document_id)
+            stage_timings["chunk"] = time.perf_counter() - stage_start
             
             # Extract entities from the text
-            entities = await self._extract_entities(text, chunks)
+            entities = []
+            if extract_entities:
+                stage_start = time.perf_counter()
+                entities = await self._extract_entities(text, chunks)
+                stage_timings["entities"] = time.perf_counter() - stage_start
             
             # Create processing result
             result = ProcessingResult(
@@ -0,0 +1,293 @@
+"""
+Document Worker Pool - Runs CPU-bound document extraction off the API event loop
+
+Extraction (PDF/DOCX/EPUB parsing, OCR), chunking and spaCy NER are synchronous
+CPU work even though DocumentProcessor exposes them as coroutines. Running them on
+the backend loop stalls every other request while a large upload is parsed.
+
+This pool keeps warm worker processes (spaCy model loaded once per process at
+startup) and runs the full extract -> quality -> chunk -> entities pipeline there.
+Small documents are packed into a single worker call to amortize IPC overhead.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from models.api_models import ProcessingResult
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Worker process side =====
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_processor = None
+
+
+def _init_worker() -> None:
+    """Process initializer: build one event loop and load spaCy/OCR once per worker"""
+    global _worker_loop, _worker_processor
+    from utils.document_processor import DocumentProcessor
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+    _worker_processor = DocumentProcessor.get_instance()
+    _worker_loop.run_until_complete(_worker_processor.initialize())
+    logger.info(f"✅ Document worker ready (pid={os.getpid()}, spaCy loaded: {_worker_processor.nlp is not None})")
+
+
+def _warmup_worker() -> int:
+    """No-op used to force worker processes to spawn and preload models"""
+    return os.getpid()
+
+
+def _process_batch(jobs: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+    """Run the processing pipeline for a batch of (file_path, doc_type, document_id) jobs"""
+    if _worker_processor is None:
+        _init_worker()
+
+    outcomes = []
+    for file_path, doc_type, document_id in jobs:
+        started_at = time.time()
+        stage_timings: Dict[str, float] = {}
+        try:
+            result = _worker_loop.run_until_complete(
+                _worker_processor.process_document(file_path, doc_type, document_id, stage_timings=stage_timings)
+            )
+            outcomes.append({
+                "document_id": document_id,
+                "result": result,
+                "error": None,
+                "started_at": started_at,
+                "stage_timings": stage_timings,
+            })
+        except Exception as e:
+            # Exceptions from parser libraries are not always picklable - send the message back
+            outcomes.append({
+                "document_id": document_id,
+                "result": None,
+                "error": f"{type(e).__name__}: {e}",
+                "started_at": started_at,
+                "stage_timings": stage_timings,
+            })
+    return outcomes
+
+
+# ===== Event loop side =====
+
+@dataclass
+class _PendingDocument:
+    """A document waiting for (or running in) a worker process"""
+    file_path: str
+    doc_type: str
+    document_id: str
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.time)
+
+
+class DocumentWorkerPool:
+    """Warm process pool that runs DocumentProcessor pipelines off the event loop"""
+
+    STAGES = ("queue_wait", "extract", "quality", "chunk", "entities", "total")
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        batch_max_docs: Optional[int] = None,
+        small_doc_bytes: Optional[int] = None,
+        batch_window_ms: Optional[int] = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.batch_max_docs = max(1, batch_max_docs or settings.DOCUMENT_WORKER_BATCH_MAX_DOCS)
+        self.small_doc_bytes = small_doc_bytes if small_doc_bytes is not None else settings.DOCUMENT_WORKER_SMALL_DOC_BYTES
+        self.batch_window = (batch_window_ms if batch_window_ms is not None else settings.DOCUMENT_WORKER_BATCH_WINDOW_MS) / 1000.0
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[_PendingDocument] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self.in_flight = 0
+        self.batches_dispatched = 0
+        self.documents_dispatched = 0
+        self.documents_completed = 0
+        self.documents_failed = 0
+        self.pool_restarts = 0
+        self._stage_stats: Dict[str, Dict[str, float]] = {
+            stage: {"count": 0, "total": 0.0, "max": 0.0} for stage in self.STAGES
+        }
+
+    def start(self) -> None:
+        """Create the pool and warm every worker (spaCy loads in the background)"""
+        if self._executor is not None:
+            return
+
+        # spawn: the API process has a running loop and threads, which fork does not copy safely
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        for _ in range(self.max_workers):
+            self._executor.submit(_warmup_worker)
+        logger.info(f"✅ Document worker pool started with {self.max_workers} warm workers")
+
+    async def process_document(self, file_path: str, doc_type: str, document_id: str) -> ProcessingResult:
+        """Process one document in a worker process; small documents are batched together"""
+        loop = asyncio.get_running_loop()
+        pending = _PendingDocument(file_path, doc_type, document_id, loop.create_future())
+
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = self.small_doc_bytes + 1
+
+        if size > self.small_doc_bytes or self.batch_max_docs == 1:
+            self._dispatch([pending])
+        else:
+            self._pending.append(pending)
+            if len(self._pending) >= self.batch_max_docs:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await pending.future
+
+    def _flush(self) -> None:
+        """Dispatch all queued small documents as one worker call"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_PendingDocument]) -> None:
+        if self._executor is None:
+            self.start()
+
+        self.in_flight += len(batch)
+        self.batches_dispatched += 1
+        self.documents_dispatched += len(batch)
+
+        try:
+            concurrent_future = self._executor.submit(
+                _process_batch,
+                [(p.file_path, p.doc_type, p.document_id) for p in batch],
+            )
+        except BrokenProcessPool as e:
+            self._complete_with_error(batch, e)
+            self._reset_executor()
+            return
+
+        asyncio.wrap_future(concurrent_future).add_done_callback(
+            lambda f: self._on_batch_done(batch, f)
+        )
+
+    def _on_batch_done(self, batch: List[_PendingDocument], future: asyncio.Future) -> None:
+        if future.cancelled():
+            self._complete_with_error(batch, asyncio.CancelledError())
+            return
+
+        error = future.exception()
+        if error is not None:
+            if isinstance(error, BrokenProcessPool):
+                logger.error(f"❌ Document worker pool broke: {error} - restarting")
+                self._reset_executor()
+            self._complete_with_error(batch, error)
+            return
+
+        outcomes = {outcome["document_id"]: outcome for outcome in future.result()}
+        now = time.time()
+        for pending in batch:
+            self.in_flight -= 1
+            outcome = outcomes.get(pending.document_id)
+            if outcome is None:
+                self.documents_failed += 1
+                self._set_exception(pending, RuntimeError(f"No result returned for document {pending.document_id}"))
+                continue
+
+            self._record_stage("queue_wait", max(0.0, outcome["started_at"] - pending.submitted_at))
+            for stage, seconds in outcome["stage_timings"].items():
+                self._record_stage(stage, seconds)
+            self._record_stage("total", now - pending.submitted_at)
+
+            if outcome["error"]:
+                self.documents_failed += 1
+                self._set_exception(pending, RuntimeError(outcome["error"]))
+            else:
+                self.documents_completed += 1
+                if not pending.future.done():
+                    pending.future.set_result(outcome["result"])
+
+    def _complete_with_error(self, batch: List[_PendingDocument], error: BaseException) -> None:
+        for pending in batch:
+            self.in_flight -= 1
+            self.documents_failed += 1
+            self._set_exception(pending, error)
+
+    @staticmethod
+    def _set_exception(pending: _PendingDocument, error: BaseException) -> None:
+        if not pending.future.done():
+            pending.future.set_exception(error)
+
+    def _reset_executor(self) -> None:
+        """Drop a broken pool; the next dispatch starts a fresh one"""
+        executor, self._executor = self._executor, None
+        self.pool_restarts += 1
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _record_stage(self, stage: str, seconds: float) -> None:
+        stats = self._stage_stats.setdefault(stage, {"count": 0, "total": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["total"] += seconds
+        stats["max"] = max(stats["max"], seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, batching and per-stage timing statistics"""
+        return {
+            "workers": self.max_workers,
+            "running": self._executor is not None,
+            "queue_depth": len(self._pending) + self.in_flight,
+            "pending_batch": len(self._pending),
+            "in_flight": self.in_flight,
+            "batches_dispatched": self.batches_dispatched,
+            "documents_dispatched": self.documents_dispatched,
+            "documents_completed": self.documents_completed,
+            "documents_failed": self.documents_failed,
+            "avg_batch_size": round(self.documents_dispatched / self.batches_dispatched, 2) if self.batches_dispatched else 0.0,
+            "pool_restarts": self.pool_restarts,
+            "stage_timings_ms": {
+                stage: {
+                    "count": int(stats["count"]),
+                    "avg": round(stats["total"] / stats["count"] * 1000, 1) if stats["count"] else 0.0,
+                    "max": round(stats["max"] * 1000, 1),
+                }
+                for stage, stats in self._stage_stats.items()
+            },
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Fail queued documents and stop the worker processes"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        for item in pending:
+            self._set_exception(item, RuntimeError("Document worker pool shut down"))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
@@ -5,7 +5,8 @@ Parallel Document Processor - Handles concurrent document processing with config
 import asyncio
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
@@ -14,6 +15,7 @@ from enum import Enum
 from config import settings
 from models.api_models import ProcessingResult, Chunk, Entity, QualityMetrics
 from utils.document_processor import DocumentProcessor
+from utils.document_worker_pool import DocumentWorkerPool
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -56,6 +58,7 @@ class ProcessingConfig:
     enable_io_parallelism: bool = True
     thread_pool_size: int = 12          # Increased to match document concurrency
     process_pool_size: int = 4          # Increased for CPU-intensive tasks
+    worker_pool_size: int = settings.DOCUMENT_WORKER_POOL_SIZE  # Warm extraction/chunking/NER workers for HYBRID (0 = off)
 
 
 class ParallelDocumentProcessor:
@@ -74,9 +77,9 @@ class ParallelDocumentProcessor:
         self.chunk_semaphore = asyncio.Semaphore(self.config.max_concurrent_chunks)
         self.embedding_semaphore = asyncio.Semaphore(self.config.max_concurrent_embeddings)
         
-        # Thread/Process pools for CPU-intensive tasks
+        # Thread pool for I/O-heavy work, warm process pool for CPU-bound extraction
         self.thread_pool = None
-        self.process_pool = None
+        self.worker_pool: Optional[DocumentWorkerPool] = None
         
         # Worker tasks
         self.workers = []
@@ -100,9 +103,16 @@ class ParallelDocumentProcessor:
             self.thread_pool = ThreadPoolExecutor(max_workers=self.config.thread_pool_size)
             logger.info(f"✅ Thread pool initialized with {self.config.thread_pool_size} workers")
         
-        if self.config.strategy in [ProcessingStrategy.PROCESS_POOL, ProcessingStrategy.HYBRID]:
-            self.process_pool = ProcessPoolExecutor(max_workers=self.config.process_pool_size)
-            logger.info(f"✅ Process pool initialized with {self.config.process_pool_size} workers")
+        if self.config.strategy == ProcessingStrategy.PROCESS_POOL:
+            pool_size = self.config.process_pool_size
+        elif self.config.strategy == ProcessingStrategy.HYBRID:
+            pool_size = self.config.worker_pool_size
+        else:
+            pool_size = 0
+        if pool_size > 0:
+            self.worker_pool = DocumentWorkerPool(max_workers=pool_size)
+            self.worker_pool.start()
+            logger.info(f"✅ Document worker pool initialized with {pool_size} workers")
         
         # Start worker tasks
         await self.start_workers()
@@ -453,22 +463,23 @@ class ParallelDocumentProcessor:
         return result
     
     async def _process_with_process_pool(self, job: ProcessingJob) -> ProcessingResult:
-        """Process document using process pool for CPU intensive tasks"""
+        """Process document using the warm worker pool for CPU intensive tasks"""
         logger.info(f"🔄 Processing {job.document_id} with process pool")
         
-        # Run the CPU-intensive parts in process pool
-        loop = asyncio.get_event_loop()
-        
-        # Note: Process pool requires picklable functions
-        # This is a simplified implementation
-        result = await loop.run_in_executor(
-            self.process_pool,
-            self._process_document_sync,
-            job.file_path,
-            job.doc_type
-        )
-        
-        return result
+        try:
+            # Extraction -> chunking -> entities all run in a worker process, off the event loop
+            return await self.worker_pool.process_document(job.file_path, job.doc_type, job.document_id)
+        except BrokenProcessPool as e:
+            # Worker crashed (e.g. OOM on a huge PDF) - don't fail the document, use a thread instead
+            logger.warning(f"⚠️ Worker pool unavailable for {job.document_id}, falling back to thread: {e}")
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self.thread_pool,
+                self._process_document_sync,
+                job.file_path,
+                job.doc_type,
+                job.document_id
+            )
     
     async def _process_hybrid(self, job: ProcessingJob) -> ProcessingResult:
         """Process document using hybrid approach (best of all strategies)"""
@@ -477,8 +488,10 @@ class ParallelDocumentProcessor:
         # Use thread pool for I/O intensive text extraction
         loop = asyncio.get_event_loop()
         
-        # Extract text in thread pool
-        if job.doc_type in ['pdf', 'docx', 'epub']:
+        if self.worker_pool and job.doc_type not in ['org', 'image']:
+            # CPU-bound extraction/chunking/NER in warm worker processes
+            result = await self._process_with_process_pool(job)
+        elif job.doc_type in ['pdf', 'docx', 'epub']:
             # I/O intensive - use thread pool
             result = await loop.run_in_executor(
                 self.thread_pool,
@@ -617,8 +630,10 @@ class ParallelDocumentProcessor:
             "config": {
                 "max_concurrent_documents": self.config.max_concurrent_documents,
                 "max_concurrent_chunks": self.config.max_concurrent_chunks,
-                "strategy": self.config.strategy.value
-            }
+                "strategy": self.config.strategy.value,
+                "use_worker_pool": self.worker_pool is not None
+            },
+            "worker_pool": self.worker_pool.get_stats() if self.worker_pool else None
         }
     
     async def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
@@ -665,8 +680,8 @@ class ParallelDocumentProcessor:
             self.thread_pool.shutdown(wait=True)
             logger.info("🔄 Thread pool shut down")
         
-        if self.process_pool:
-            self.process_pool.shutdown(wait=True)
-            logger.info("🔄 Process pool shut down")
+        if self.worker_pool:
+            self.worker_pool.shutdown(wait=True)
+            logger.info("🔄 Document worker pool shut down")
         
         logger.info("✅ Parallel Document Processor shut down complete")
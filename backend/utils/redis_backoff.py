@@ -0,0 +1,77 @@
+"""
+Redis Backoff - lazily created Redis client that is bypassed after an error
+
+Caches and invalidation signals kept in Redis must never fail the request that
+uses them. After a Redis error the client is dropped and Redis is skipped for a
+while (one warning per outage); the first call after the window reconnects.
+
+redis.asyncio connections belong to the event loop that opened them, so async
+clients are recreated when called from a different loop (API loop vs. Celery's
+per-worker loop). Sync clients are shared by every thread.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional, Union
+
+import redis
+import redis.asyncio as aioredis
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long Redis is bypassed after an error
+BYPASS_SECONDS = 60
+
+
+class RedisBackoff:
+    """Redis client for one cache or signal, with a bypass window after errors"""
+
+    def __init__(self, name: str, use_asyncio: bool = True, bypass_seconds: float = BYPASS_SECONDS, **client_kwargs: Any):
+        """
+        Args:
+            name: What the client is used for, for the outage warning
+            use_asyncio: redis.asyncio client (True) or blocking redis client (False)
+            bypass_seconds: How long Redis is skipped after an error
+            client_kwargs: Passed to from_url (e.g. socket_timeout)
+        """
+        self.name = name
+        self.use_asyncio = use_asyncio
+        self.bypass_seconds = bypass_seconds
+        self.client_kwargs = client_kwargs
+        self._client: Optional[Union[redis.Redis, aioredis.Redis]] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """False while in the post-error bypass window"""
+        return time.monotonic() >= self._unavailable_until
+
+    def get_client(self) -> Optional[Union[redis.Redis, aioredis.Redis]]:
+        """Redis client, or None while unconfigured or in the bypass window"""
+        if not settings.REDIS_URL or not self.available:
+            return None
+        if self.use_asyncio:
+            loop = asyncio.get_running_loop()
+            if self._client is None or self._client_loop is not loop:
+                self._client = aioredis.from_url(settings.REDIS_URL, **self.client_kwargs)
+                self._client_loop = loop
+        elif self._client is None:
+            self._client = redis.Redis.from_url(settings.REDIS_URL, **self.client_kwargs)
+        return self._client
+
+    def mark_unavailable(self, error: Exception) -> None:
+        """Skip Redis for bypass_seconds and reconnect afterwards"""
+        if self.available:
+            logger.warning(f"⚠️ {self.name} unavailable, bypassing Redis for {self.bypass_seconds}s: {error}")
+        self._unavailable_until = time.monotonic() + self.bypass_seconds
+        self._client = None
+
+    async def close(self) -> None:
+        """Close the current async client, if any"""
+        client, self._client = self._client, None
+        if client is not None and self.use_asyncio:
+            await client.aclose()
@@ -20,6 +20,8 @@ from config import settings
 from models.api_models import Chunk
 from services.embedding_service_wrapper import get_embedding_service
 from services.vector_store_service import get_vector_store
+from utils.chunk_hashing import chunk_content_hash, chunk_point_id
+from services.document_chunk_index import record_stored_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -328,12 +330,12 @@ class ResilientEmbeddingManager:
             else:
                 collection_name = settings.VECTOR_COLLECTION_NAME
             
-            # Use content hash for consistent IDs
-            content_hash = abs(hash(chunk.content))
+            # Use content hash for consistent IDs (stable across worker processes)
+            content_hash = chunk_content_hash(chunk.content)
             
             # Create point
             point = PointStruct(
-                id=content_hash,
+                id=chunk_point_id(chunk.document_id, content_hash),
                 vector=embedding,
                 payload={
                     "chunk_id": chunk.chunk_id,
@@ -351,10 +353,12 @@ class ResilientEmbeddingManager:
             )
             
             # Store immediately via VectorStoreService with timeout
-            await asyncio.wait_for(
+            stored = await asyncio.wait_for(
                 self.vector_store.insert_points([point], collection_name),
                 timeout=30.0
             )
+            if stored:
+                await record_stored_chunks(chunk.document_id, [(content_hash, point.id, chunk.chunk_index)], collection_name)
             
         except Exception as e:
             logger.error(f"Failed to store chunk embedding: {e}")
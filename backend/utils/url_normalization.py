@@ -0,0 +1,56 @@
+"""
+URL Normalization - Canonical form of web URLs for cache keys and deduplication
+
+Two links to the same article often differ only in tracking parameters, fragment,
+host case, default port or query-parameter order. normalize_url() collapses those
+so every crawl path agrees on one key per page.
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only identify the referrer/campaign, never the content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid",
+    "igshid", "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "oly_anon_id",
+    "oly_enc_id", "vero_id", "wickedid", "ref_src", "ref_url", "cmpid", "s_cid",
+    "ncid", "sr_share", "spm", "share", "ito",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hsa_", "itm_")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical URL: lowercase scheme/host, no default port, no fragment, tracking
+    params stripped and remaining query params sorted. Non-http(s) input is
+    returned stripped but otherwise unchanged.
+    """
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    query = urlencode(
+        sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not is_tracking_param(key)),
+        doseq=True,
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
@@ -0,0 +1,71 @@
+"""
+WebDAV listing versions - invalidation signal for cached org-mode listings
+
+The WebDAV server runs in its own process and serves org-mode folder listings
+from an in-memory snapshot per user. Anything that changes which .org files a
+user has, or their content on disk, bumps a version counter in Redis; the WebDAV
+provider compares counters before serving a snapshot and rebuilds when they moved.
+
+Keys:
+    webdav:org_listing_version            - global (writes whose owner is unknown)
+    webdav:org_listing_version:<user_id>  - one user's listing
+"""
+
+import logging
+from typing import Iterable, Optional
+
+from utils.redis_backoff import RedisBackoff
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_VERSION_KEY = "webdav:org_listing_version"
+
+# document_metadata columns the org-mode listing is built from
+LISTING_FIELDS = frozenset({"filename", "title", "category", "file_path", "user_id", "upload_date"})
+
+
+def user_version_key(user_id: str) -> str:
+    return f"{GLOBAL_VERSION_KEY}:{user_id}"
+
+
+def is_org_filename(filename: Optional[str]) -> bool:
+    return bool(filename) and filename.lower().endswith(".org")
+
+
+def touches_listing(fields: Iterable[str]) -> bool:
+    """True if updating these document_metadata fields can change a listing"""
+    return any(field in LISTING_FIELDS for field in fields)
+
+
+class ListingVersionPublisher:
+    """Bumps listing versions; failures never break the write that triggered them"""
+
+    def __init__(self):
+        # WebDAV snapshots fall back to a short max age while Redis is down
+        self._redis = RedisBackoff("WebDAV listing version publisher")
+
+    async def bump(self, user_id: Optional[str] = None) -> None:
+        """Invalidate one user's listing snapshot, or every user's when user_id is None"""
+        client = self._redis.get_client()
+        if client is None:
+            return
+        try:
+            await client.incr(user_version_key(user_id) if user_id else GLOBAL_VERSION_KEY)
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+
+
+_publisher: Optional[ListingVersionPublisher] = None
+
+
+def get_listing_version_publisher() -> ListingVersionPublisher:
+    """Get the process-wide listing version publisher"""
+    global _publisher
+    if _publisher is None:
+        _publisher = ListingVersionPublisher()
+    return _publisher
+
+
+async def bump_org_listing_version(user_id: Optional[str] = None) -> None:
+    """Invalidate cached WebDAV org-mode listings (one user, or all when user_id is None)"""
+    await get_listing_version_publisher().bump(user_id)
@@ -0,0 +1,178 @@
+"""
+WebSocket fan-out - cross-process delivery for WebSocketManager
+
+Every uvicorn worker (and Celery process) owns its own WebSocketManager, so a send
+only reaches sockets connected to that process. A fan-out backend carries each send
+to every other process once: the sender publishes an envelope and delivers locally,
+and every subscribed manager replays the envelope against its own connections.
+
+Backends:
+    RedisFanout - Redis pub/sub channel shared by all processes (production)
+    LocalFanout - in-memory bus; several managers sharing one LocalFanoutBus behave
+                  like separate workers (tests, single-process deployments)
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+FanoutHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+DEFAULT_CHANNEL = "websocket_fanout"
+
+# How long start() waits for Redis to acknowledge the SUBSCRIBE
+SUBSCRIBE_TIMEOUT_SECONDS = 5.0
+
+
+class WebSocketFanout(ABC):
+    """Base class for fan-out backends"""
+
+    @abstractmethod
+    async def start(self, handler: FanoutHandler) -> None:
+        """Begin delivering envelopes published by any process to handler"""
+
+    @abstractmethod
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        """Publish an envelope to every subscribed process (including this one)"""
+
+    async def stop(self) -> None:
+        """Stop delivering envelopes and release connections"""
+
+
+class LocalFanoutBus:
+    """In-process stand-in for a pub/sub channel"""
+
+    def __init__(self):
+        self.handlers: List[FanoutHandler] = []
+
+    async def publish(self, payload: str) -> None:
+        # Each subscriber decodes its own copy, as it would off the wire
+        await asyncio.gather(
+            *(handler(json.loads(payload)) for handler in list(self.handlers)),
+            return_exceptions=True
+        )
+
+
+class LocalFanout(WebSocketFanout):
+    """In-memory fan-out; managers sharing a bus behave like separate workers"""
+
+    def __init__(self, bus: Optional[LocalFanoutBus] = None):
+        self.bus = bus if bus is not None else LocalFanoutBus()
+        self._handler: Optional[FanoutHandler] = None
+
+    async def start(self, handler: FanoutHandler) -> None:
+        self._handler = handler
+        self.bus.handlers.append(handler)
+
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        await self.bus.publish(json.dumps(envelope, default=str))
+
+    async def stop(self) -> None:
+        if self._handler in self.bus.handlers:
+            self.bus.handlers.remove(self._handler)
+        self._handler = None
+
+
+class RedisFanout(WebSocketFanout):
+    """Redis pub/sub fan-out shared by every backend process"""
+
+    def __init__(self, redis_url: str, channel: str = DEFAULT_CHANNEL):
+        self.redis_url = redis_url
+        self.channel = channel
+        self._handler: Optional[FanoutHandler] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed: Optional[asyncio.Event] = None
+
+        # redis.asyncio connections belong to the loop that opened them
+        self._client: Optional[redis.Redis] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> redis.Redis:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(self.redis_url)
+            self._client_loop = loop
+        return self._client
+
+    async def start(self, handler: FanoutHandler) -> None:
+        """Start listening and wait until Redis has acknowledged the subscription"""
+        self._handler = handler
+        if self._listener is None or self._listener.done():
+            self._subscribed = asyncio.Event()
+            self._listener = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), SUBSCRIBE_TIMEOUT_SECONDS)
+            logger.info(f"📡 Fan-out subscribed to Redis channel '{self.channel}'")
+        except asyncio.TimeoutError:
+            # The listener keeps retrying; envelopes published until then are missed
+            logger.warning(f"⚠️ Fan-out subscription to Redis channel '{self.channel}' not confirmed after {SUBSCRIBE_TIMEOUT_SECONDS}s, still retrying")
+
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        await self._get_client().publish(self.channel, json.dumps(envelope, default=str))
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception:
+                pass
+            self._client = None
+
+    async def _listen(self) -> None:
+        """Subscribe and dispatch envelopes, reconnecting after Redis errors"""
+        while True:
+            client = redis.from_url(self.redis_url)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "subscribe":
+                        self._subscribed.set()
+                        continue
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        envelope = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(f"⚠️ Ignoring malformed fan-out envelope on '{self.channel}'")
+                        continue
+                    try:
+                        await self._handler(envelope)
+                    except Exception as e:
+                        logger.error(f"❌ Fan-out delivery failed on '{self.channel}' ({envelope.get('op')}): {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Fan-out subscription to '{self.channel}' lost, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+
+def create_websocket_fanout() -> Optional[WebSocketFanout]:
+    """Fan-out backend from WEBSOCKET_FANOUT_BACKEND (redis | local | none)"""
+    from config import settings
+
+    backend = (settings.WEBSOCKET_FANOUT_BACKEND or "none").lower()
+    if backend == "redis":
+        return RedisFanout(settings.REDIS_URL)
+    if backend == "local":
+        return LocalFanout()
+    return None
@@ -1,26 +1,63 @@
 """
 WebSocket connection manager for real-time updates
+
+Connections live in the process that accepted them. Targeted sends (session, job,
+room, user, broadcast) are published once through a WebSocketFanout backend and
+replayed by the manager of every other backend process, so clients connected to
+any worker receive them.
 """
 
+import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+import uuid
+from typing import List, Dict, Any, Hashable, Optional, Tuple
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 
+from utils.websocket_fanout import WebSocketFanout, create_websocket_fanout
+from utils.websocket_send_queue import ConnectionSendQueue, coalesce_key
+
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+
 
 class WebSocketManager:
     """Manages WebSocket connections for real-time updates"""
     
-    def __init__(self):
+    # Fan-out envelope op -> local delivery method
+    _FANOUT_DELIVERY = {
+        "session": "_deliver_to_session",
+        "job": "_deliver_to_job",
+        "broadcast": "_deliver_broadcast",
+        "agent_status": "_deliver_agent_status",
+        "room": "_deliver_to_room",
+        "presence": "_deliver_presence_update",
+        "users": "_deliver_to_users",
+        "invalidate": "_deliver_cache_invalidation",
+    }
+    
+    def __init__(self, fanout: Optional[WebSocketFanout] = _UNSET):
+        # Publishing needs no subscription, so Celery processes reach API workers too;
+        # start_fanout() subscribes this process to sends from the others
+        self.fanout = create_websocket_fanout() if fanout is _UNSET else fanout
+        self.instance_id = uuid.uuid4().hex
+        self._fanout_started = False
         self.active_connections: List[WebSocket] = []
         self.session_connections: Dict[str, List[WebSocket]] = {}
         self.job_connections: Dict[str, List[WebSocket]] = {}  # Track connections by job_id
         self.conversation_connections: Dict[str, List[WebSocket]] = {}  # Track connections by conversation_id for agent status
         self.user_connections: Dict[str, List[WebSocket]] = {}  # Track connections by user_id for out-of-band updates
         self.room_connections: Dict[str, List[Dict[str, Any]]] = {}  # Track connections by room_id with user context
+        self._send_queues: Dict[WebSocket, ConnectionSendQueue] = {}  # Outbound queue + writer task per connection
+        
+        # Presence debouncing: latest unsent status, pending timers, last status broadcast by any worker
+        self._pending_presence: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._presence_timers: Dict[str, asyncio.Task] = {}
+        self._last_presence: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.presence_frames_sent = 0
+        self.presence_updates_coalesced = 0
     
     async def connect(self, websocket: WebSocket, session_id: str = None):
         """Accept a new WebSocket connection"""
@@ -136,6 +173,8 @@ class WebSocketManager:
             del self.user_connections[uid]
             logger.info(f"🧹 Cleaned up empty user connections for {uid}")
         
+        self._release_send_queue(websocket)
+        
         if disconnected_jobs:
             logger.info(f"📡 WebSocket disconnected from jobs: {disconnected_jobs}")
         elif disconnected_conversations:
@@ -143,94 +182,142 @@ class WebSocketManager:
         else:
             logger.info(f"📡 WebSocket disconnected (session: {session_id})")
 
-    async def send_personal_message(self, message: Any, websocket: WebSocket):
-        """Send a message to a specific WebSocket connection"""
+    async def start_fanout(self) -> None:
+        """Subscribe to sends published by other backend processes"""
+        if self.fanout is None or self._fanout_started:
+            return
+        await self.fanout.start(self._handle_fanout_envelope)
+        self._fanout_started = True
+    
+    async def stop_fanout(self) -> None:
+        """Unsubscribe from cross-process sends"""
+        if self.fanout is not None:
+            await self.fanout.stop()
+        self._fanout_started = False
+    
+    async def _publish(self, op: str, **args) -> None:
+        """Publish a send to the other processes (local delivery is done by the caller)"""
+        if self.fanout is None:
+            return
         try:
-            if isinstance(message, dict):
-                message = json.dumps(message)
-            await websocket.send_text(message)
+            await self.fanout.publish({"origin": self.instance_id, "op": op, "args": args})
         except Exception as e:
-            logger.error(f"❌ Failed to send WebSocket message: {e}")
-            # Remove broken connection
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            logger.error(f"❌ Failed to publish WebSocket fan-out '{op}': {e}")
+    
+    async def _handle_fanout_envelope(self, envelope: Dict[str, Any]) -> None:
+        """Replay a send published by another process against local connections"""
+        if envelope.get("origin") == self.instance_id:
+            return
+        method_name = self._FANOUT_DELIVERY.get(envelope.get("op"))
+        if method_name is None:
+            logger.warning(f"⚠️ Unknown WebSocket fan-out op: {envelope.get('op')}")
+            return
+        await getattr(self, method_name)(**envelope.get("args", {}))
+    
+    @staticmethod
+    def _frame(message: Any) -> Tuple[str, Optional[Hashable]]:
+        """Serialize a message once per send, plus its coalescing key"""
+        if isinstance(message, dict):
+            message_str = json.dumps(message)
+        else:
+            message_str = str(message)
+        return message_str, coalesce_key(message)
+    
+    def _enqueue(self, websocket: WebSocket, frame: Tuple[str, Optional[Hashable]]) -> bool:
+        """Queue a serialized frame on a connection's writer; never waits on the network"""
+        send_queue = self._send_queues.get(websocket)
+        if send_queue is None:
+            from config import settings
+            send_queue = ConnectionSendQueue(
+                websocket,
+                max_size=settings.WEBSOCKET_SEND_QUEUE_SIZE,
+                policy=settings.WEBSOCKET_BACKPRESSURE_POLICY,
+                send_timeout=settings.WEBSOCKET_SEND_TIMEOUT_SECONDS,
+                on_failure=self._on_send_failure,
+            )
+            self._send_queues[websocket] = send_queue
+        return send_queue.offer(*frame)
+    
+    def _on_send_failure(self, websocket: WebSocket, reason: str) -> None:
+        """Writer gave up on a connection: forget it everywhere"""
+        logger.warning(f"🧹 Dropping WebSocket connection: {reason}")
+        self._send_queues.pop(websocket, None)
+        self.disconnect(websocket)
+        for session_id in list(self.session_connections.keys()):
+            if websocket in self.session_connections[session_id]:
+                self.session_connections[session_id].remove(websocket)
+                if not self.session_connections[session_id]:
+                    del self.session_connections[session_id]
+        for room_id in list(self.room_connections.keys()):
+            self.room_connections[room_id] = [
+                conn for conn in self.room_connections[room_id]
+                if conn["websocket"] is not websocket
+            ]
+            if not self.room_connections[room_id]:
+                del self.room_connections[room_id]
+    
+    def _release_send_queue(self, websocket: WebSocket) -> None:
+        """Stop a connection's writer once it is no longer registered anywhere"""
+        if websocket in self.active_connections:
+            return
+        send_queue = self._send_queues.pop(websocket, None)
+        if send_queue is not None:
+            send_queue.close()
+    
+    async def publish_cache_invalidation(self, cache: str, key: str) -> None:
+        """Tell the other backend processes to drop a cached entry (this process already did)"""
+        await self._publish("invalidate", cache=cache, key=key)
+    
+    async def _deliver_cache_invalidation(self, cache: str, key: str) -> None:
+        """Drop a cached entry invalidated by another process"""
+        if cache == "room_participants":
+            from services.messaging.messaging_service import messaging_service
+            messaging_service.participant_cache.invalidate(key)
+        else:
+            logger.warning(f"⚠️ Unknown cache in fan-out invalidation: {cache}")
+    
+    async def send_personal_message(self, message: Any, websocket: WebSocket):
+        """Send a message to a specific WebSocket connection"""
+        self._enqueue(websocket, self._frame(message))
 
     async def send_to_session(self, message: Any, session_id: str):
-        """Send a message to all connections in a session"""
-        if session_id in self.session_connections:
-            broken_connections = []
-            
-            for websocket in self.session_connections[session_id]:
-                try:
-                    if isinstance(message, dict):
-                        message_str = json.dumps(message)
-                    else:
-                        message_str = str(message)
-                    await websocket.send_text(message_str)
-                except Exception as e:
-                    logger.error(f"❌ Failed to send message to session {session_id}: {e}")
-                    broken_connections.append(websocket)
-            
-            # Clean up broken connections
-            for websocket in broken_connections:
-                self.disconnect(websocket, session_id)
+        """Send a message to all connections in a session (on every worker)"""
+        await self._publish("session", message=message, session_id=session_id)
+        await self._deliver_to_session(message, session_id)
+
+    async def _deliver_to_session(self, message: Any, session_id: str):
+        """Send a message to this process's connections in a session"""
+        frame = self._frame(message)
+        for websocket in list(self.session_connections.get(session_id, [])):
+            self._enqueue(websocket, frame)
 
     async def send_to_job(self, message: Any, job_id: str):
-        """Send a message to all connections tracking a specific job"""
-        logger.info(f"📡 Attempting to send message to job {job_id}")
-        logger.info(f"📡 Job connections available: {list(self.job_connections.keys())}")
-        logger.info(f"📡 Total active connections: {len(self.active_connections)}")
+        """Send a message to all connections tracking a specific job (on every worker)"""
+        await self._publish("job", message=message, job_id=job_id)
+        await self._deliver_to_job(message, job_id)
+
+    async def _deliver_to_job(self, message: Any, job_id: str):
+        """Send a message to this process's connections tracking a specific job"""
+        connections = list(self.job_connections.get(job_id, []))
+        if not connections:
+            # Expected on workers the job's client is not connected to
+            logger.debug(f"📡 No local connections for job {job_id}")
+            return
         
-        if job_id in self.job_connections:
-            connections = self.job_connections[job_id]
-            logger.info(f"📡 Found {len(connections)} connections for job {job_id}")
-            broken_connections = []
-            
-            for i, websocket in enumerate(connections):
-                try:
-                    if isinstance(message, dict):
-                        message_str = json.dumps(message)
-                    else:
-                        message_str = str(message)
-                    await websocket.send_text(message_str)
-                    logger.info(f"✅ Successfully sent message to job {job_id} connection {i+1}/{len(connections)}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to send message to job {job_id} connection {i+1}: {e}")
-                    broken_connections.append(websocket)
-            
-            # Clean up broken connections
-            for websocket in broken_connections:
-                if websocket in self.job_connections[job_id]:
-                    self.job_connections[job_id].remove(websocket)
-                    logger.info(f"🧹 Removed broken connection for job {job_id}")
-        else:
-            logger.warning(f"⚠️ No connections found for job {job_id}")
-            logger.info(f"📡 Available job connections: {list(self.job_connections.keys())}")
-            logger.info(f"📡 Job ID being looked for: {job_id}")
-            logger.info(f"📡 Job ID type: {type(job_id)}")
-            for available_job_id in self.job_connections.keys():
-                logger.info(f"📡 Available job ID: {available_job_id} (type: {type(available_job_id)})")
-                if str(job_id) == str(available_job_id):
-                    logger.info(f"📡 String comparison matches for job {job_id}")
+        frame = self._frame(message)
+        queued = sum(1 for websocket in connections if self._enqueue(websocket, frame))
+        logger.debug(f"📡 Queued message for job {job_id} on {queued}/{len(connections)} connections")
 
     async def broadcast(self, message: Any):
-        """Send a message to all active connections"""
-        broken_connections = []
-        
-        for websocket in self.active_connections:
-            try:
-                if isinstance(message, dict):
-                    message_str = json.dumps(message)
-                else:
-                    message_str = str(message)
-                await websocket.send_text(message_str)
-            except Exception as e:
-                logger.error(f"❌ Failed to broadcast message: {e}")
-                broken_connections.append(websocket)
-        
-        # Clean up broken connections
-        for websocket in broken_connections:
-            self.disconnect(websocket)
+        """Send a message to all active connections (on every worker)"""
+        await self._publish("broadcast", message=message)
+        await self._deliver_broadcast(message)
+
+    async def _deliver_broadcast(self, message: Any):
+        """Send a message to all of this process's active connections"""
+        frame = self._frame(message)
+        for websocket in list(self.active_connections):
+            self._enqueue(websocket, frame)
 
     async def send_folder_update(self, message: Any, user_id: str = None):
         """Send folder/document update to appropriate user sessions"""
@@ -338,43 +425,29 @@ class WebSocketManager:
                 "timestamp": datetime.now().isoformat()
             }
             
+            await self._publish("agent_status", conversation_id=conversation_id, user_id=user_id, status_message=status_message)
+            await self._deliver_agent_status(conversation_id, user_id, status_message)
+                
+        except Exception as e:
+            logger.error(f"❌ Failed to send agent status: {e}")
+    
+    async def _deliver_agent_status(self, conversation_id: str, user_id: str, status_message: Dict[str, Any]):
+        """Send an agent status message to this process's conversation (or user) connections"""
+        status_type = status_message.get("status_type")
+        message = status_message.get("message")
+        try:
+            frame = self._frame(status_message)
+            
             # Send to conversation-specific connections
             sent_to_conversation = False
-            if conversation_id in self.conversation_connections:
-                connections = self.conversation_connections[conversation_id]
-                logger.info(f"🤖 AGENT STATUS: Sending to {len(connections)} conversation connections for {conversation_id}")
-                
-                broken_connections = []
-                for websocket in connections:
-                    try:
-                        await websocket.send_text(json.dumps(status_message))
-                        sent_to_conversation = True
-                    except Exception as e:
-                        logger.error(f"❌ Failed to send agent status to conversation {conversation_id}: {e}")
-                        broken_connections.append(websocket)
-                
-                # Clean up broken connections
-                for websocket in broken_connections:
-                    if websocket in self.conversation_connections[conversation_id]:
-                        self.conversation_connections[conversation_id].remove(websocket)
+            for websocket in list(self.conversation_connections.get(conversation_id, [])):
+                if self._enqueue(websocket, frame):
+                    sent_to_conversation = True
             
             # Fallback: Send to user connections if no conversation-specific connection
-            if not sent_to_conversation and user_id in self.user_connections:
-                connections = self.user_connections[user_id]
-                logger.info(f"🤖 AGENT STATUS: Fallback to user connections - sending to {len(connections)} user connections for {user_id}")
-                
-                broken_connections = []
-                for websocket in connections:
-                    try:
-                        await websocket.send_text(json.dumps(status_message))
-                    except Exception as e:
-                        logger.error(f"❌ Failed to send agent status to user {user_id}: {e}")
-                        broken_connections.append(websocket)
-                
-                # Clean up broken connections
-                for websocket in broken_connections:
-                    if websocket in self.user_connections[user_id]:
-                        self.user_connections[user_id].remove(websocket)
+            if not sent_to_conversation:
+                for websocket in list(self.user_connections.get(user_id, [])):
+                    self._enqueue(websocket, frame)
             
             if sent_to_conversation or (user_id in self.user_connections):
                 logger.info(f"✅ AGENT STATUS SENT: {status_type} - {message} (conv: {conversation_id[:8]}...)")
@@ -466,6 +539,7 @@ class WebSocketManager:
         # Also remove from active connections
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self._release_send_queue(websocket)
         
         logger.info(f"💬 WebSocket disconnected from room {room_id} for user {user_id}")
 
@@ -500,39 +574,42 @@ class WebSocketManager:
             message: Message data to broadcast
             exclude_user_id: Optional user ID to exclude (e.g., message sender)
         """
+        # Participants are resolved once by the sending process and shipped with the envelope
+        participant_ids = None
+        if message.get("type") == "new_message":
+            try:
+                from services.messaging.messaging_service import messaging_service
+                participants = await messaging_service.get_room_participants(room_id)
+                participant_ids = [p['user_id'] for p in participants]
+            except Exception as e:
+                logger.error(f"❌ Failed to load participants for room {room_id}: {e}")
+        
+        await self._publish("room", room_id=room_id, message=message, exclude_user_id=exclude_user_id, participant_ids=participant_ids)
+        await self._deliver_to_room(room_id, message, exclude_user_id, participant_ids)
+    
+    async def _deliver_to_room(
+        self,
+        room_id: str,
+        message: Dict[str, Any],
+        exclude_user_id: str = None,
+        participant_ids: Optional[List[str]] = None
+    ):
+        """Deliver a room broadcast to this process's room and user connections"""
+        frame = self._frame(message)
+        
         # 1. Deliver to everyone actively watching this room
         sent_to_room = 0
-        if room_id in self.room_connections:
-            broken_connections = []
-            for conn_info in self.room_connections[room_id]:
-                websocket = conn_info["websocket"]
-                user_id = conn_info["user_id"]
-                
-                if exclude_user_id and user_id == exclude_user_id:
-                    continue
-                
-                try:
-                    await websocket.send_json(message)
-                    sent_to_room += 1
-                except Exception as e:
-                    logger.error(f"❌ Failed to send message to user {user_id} in room {room_id}: {e}")
-                    broken_connections.append(conn_info)
-            
-            for conn_info in broken_connections:
-                if conn_info in self.room_connections[room_id]:
-                    self.room_connections[room_id].remove(conn_info)
+        for conn_info in list(self.room_connections.get(room_id, [])):
+            if exclude_user_id and conn_info["user_id"] == exclude_user_id:
+                continue
+            if self._enqueue(conn_info["websocket"], frame):
+                sent_to_room += 1
 
         # 2. For new messages, also deliver to the global user-level WebSockets of all participants
         # This ensures unread counts update even if the room isn't open
         sent_to_users = 0
-        if message.get("type") == "new_message":
+        if participant_ids:
             try:
-                from services.messaging.messaging_service import messaging_service
-                # We need the participant list to know who to notify globally
-                # (Ideally we'd have this in the message or state, but fetching from DB is safest for now)
-                participants = await messaging_service.get_room_participants(room_id)
-                participant_ids = [p['user_id'] for p in participants]
-                
                 for p_id in participant_ids:
                     if exclude_user_id and p_id == exclude_user_id:
                         continue
@@ -545,11 +622,8 @@ class WebSocketManager:
                     if hasattr(self, 'user_connections') and p_id in self.user_connections:
                         connections = self.user_connections[p_id]
                         for websocket in (connections if isinstance(connections, list) else [connections]):
-                            try:
-                                await websocket.send_json(message)
+                            if self._enqueue(websocket, frame):
                                 sent_to_users += 1
-                            except:
-                                pass
             except Exception as e:
                 logger.error(f"❌ Failed to broadcast new message globally: {e}")
 
@@ -560,13 +634,50 @@ class WebSocketManager:
     
     async def broadcast_presence_update(self, user_id: str, status: str, status_message: str = None):
         """
-        Broadcast user presence update to all relevant rooms and interested participants
+        Broadcast user presence update to users who share a room or team with the user
+        
+        Changes are debounced per user (PRESENCE_BROADCAST_DEBOUNCE_SECONDS): rapid
+        online/away/offline flaps collapse into one update carrying the final
+        status, and nothing is sent if that equals the last status seen by this
+        process (its own broadcasts and those fanned out by other workers).
         
         Args:
             user_id: User whose presence changed
             status: New status ('online', 'offline', 'away')
             status_message: Optional status message
         """
+        from config import settings
+        
+        self._pending_presence[user_id] = (status, status_message)
+        if settings.PRESENCE_BROADCAST_DEBOUNCE_SECONDS <= 0:
+            await self._flush_presence_update(user_id)
+        elif user_id in self._presence_timers:
+            self.presence_updates_coalesced += 1
+        else:
+            self._presence_timers[user_id] = asyncio.create_task(
+                self._debounced_presence_update(user_id, settings.PRESENCE_BROADCAST_DEBOUNCE_SECONDS)
+            )
+    
+    async def _debounced_presence_update(self, user_id: str, delay: float):
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._presence_timers.pop(user_id, None)
+        await self._flush_presence_update(user_id)
+    
+    async def _flush_presence_update(self, user_id: str):
+        """Broadcast the latest pending presence for a user (unless unchanged)"""
+        pending = self._pending_presence.pop(user_id, None)
+        if pending is None:
+            return
+        # _last_presence only tracks other workers' updates while subscribed to the
+        # fan-out; a publish-only process can't tell what clients last saw
+        knows_remote = self.fanout is None or self._fanout_started
+        if knows_remote and self._last_presence.get(user_id) == pending:
+            self.presence_updates_coalesced += 1
+            return
+        status, status_message = pending
+        
         presence_message = {
             "type": "presence_update",
             "user_id": user_id,
@@ -575,59 +686,94 @@ class WebSocketManager:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        # Find all rooms this user belongs to (from DB to include rooms they just left)
-        # We use the messaging_service to get the rooms
         try:
+            # Rooms the user belongs to and everyone sharing a room or team (from DB,
+            # so it includes rooms they just left)
             from services.messaging.messaging_service import messaging_service
-            user_rooms = await messaging_service.get_user_rooms(user_id=user_id, limit=100, include_participants=False)
-            room_ids = [r['room_id'] for r in user_rooms]
+            audience = await messaging_service.get_presence_audience(user_id)
+            
+            await self._publish(
+                "presence",
+                user_id=user_id,
+                presence_message=presence_message,
+                room_ids=audience["room_ids"],
+                audience_user_ids=audience["user_ids"]
+            )
+            await self._deliver_presence_update(user_id, presence_message, audience["room_ids"], audience["user_ids"])
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to broadcast presence update: {e}")
+    
+    async def _deliver_presence_update(
+        self,
+        user_id: str,
+        presence_message: Dict[str, Any],
+        room_ids: List[str],
+        audience_user_ids: List[str]
+    ):
+        """Deliver a presence update to this process's connections of the audience, once per socket"""
+        # Track the last status clients were sent, whichever worker broadcast it
+        status = presence_message.get("status")
+        if status == "offline":
+            self._last_presence.pop(user_id, None)
+        else:
+            self._last_presence[user_id] = (status, presence_message.get("status_message"))
+        
+        try:
+            recipients: Dict[int, WebSocket] = {}
             
-            # 1. Broadcast to all active room connections for these rooms
+            # 1. Everyone watching one of the user's rooms
             for room_id in room_ids:
-                if room_id in self.room_connections:
-                    await self.broadcast_to_room(room_id, presence_message)
+                for conn_info in self.room_connections.get(room_id, []):
+                    if conn_info["user_id"] != user_id:
+                        recipients[id(conn_info["websocket"])] = conn_info["websocket"]
             
-            # 2. Broadcast to all active user-level connections
-            # Since we don't want to spam everyone, we only broadcast to those who share a room
-            # but for simplicity and to ensure it works, we can broadcast to all active user connections
-            # who are NOT the user themselves.
-            if hasattr(self, 'user_connections'):
-                for other_user_id, connections in self.user_connections.items():
-                    if other_user_id == user_id:
-                        continue
-                    
-                    for websocket in (connections if isinstance(connections, list) else [connections]):
-                        try:
-                            await websocket.send_json(presence_message)
-                        except:
-                            pass
-
-            logger.info(f"✅ Broadcast presence update for user {user_id} ({status}) to all active connections")
+            # 2. User-level connections of users sharing a room or team
+            for other_user_id in audience_user_ids:
+                for websocket in self.user_connections.get(other_user_id, []):
+                    recipients[id(websocket)] = websocket
+            
+            if not recipients:
+                return
+            
+            frame = self._frame(presence_message)
+            for websocket in recipients.values():
+                self._enqueue(websocket, frame)
+            self.presence_frames_sent += len(recipients)
+            
+            logger.debug(f"✅ Presence update for user {user_id} ({presence_message.get('status')}) sent to {len(recipients)} connections")
             
         except Exception as e:
-            logger.error(f"❌ Failed to broadcast presence update: {e}")
+            logger.error(f"❌ Failed to deliver presence update: {e}")
 
     async def broadcast_to_users(self, user_ids: List[str], message: Dict[str, Any]):
         """
-        Broadcast a message to the user-level WebSockets of specific users
+        Broadcast a message to the user-level WebSockets of specific users (on every worker)
         
         Args:
             user_ids: List of user IDs to notify
             message: Message data to broadcast
         """
+        await self._publish("users", user_ids=list(user_ids), message=message)
+        await self._deliver_to_users(user_ids, message)
+    
+    async def send_to_user(self, user_id: str, message: Dict[str, Any]):
+        """Send a message to all user-level WebSockets of one user (on every worker)"""
+        await self.broadcast_to_users([user_id], message)
+    
+    async def _deliver_to_users(self, user_ids: List[str], message: Dict[str, Any]):
+        """Send a message to this process's user-level WebSockets of specific users"""
         if not hasattr(self, 'user_connections'):
             return
             
+        frame = self._frame(message)
         sent_count = 0
         for user_id in user_ids:
             if user_id in self.user_connections:
                 connections = self.user_connections[user_id]
                 for websocket in (connections if isinstance(connections, list) else [connections]):
-                    try:
-                        await websocket.send_json(message)
+                    if self._enqueue(websocket, frame):
                         sent_count += 1
-                    except:
-                        pass
         
         if sent_count > 0:
             logger.info(f"✅ Broadcast message type '{message.get('type')}' to {sent_count} user connections")
@@ -659,6 +805,26 @@ class WebSocketManager:
     def get_room_connection_count(self, room_id: str) -> int:
         """Get the number of connections in a specific room"""
         return len(self.room_connections.get(room_id, []))
+    
+    def get_presence_stats(self) -> Dict[str, Any]:
+        """Presence fan-out counters for this process"""
+        return {
+            "frames_sent": self.presence_frames_sent,
+            "updates_coalesced": self.presence_updates_coalesced,
+            "pending_updates": len(self._presence_timers),
+        }
+    
+    def get_send_queue_stats(self) -> Dict[str, Any]:
+        """Outbound queue depth and backpressure counters across connections"""
+        queues = list(self._send_queues.values())
+        return {
+            "connections": len(queues),
+            "queued_frames": sum(q.depth for q in queues),
+            "max_queue_depth": max((q.depth for q in queues), default=0),
+            "sent": sum(q.sent for q in queues),
+            "dropped": sum(q.dropped for q in queues),
+            "coalesced": sum(q.coalesced for q in queues),
+        }
 
 
 # Global WebSocket manager instance
@@ -0,0 +1,160 @@
+"""
+WebSocket send queue - bounded outbound queue and writer task per connection
+
+Broadcasts used to await send_text on each socket in turn, so one slow or half-dead
+client stalled delivery to every socket after it and blocked the caller. Each
+connection now gets its own queue drained by its own writer task; enqueueing never
+awaits the network.
+
+Backpressure when a queue is full:
+    drop_oldest - discard the oldest queued frame
+    coalesce    - like drop_oldest, and superseded status frames (same type and
+                  subject, e.g. progress for one document) are replaced in place
+                  while still queued
+    disconnect  - close the connection; the client reconnects and resyncs
+
+A send that does not complete within send_timeout marks the connection dead.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+# Message type -> field identifying the subject whose latest state supersedes older frames
+COALESCE_FIELDS = {
+    "processing_status_update": "document_id",
+    "document_status_update": "document_id",
+    "job_progress": "job_id",
+    "presence_update": "user_id",
+    "typing": "user_id",
+}
+
+
+def coalesce_key(message: Any) -> Optional[Hashable]:
+    """Key under which a queued message may be replaced by a newer one (None = never)"""
+    if not isinstance(message, dict):
+        return None
+    field = COALESCE_FIELDS.get(message.get("type"))
+    if field is None or message.get(field) is None:
+        return None
+    return (message["type"], message.get("room_id"), str(message[field]))
+
+
+class ConnectionSendQueue:
+    """Bounded outbound queue plus writer task for one WebSocket"""
+
+    def __init__(
+        self,
+        websocket: Any,
+        max_size: int,
+        policy: str,
+        send_timeout: float,
+        on_failure: Callable[[Any, str], None],
+    ):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown WebSocket backpressure policy: {policy}")
+        self.websocket = websocket
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self._on_failure = on_failure
+
+        # Entries are [coalesce_key, text] so a coalesced frame can be replaced in place
+        self._queue: Deque[List[Any]] = deque()
+        self._pending: Dict[Hashable, List[Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._close_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def offer(self, text: str, key: Optional[Hashable] = None) -> bool:
+        """Queue a frame without waiting; False if the connection is (now) closed"""
+        if self._closed:
+            return False
+
+        if self.policy != "coalesce":
+            key = None
+        if key is not None:
+            queued = self._pending.get(key)
+            if queued is not None:
+                queued[1] = text
+                self.coalesced += 1
+                return True
+
+        if len(self._queue) >= self.max_size:
+            if self.policy == "disconnect":
+                self._fail(f"send queue full ({self.max_size} frames)")
+                return False
+            oldest = self._queue.popleft()
+            if oldest[0] is not None and self._pending.get(oldest[0]) is oldest:
+                del self._pending[oldest[0]]
+            self.dropped += 1
+
+        entry = [key, text]
+        self._queue.append(entry)
+        if entry[0] is not None:
+            self._pending[entry[0]] = entry
+        self._wakeup.set()
+        return True
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                while not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                entry = self._queue.popleft()
+                if entry[0] is not None and self._pending.get(entry[0]) is entry:
+                    del self._pending[entry[0]]
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(entry[1])
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._fail(f"send timed out after {self.send_timeout}s")
+        except Exception as e:
+            self._fail(str(e) or type(e).__name__)
+
+    def _fail(self, reason: str) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._pending.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._close_task = asyncio.create_task(self._close_socket())
+        self._on_failure(self.websocket, reason)
+
+    async def _close_socket(self) -> None:
+        try:
+            await asyncio.wait_for(self.websocket.close(code=1013), timeout=1.0)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Stop the writer after the connection was disconnected normally"""
+        self._closed = True
+        self._queue.clear()
+        self._pending.clear()
+        self._task.cancel()
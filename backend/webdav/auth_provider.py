@@ -5,18 +5,84 @@ Implements WsgiDAV authentication using Plato's existing user database
 and authentication service.
 """
 
+import hashlib
+import hmac
 import logging
-from typing import Optional, Dict, Any
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from wsgidav.dc.base_dc import BaseDomainController
-import psycopg2
 from passlib.context import CryptContext
 
+from config import settings
+from webdav.db_pool import pooled_connection
+
 logger = logging.getLogger(__name__)
 
 # Password context for verification
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class VerifiedCredentialCache:
+    """
+    Short-lived cache of Basic credentials that passed bcrypt verification.
+    
+    Sync clients (Orgzly, beorg) resend credentials on every request, so a
+    PROPFIND burst would otherwise run bcrypt hundreds of times. Entries are
+    keyed by an HMAC of username and password under a per-process random key,
+    so plaintext passwords are never stored. Only successes are cached; a wrong
+    password always pays the full verification cost.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._key = secrets.token_bytes(32)
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _digest(self, username: str, password: str) -> bytes:
+        message = username.encode('utf-8') + b"\0" + password.encode('utf-8')
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+    
+    def get(self, username: str, password: str) -> Optional[Dict[str, Any]]:
+        digest = self._digest(username, password)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(entry[1])
+    
+    def put(self, username: str, password: str, user_info: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        digest = self._digest(username, password)
+        with self._lock:
+            self._entries[digest] = (time.monotonic() + self.ttl_seconds, dict(user_info))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every controller instance WsgiDAV creates in this process
+credential_cache = VerifiedCredentialCache(
+    ttl_seconds=settings.WEBDAV_AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.WEBDAV_AUTH_CACHE_SIZE
+)
+
+
 class PlatoAuthController(BaseDomainController):
     """
     Custom authentication controller for WsgiDAV that uses Plato's
@@ -85,20 +151,24 @@ class PlatoAuthController(BaseDomainController):
             bool: True if authentication successful, False otherwise
         """
         try:
-            logger.info(f"🔐 WebDAV auth attempt for user: {user_name}")
-            
-            # Verify credentials synchronously
-            user_info = self._verify_credentials_sync(user_name, password)
-            
-            if user_info:
+            user_info = credential_cache.get(user_name, password)
+            if user_info is None:
+                logger.info(f"🔐 WebDAV auth attempt for user: {user_name}")
+                
+                # Verify credentials synchronously
+                user_info = self._verify_credentials_sync(user_name, password)
+                
+                if not user_info:
+                    logger.warning(f"❌ WebDAV auth FAILED for user: {user_name}")
+                    return False
+                
                 logger.info(f"✅ WebDAV auth SUCCESS for user: {user_name}")
-                # Store user info in environ for later use
-                environ["webdav.auth.user_name"] = user_name
-                environ["webdav.auth.user_id"] = user_info['user_id']
-                return True
-            else:
-                logger.warning(f"❌ WebDAV auth FAILED for user: {user_name}")
-                return False
+                credential_cache.put(user_name, password, user_info)
+            
+            # Store user info in environ for later use
+            environ["webdav.auth.user_name"] = user_name
+            environ["webdav.auth.user_id"] = user_info['user_id']
+            return True
                 
         except Exception as e:
             logger.error(f"❌ WebDAV auth error for user {user_name}: {e}")
@@ -108,7 +178,7 @@ class PlatoAuthController(BaseDomainController):
     def _verify_credentials_sync(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         """
         Synchronous method to verify credentials against database.
-        Uses psycopg2 instead of asyncpg to avoid event loop issues.
+        Uses a pooled psycopg2 connection instead of asyncpg to avoid event loop issues.
         
         Args:
             username: Username to verify
@@ -117,55 +187,35 @@ class PlatoAuthController(BaseDomainController):
         Returns:
             dict: User info (user_id, username) if valid, None otherwise
         """
-        conn = None
         try:
-            logger.info(f"🔍 Connecting to database: {self.db_config['host']}:{self.db_config['port']}/{self.db_config['database']}")
-            
-            # Create synchronous database connection
-            conn = psycopg2.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            
-            logger.info(f"✅ Database connected")
-            
-            cur = conn.cursor()
-            
-            # Query database for user
-            logger.info(f"🔍 Querying for user: {username}")
-            cur.execute("""
-                SELECT user_id, username, password_hash, salt, is_active
-                FROM users
-                WHERE username = %s OR email = %s
-            """, (username, username))
-            
-            user_row = cur.fetchone()
-            cur.close()
+            with pooled_connection(self.db_config) as conn:
+                cur = conn.cursor()
+                
+                # Query database for user
+                cur.execute("""
+                    SELECT user_id, username, password_hash, salt, is_active
+                    FROM users
+                    WHERE username = %s OR email = %s
+                """, (username, username))
+                
+                user_row = cur.fetchone()
+                cur.close()
             
             if not user_row:
                 logger.warning(f"🔍 User not found in database: {username}")
                 return None
             
             user_id, db_username, password_hash, salt, is_active = user_row
-            logger.info(f"✅ User found: {db_username}, active: {is_active}")
             
             if not is_active:
                 logger.warning(f"🔍 User inactive: {username}")
                 return None
             
             # Verify password using passlib (same as main auth)
-            logger.info(f"🔍 Verifying password for user: {db_username}")
-            logger.info(f"🔍 Password hash starts with: {password_hash[:10] if password_hash else 'None'}...")
-            logger.info(f"🔍 Password length: {len(password)}")
-            
             is_valid = pwd_context.verify(password, password_hash)
-            logger.info(f"🔍 Password verification result: {is_valid}")
             
             if is_valid:
-                logger.info(f"✅ Password verified for user: {db_username}")
+                logger.debug(f"✅ Password verified for user: {db_username}")
                 return {
                     'user_id': user_id,
                     'username': db_username
@@ -178,9 +228,6 @@ class PlatoAuthController(BaseDomainController):
             logger.error(f"❌ Credential verification error: {e}")
             logger.exception("Full credential verification traceback:")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     def supports_http_digest_auth(self):
         """
@@ -0,0 +1,99 @@
+"""
+WebDAV Database Pool - Shared synchronous PostgreSQL connections
+
+WsgiDAV runs providers and the auth controller on Cheroot worker threads, so
+they use psycopg2 rather than asyncpg. Opening a fresh connection per lookup
+cost a TCP + auth handshake on every request of a sync burst; all WebDAV code
+now borrows from one thread-safe pool per database config.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+
+import psycopg2
+from psycopg2 import pool as pg_pool
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_pools: Dict[Tuple[Any, ...], "BoundedConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+class BoundedConnectionPool:
+    """
+    ThreadedConnectionPool that makes callers wait for a free connection
+    instead of raising PoolError when every connection is checked out.
+    """
+
+    def __init__(self, db_config: Dict[str, Any], max_connections: int):
+        self.max_connections = max(1, max_connections)
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._pool = pg_pool.ThreadedConnectionPool(
+            1,
+            self.max_connections,
+            host=db_config['host'],
+            port=db_config['port'],
+            user=db_config['user'],
+            password=db_config['password'],
+            database=db_config['database']
+        )
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection; it is rolled back (or discarded if broken) on return"""
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._pool.getconn()
+            yield conn
+        finally:
+            if conn is not None:
+                broken = bool(conn.closed)
+                if not broken:
+                    try:
+                        # End the implicit read transaction so no snapshot or locks linger
+                        conn.rollback()
+                    except psycopg2.Error:
+                        broken = True
+                self._pool.putconn(conn, close=broken)
+            self._slots.release()
+
+    def close(self) -> None:
+        self._pool.closeall()
+
+
+def get_sync_db_pool(db_config: Dict[str, Any]) -> BoundedConnectionPool:
+    """Shared pool for a WebDAV db_config dict (created on first use)"""
+    key = (
+        db_config['host'], db_config['port'], db_config['user'],
+        db_config['password'], db_config['database'],
+    )
+    with _pools_lock:
+        db_pool = _pools.get(key)
+        if db_pool is None:
+            db_pool = BoundedConnectionPool(db_config, settings.WEBDAV_DB_POOL_SIZE)
+            _pools[key] = db_pool
+            logger.info(
+                f"🔗 WebDAV connection pool created: {db_config['host']}:{db_config['port']}/"
+                f"{db_config['database']} (max {db_pool.max_connections})"
+            )
+        return db_pool
+
+
+@contextmanager
+def pooled_connection(db_config: Dict[str, Any]) -> Iterator[Any]:
+    """Borrow a pooled psycopg2 connection for db_config"""
+    with get_sync_db_pool(db_config).connection() as conn:
+        yield conn
+
+
+def close_sync_db_pools() -> None:
+    """Close every WebDAV pool (server shutdown)"""
+    with _pools_lock:
+        for db_pool in _pools.values():
+            db_pool.close()
+        _pools.clear()
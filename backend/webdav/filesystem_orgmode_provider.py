@@ -4,7 +4,8 @@ Filesystem-Based OrgMode WebDAV Provider - Document Integration (Synchronous)
 Provides WebDAV access to .org files stored in the uploads/ directory,
 using document_metadata table for organization and user isolation.
 
-Uses psycopg2 (synchronous) instead of asyncpg to avoid event loop conflicts.
+Uses pooled psycopg2 (synchronous) connections instead of asyncpg to avoid event loop conflicts.
+Listings come from a per-user in-memory snapshot (webdav.org_listing_cache).
 """
 
 import logging
@@ -12,16 +13,29 @@ import os
 import io
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-import psycopg2
 from wsgidav.dav_provider import DAVProvider, DAVCollection, DAVNonCollection
 from wsgidav.dav_error import DAVError, HTTP_FORBIDDEN, HTTP_NOT_FOUND, HTTP_CONFLICT
 
+from webdav.org_listing_cache import org_listing_cache
+
 logger = logging.getLogger(__name__)
 
 
+def _listing_snapshot(environ, user_id, db_config, uploads_dir):
+    """Listing snapshot for this request (version check once per request)"""
+    snapshot = environ.get('webdav.org_listing_snapshot')
+    if snapshot is None:
+        snapshot = org_listing_cache.get(user_id, db_config, uploads_dir)
+        environ['webdav.org_listing_snapshot'] = snapshot
+    return snapshot
+
+
 class OrgFileResource(DAVNonCollection):
     """
     Represents a single .org file from the uploads directory.
+    
+    Size, mtime and ETag come from the listing snapshot (stat taken when the
+    snapshot was built), so PROPFIND never touches the database or disk.
     """
     
     def __init__(self, path, environ, document_info, file_path):
@@ -31,13 +45,8 @@ class OrgFileResource(DAVNonCollection):
         self.document_id = document_info['document_id']
         
     def get_content_length(self):
-        """Return file size from filesystem"""
-        try:
-            if os.path.exists(self.file_path):
-                return os.path.getsize(self.file_path)
-        except Exception as e:
-            logger.error(f"❌ Error getting file size: {e}")
-        return 0
+        """Return file size from the listing snapshot"""
+        return self.document_info.get('file_size') or 0
     
     def get_content_type(self):
         """Return MIME type for org files"""
@@ -51,13 +60,18 @@ class OrgFileResource(DAVNonCollection):
         return None
     
     def get_last_modified(self):
-        """Return last modified date from filesystem"""
-        try:
-            if os.path.exists(self.file_path):
-                return os.path.getmtime(self.file_path)
-        except Exception as e:
-            logger.error(f"❌ Error getting modified time: {e}")
-        return None
+        """Return last modified date from the listing snapshot"""
+        return self.document_info.get('mtime')
+    
+    def support_etag(self):
+        return True
+    
+    def get_etag(self):
+        """Document ID + mtime + size: changes whenever the file content is rewritten"""
+        mtime = self.document_info.get('mtime')
+        if mtime is None:
+            return None
+        return f"{self.document_id}-{int(mtime * 1000)}-{self.get_content_length()}"
     
     def get_content(self):
         """Return file content as file-like object"""
@@ -87,113 +101,44 @@ class OrgModeFolderCollection(DAVCollection):
         self.user_id = user_id
         self.uploads_dir = uploads_dir
     
+    def _snapshot(self):
+        return _listing_snapshot(self.environ, self.user_id, self.db_config, self.uploads_dir)
+    
     def get_member_names(self):
         """Return list of org filenames in this category"""
-        conn = None
         try:
-            logger.info(f"📂 Listing files for category: '{self.category}', user_id: '{self.user_id}'")
-            
-            # Synchronous database connection
-            conn = psycopg2.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            
-            cur = conn.cursor()
-            
-            # Query documents with .org extension
-            query = """
-                SELECT filename, category
-                FROM document_metadata
-                WHERE user_id = %s
-                  AND filename LIKE '%.org'
-                  AND (category = %s OR (%s = 'uncategorized' AND category IS NULL))
-                ORDER BY filename
-            """
-            cur.execute(query, (self.user_id, self.category, self.category))
-            rows = cur.fetchall()
-            cur.close()
-            
-            logger.info(f"📂 Found {len(rows)} org files in category '{self.category}'")
-            for row in rows:
-                logger.info(f"   - {row[0]} (category: {row[1]})")
-            
-            return [row[0] for row in rows]
+            names = self._snapshot().file_names(self.category)
+            logger.debug(f"📂 Found {len(names)} org files in category '{self.category}' for user '{self.user_id}'")
+            return names
                 
         except Exception as e:
             logger.error(f"❌ Error getting org file names: {e}")
             logger.exception("Full traceback:")
             return []
-        finally:
-            if conn:
-                conn.close()
     
     def get_member(self, name):
         """Get a specific org file by filename"""
-        conn = None
         try:
             if not name.endswith('.org'):
                 raise DAVError(HTTP_NOT_FOUND, f"Not an org file: {name}")
             
-            conn = psycopg2.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            
-            cur = conn.cursor()
-            
-            # Query document by filename
-            query = """
-                SELECT document_id, filename, title, category, 
-                       file_path, upload_date, user_id
-                FROM document_metadata
-                WHERE user_id = %s
-                  AND filename = %s
-                  AND filename LIKE '%.org'
-            """
-            cur.execute(query, (self.user_id, name))
-            row = cur.fetchone()
-            cur.close()
-            
-            if not row:
+            doc_info = self._snapshot().get_file(self.category, name)
+            if not doc_info:
                 raise DAVError(HTTP_NOT_FOUND, f"Org file not found: {name}")
             
-            # Convert tuple to dict
-            doc_info = {
-                'document_id': row[0],
-                'filename': row[1],
-                'title': row[2],
-                'category': row[3],
-                'file_path': row[4],
-                'upload_date': row[5],
-                'user_id': row[6]
-            }
-            
-            # Construct file path in uploads directory
-            file_path = os.path.join(self.uploads_dir, doc_info['filename'])
-            
-            if not os.path.exists(file_path):
-                logger.error(f"❌ File exists in DB but not on disk: {file_path}")
+            if doc_info['mtime'] is None:
+                logger.error(f"❌ File exists in DB but not on disk: {doc_info['disk_path']}")
                 raise DAVError(HTTP_NOT_FOUND, f"File not found on disk: {name}")
             
             # Return resource
             resource_path = os.path.join(self.path, name)
-            return OrgFileResource(resource_path, self.environ, doc_info, file_path)
+            return OrgFileResource(resource_path, self.environ, doc_info, doc_info['disk_path'])
                 
         except DAVError:
             raise
         except Exception as e:
             logger.error(f"❌ Error getting org file {name}: {e}")
             raise DAVError(HTTP_NOT_FOUND, f"Error accessing file: {name}")
-        finally:
-            if conn:
-                conn.close()
 
 
 class OrgModeRootCollection(DAVCollection):
@@ -209,52 +154,14 @@ class OrgModeRootCollection(DAVCollection):
         self.user_id = environ.get('webdav.auth.user_id', 'unknown')
     
     def get_member_names(self):
-        """Return list of category folders"""
-        conn = None
+        """Return list of category folders (at least 'uncategorized')"""
         try:
-            logger.info(f"📂 ROOT: Listing categories for user_id: '{self.user_id}'")
-            
-            conn = psycopg2.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            
-            cur = conn.cursor()
-            
-            # Get distinct categories for this user's org files
-            query = """
-                SELECT DISTINCT 
-                    COALESCE(category, 'uncategorized') as folder_name
-                FROM document_metadata
-                WHERE user_id = %s
-                  AND filename LIKE '%.org'
-                ORDER BY folder_name
-            """
-            cur.execute(query, (self.user_id,))
-            rows = cur.fetchall()
-            cur.close()
-            
-            logger.info(f"📂 ROOT: Found {len(rows)} categories")
-            for row in rows:
-                logger.info(f"   - Category: {row[0]}")
-            
-            if not rows:
-                # Return at least uncategorized folder
-                logger.info(f"📂 ROOT: No categories found, returning default 'uncategorized'")
-                return ['uncategorized']
-            
-            return [row[0] for row in rows]
+            return _listing_snapshot(self.environ, self.user_id, self.db_config, self.uploads_dir).categories
                 
         except Exception as e:
             logger.error(f"❌ Error getting category names: {e}")
             logger.exception("Full traceback:")
             return ['uncategorized']
-        finally:
-            if conn:
-                conn.close()
     
     def get_member(self, name):
         """Get a category/folder collection"""
@@ -289,21 +196,21 @@ class FilesystemOrgModeDAVProvider(DAVProvider):
         """
         Return DAVResource for the given path.
         """
-        logger.info(f"📂 get_resource_inst called with path: '{path}'")
-        logger.info(f"📂 user_id from environ: {environ.get('webdav.auth.user_id', 'NOT SET')}")
+        logger.debug(f"📂 get_resource_inst called with path: '{path}'")
+        logger.debug(f"📂 user_id from environ: {environ.get('webdav.auth.user_id', 'NOT SET')}")
         
         # Strip /orgmode prefix if present (from nginx routing)
         if path.startswith('/orgmode'):
             path = path[8:]  # Remove '/orgmode'
-            logger.info(f"📂 Stripped /orgmode prefix, new path: '{path}'")
+            logger.debug(f"📂 Stripped /orgmode prefix, new path: '{path}'")
         
         # Normalize path
         path = path.rstrip('/')
-        logger.info(f"📂 Normalized path: '{path}'")
+        logger.debug(f"📂 Normalized path: '{path}'")
         
         # Root collection
         if path == '' or path == '/':
-            logger.info(f"📂 Returning root collection for path: '{path}'")
+            logger.debug(f"📂 Returning root collection for path: '{path}'")
             return OrgModeRootCollection('/', environ, self.db_config, self.uploads_dir)
         
         # Split path into parts
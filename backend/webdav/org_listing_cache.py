@@ -0,0 +1,152 @@
+"""
+Org Listing Cache - Per-user snapshot of org-mode files for the WebDAV provider
+
+A mobile sync walks the root, every category collection and every file
+(PROPFIND Depth: 1, then GET/HEAD), so listing straight from the database cost
+one query per collection and per file. One query now builds a snapshot of the
+user's .org files (with size/mtime taken from disk) that serves listings,
+get_member and ETag/last-modified from memory.
+
+Snapshots are validated against version counters in Redis that the backend
+bumps on document writes and file watcher events (utils.webdav_listing_version).
+If Redis is unreachable, a snapshot is only trusted for a short fallback age.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from utils.redis_backoff import RedisBackoff
+from utils.webdav_listing_version import GLOBAL_VERSION_KEY, user_version_key
+from webdav.db_pool import pooled_connection
+
+logger = logging.getLogger(__name__)
+
+UNCATEGORIZED = "uncategorized"
+
+
+class OrgListingSnapshot:
+    """Immutable view of one user's .org files grouped by category folder"""
+
+    def __init__(self, documents: List[Dict[str, Any]], version: Optional[Tuple[int, int]]):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.files: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for doc in documents:
+            folder = doc['category'] or UNCATEGORIZED
+            self.files.setdefault(folder, {})[doc['filename']] = doc
+        self.categories = sorted(self.files) or [UNCATEGORIZED]
+
+    def file_names(self, category: str) -> List[str]:
+        return sorted(self.files.get(category, {}))
+
+    def get_file(self, category: str, filename: str) -> Optional[Dict[str, Any]]:
+        return self.files.get(category, {}).get(filename)
+
+
+class OrgListingCache:
+    """Per-user OrgListingSnapshot cache shared by all WsgiDAV worker threads"""
+
+    def __init__(self, fallback_max_age: float, max_age: float):
+        self.fallback_max_age = fallback_max_age
+        self.max_age = max_age
+        self._snapshots: Dict[str, OrgListingSnapshot] = {}
+        self._lock = threading.Lock()
+        # Shared by every WsgiDAV thread; snapshots use fallback_max_age while Redis is bypassed
+        self._redis = RedisBackoff("WebDAV listing versions", use_asyncio=False, socket_timeout=0.5)
+
+        # Statistics
+        self.hits = 0
+        self.rebuilds = 0
+
+    def _current_version(self, user_id: str) -> Optional[Tuple[int, int]]:
+        """(global, user) counters, or None when Redis cannot be reached"""
+        client = self._redis.get_client()
+        if client is None:
+            return None
+        try:
+            global_version, user_version = client.mget(GLOBAL_VERSION_KEY, user_version_key(user_id))
+            return int(global_version or 0), int(user_version or 0)
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+            return None
+
+    def get(self, user_id: str, db_config: Dict[str, Any], uploads_dir: str) -> OrgListingSnapshot:
+        """Current snapshot for user_id, rebuilt if its versions moved or it aged out"""
+        version = self._current_version(user_id)
+        max_age = self.max_age if version is not None else self.fallback_max_age
+        with self._lock:
+            snapshot = self._snapshots.get(user_id)
+        if (
+            snapshot is not None
+            and snapshot.version == version
+            and time.monotonic() - snapshot.built_at < max_age
+        ):
+            self.hits += 1
+            return snapshot
+
+        snapshot = OrgListingSnapshot(self._load_documents(user_id, db_config, uploads_dir), version)
+        with self._lock:
+            self._snapshots[user_id] = snapshot
+        self.rebuilds += 1
+        logger.info(f"📂 Org listing snapshot rebuilt for user {user_id}: {len(snapshot.categories)} folders")
+        return snapshot
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(user_id, None)
+
+    @staticmethod
+    def _load_documents(user_id: str, db_config: Dict[str, Any], uploads_dir: str) -> List[Dict[str, Any]]:
+        with pooled_connection(db_config) as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT document_id, filename, title, category,
+                       file_path, upload_date, user_id
+                FROM document_metadata
+                WHERE user_id = %s
+                  AND filename LIKE '%%.org'
+            """, (user_id,))
+            rows = cur.fetchall()
+            cur.close()
+
+        documents = []
+        for row in rows:
+            doc = {
+                'document_id': row[0],
+                'filename': row[1],
+                'title': row[2],
+                'category': row[3],
+                'file_path': row[4],
+                'upload_date': row[5],
+                'user_id': row[6],
+                'disk_path': os.path.join(uploads_dir, row[1]),
+            }
+            try:
+                stat = os.stat(doc['disk_path'])
+                doc['file_size'] = stat.st_size
+                doc['mtime'] = stat.st_mtime
+            except OSError:
+                # Listed in the database but missing on disk
+                doc['file_size'] = None
+                doc['mtime'] = None
+            documents.append(doc)
+        return documents
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            users = len(self._snapshots)
+        return {"users": users, "hits": self.hits, "rebuilds": self.rebuilds}
+
+
+# Shared by every provider/collection instance in the WebDAV process
+org_listing_cache = OrgListingCache(
+    fallback_max_age=settings.WEBDAV_ORG_LISTING_FALLBACK_SECONDS,
+    max_age=settings.WEBDAV_ORG_LISTING_MAX_AGE_SECONDS
+)
@@ -12,6 +12,8 @@ from pathlib import Path
 from wsgidav.dav_provider import DAVProvider
 from wsgidav.fs_dav_provider import FilesystemProvider, FolderResource, FileResource
 
+from webdav.db_pool import pooled_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -228,29 +230,18 @@ class UserFilteredFilesystemProvider(DAVProvider):
     
     def _get_username_from_db_sync(self, user_id: str) -> str:
         """Get username from database (synchronous)"""
-        import psycopg2
-        conn = None
         try:
-            conn = psycopg2.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            cur = conn.cursor()
-            cur.execute("SELECT username FROM users WHERE user_id = %s", (user_id,))
-            row = cur.fetchone()
-            cur.close()
+            with pooled_connection(self.db_config) as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT username FROM users WHERE user_id = %s", (user_id,))
+                row = cur.fetchone()
+                cur.close()
             username = row[0] if row else user_id
             logger.info(f"📂 Resolved user_id {user_id} to username: {username}")
             return username
         except Exception as e:
             logger.error(f"❌ Failed to get username for {user_id}: {e}")
             return user_id
-        finally:
-            if conn:
-                conn.close()
     
     def _get_user_provider(self, user_id: str, environ=None) -> FilesystemProvider:
         """
@@ -21,6 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from webdav.auth_provider import PlatoAuthController
 from webdav.orgmode_provider import OrgModeDAVProvider
 from webdav.config import create_webdav_config, get_logging_config
+from webdav.db_pool import close_sync_db_pools
 from config import settings
 
 # **ROOSEVELT'S LOGGING COUP D'ÉTAT!**
@@ -200,6 +201,7 @@ def main():
         sys.exit(1)
     finally:
         # Cleanup
+        close_sync_db_pools()
         if 'db_pool' in locals():
             loop.run_until_complete(db_pool.close())
         loop.close()
@@ -19,7 +19,10 @@ class Settings:
     DEFAULT_MAX_CONTENT_LENGTH: int = int(os.getenv("DEFAULT_MAX_CONTENT_LENGTH", "1000000"))
     
     # Browser Configuration
-    BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "5"))
+    BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "5"))  # Max browsers launched on demand
+    PAGES_PER_BROWSER: int = int(os.getenv("PAGES_PER_BROWSER", "4"))  # Busy threshold before launching another
+    BROWSER_RECYCLE_AFTER_PAGES: int = int(os.getenv("BROWSER_RECYCLE_AFTER_PAGES", "200"))  # 0 = never recycle
+    MAX_CONCURRENT_PER_DOMAIN: int = int(os.getenv("MAX_CONCURRENT_PER_DOMAIN", "2"))
     HEADLESS: bool = os.getenv("HEADLESS", "true").lower() == "true"
     
     # Performance Tuning
@@ -5,11 +5,9 @@ Crawl4AI gRPC Service Implementation
 import logging
 import time
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from urllib.parse import urlparse
 
-from crawl4ai import AsyncWebCrawler
-
 # Try to import AdaptiveCrawler - the proper API for adaptive crawling
 try:
     from crawl4ai import AdaptiveCrawler, AdaptiveConfig
@@ -22,6 +20,7 @@ except ImportError:
 
 from config.settings import settings
 from service.crawl_strategies import get_extraction_strategy
+from service.crawler_pool import CrawlerPool
 
 logger = logging.getLogger(__name__)
 
@@ -30,18 +29,22 @@ class CrawlServiceImplementation:
     """gRPC service implementation for Crawl4AI"""
     
     def __init__(self):
-        self.crawler: Optional[AsyncWebCrawler] = None
+        self.pool = CrawlerPool(
+            max_browsers=settings.BROWSER_POOL_SIZE,
+            pages_per_browser=settings.PAGES_PER_BROWSER,
+            recycle_after_pages=settings.BROWSER_RECYCLE_AFTER_PAGES,
+            max_concurrent_pages=settings.MAX_CONCURRENT_CRAWLS,
+            max_per_domain=settings.MAX_CONCURRENT_PER_DOMAIN,
+            headless=settings.HEADLESS
+        )
         self._initialized = False
     
     async def initialize(self):
-        """Initialize the crawler"""
+        """Initialize the crawler pool"""
         try:
             if not self._initialized:
                 logger.info("Initializing Crawl4AI service...")
-                self.crawler = AsyncWebCrawler(
-                    headless=settings.HEADLESS
-                )
-                await self.crawler.__aenter__()
+                await self.pool.start()
                 self._initialized = True
                 logger.info("Crawl4AI service initialized successfully")
         except Exception as e:
@@ -50,14 +53,85 @@ class CrawlServiceImplementation:
     
     async def cleanup(self):
         """Cleanup crawler resources"""
-        if self.crawler and self._initialized:
+        if self._initialized:
             try:
-                await self.crawler.__aexit__(None, None, None)
+                await self.pool.close()
                 self._initialized = False
                 logger.info("Crawl4AI service cleaned up")
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
     
+    def _build_run_config(self, request, default_page_timeout: Optional[int]) -> Any:
+        """
+        Build a CrawlerRunConfig from a CrawlRequest/CrawlManyRequest
+        
+        Args:
+            request: CrawlRequest or CrawlManyRequest protobuf message
+            default_page_timeout: Page timeout in milliseconds when the request sets none
+        """
+        # Use CrawlerRunConfig per new API: https://docs.crawl4ai.com/api/arun/
+        from crawl4ai import CrawlerRunConfig, CacheMode
+        
+        # Prepare extraction strategy if provided
+        extraction_strategy = None
+        if request.extraction_strategy:
+            extraction_strategy = get_extraction_strategy(
+                request.extraction_strategy,
+                request.chunking_strategy if request.chunking_strategy else "RegexChunking",
+                10,  # word_count_threshold
+                request.llm_question if request.llm_question else None
+            )
+        
+        # Create CrawlerRunConfig with valid parameters only
+        config = CrawlerRunConfig(
+            cache_mode=CacheMode.ENABLED,
+            css_selector=request.css_selector if request.css_selector else None,
+            word_count_threshold=10,
+            page_timeout=(request.timeout_seconds * 1000) if request.timeout_seconds and request.timeout_seconds > 0 else default_page_timeout,
+            extraction_strategy=extraction_strategy,
+            scan_full_page=True  # Automatically handle infinite scroll pages
+        )
+        
+        # Handle virtual scroll via page interaction strategy if requested
+        if request.virtual_scroll:
+            try:
+                from crawl4ai.page_interaction_strategy import VirtualScrollStrategy
+                scroll_delay = request.scroll_delay if request.scroll_delay > 0 else 1.0
+                config.page_interaction_strategy = VirtualScrollStrategy(delay=scroll_delay)
+            except ImportError:
+                logger.warning("VirtualScrollStrategy not available, virtual scroll disabled")
+                # Fallback: try setting via js_code
+                try:
+                    config.js_code = "window.scrollTo(0, document.body.scrollHeight); await new Promise(r => setTimeout(r, 1000));"
+                except:
+                    logger.warning("Could not configure virtual scroll")
+        
+        # Handle fit_markdown if requested
+        # Per docs: https://docs.crawl4ai.com/core/fit-markdown/
+        # Fit markdown is configured via content_filter with DefaultMarkdownGenerator
+        if request.use_fit_markdown:
+            try:
+                from crawl4ai.content_filter_strategy import PruningContentFilter
+                from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+                
+                # Create pruning filter for fit markdown
+                prune_filter = PruningContentFilter(
+                    threshold=0.48,  # Default threshold - removes low-value content
+                    threshold_type="dynamic",  # Adjust based on tag type, text density
+                    min_word_threshold=5  # Ignore nodes with <5 words
+                )
+                
+                # Create markdown generator with pruning filter
+                md_generator = DefaultMarkdownGenerator(content_filter=prune_filter)
+                config.markdown_generator = md_generator
+                
+                logger.debug("✅ Fit markdown configured with PruningContentFilter")
+            except ImportError as e:
+                logger.warning(f"⚠️ Could not configure fit markdown: {e}, using default markdown")
+                # Don't set any markdown generator - let Crawl4AI use default
+        
+        return config
+    
     async def crawl(self, request) -> Any:
         """
         Single URL crawl
@@ -78,69 +152,11 @@ class CrawlServiceImplementation:
             
             logger.info(f"Crawling URL: {request.url} with strategy: {request.extraction_strategy}")
             
-            # Use CrawlerRunConfig per new API: https://docs.crawl4ai.com/api/arun/
-            from crawl4ai import CrawlerRunConfig, CacheMode
-            
-            # Prepare extraction strategy if provided
-            extraction_strategy = None
-            if request.extraction_strategy:
-                extraction_strategy = get_extraction_strategy(
-                    request.extraction_strategy,
-                    request.chunking_strategy if request.chunking_strategy else "RegexChunking",
-                    10,  # word_count_threshold
-                    request.llm_question if request.llm_question else None
-                )
-            
-            # Create CrawlerRunConfig with valid parameters only
-            config = CrawlerRunConfig(
-                cache_mode=CacheMode.ENABLED,
-                css_selector=request.css_selector if request.css_selector else None,
-                word_count_threshold=10,
-                page_timeout=(request.timeout_seconds * 1000) if request.timeout_seconds and request.timeout_seconds > 0 else (settings.DEFAULT_TIMEOUT_SECONDS * 1000),
-                extraction_strategy=extraction_strategy,
-                scan_full_page=True  # Automatically handle infinite scroll pages
-            )
-            
-            # Handle virtual scroll via page interaction strategy if requested
-            if request.virtual_scroll:
-                try:
-                    from crawl4ai.page_interaction_strategy import VirtualScrollStrategy
-                    scroll_delay = request.scroll_delay if request.scroll_delay > 0 else 1.0
-                    config.page_interaction_strategy = VirtualScrollStrategy(delay=scroll_delay)
-                except ImportError:
-                    logger.warning("VirtualScrollStrategy not available, virtual scroll disabled")
-                    # Fallback: try setting via js_code
-                    try:
-                        config.js_code = "window.scrollTo(0, document.body.scrollHeight); await new Promise(r => setTimeout(r, 1000));"
-                    except:
-                        logger.warning("Could not configure virtual scroll")
-            
-            # Handle fit_markdown if requested
-            # Per docs: https://docs.crawl4ai.com/core/fit-markdown/
-            # Fit markdown is configured via content_filter with DefaultMarkdownGenerator
-            if request.use_fit_markdown:
-                try:
-                    from crawl4ai.content_filter_strategy import PruningContentFilter
-                    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
-                    
-                    # Create pruning filter for fit markdown
-                    prune_filter = PruningContentFilter(
-                        threshold=0.48,  # Default threshold - removes low-value content
-                        threshold_type="dynamic",  # Adjust based on tag type, text density
-                        min_word_threshold=5  # Ignore nodes with <5 words
-                    )
-                    
-                    # Create markdown generator with pruning filter
-                    md_generator = DefaultMarkdownGenerator(content_filter=prune_filter)
-                    config.markdown_generator = md_generator
-                    
-                    logger.debug("✅ Fit markdown configured with PruningContentFilter")
-                except ImportError as e:
-                    logger.warning(f"⚠️ Could not configure fit markdown: {e}, using default markdown")
-                    # Don't set any markdown generator - let Crawl4AI use default
+            config = self._build_run_config(request, settings.DEFAULT_TIMEOUT_SECONDS * 1000)
             
             # Execute crawl with new API: arun(url, config)
-            result = await self.crawler.arun(url=request.url, config=config)
+            async with self.pool.lease(request.url) as crawler:
+                result = await crawler.arun(url=request.url, config=config)
             
             if not result or not result.success:
                 error_msg = result.error_message if result and hasattr(result, 'error_message') else "Crawl failed"
@@ -238,12 +254,160 @@ class CrawlServiceImplementation:
                 error=str(e)
             )
     
+    def _many_result_response(self, url: str, result, request, fetch_time: float) -> Any:
+        """Convert one crawl4ai result to a CrawlResponse for CrawlMany/StreamCrawlMany"""
+        from protos import crawl_service_pb2
+        
+        if not result or not result.success:
+            error_msg = result.error_message if result and hasattr(result, 'error_message') else "Crawl failed"
+            logger.warning(f"Crawl failed for {url}: {error_msg}")
+            return crawl_service_pb2.CrawlResponse(
+                success=False,
+                url=url,
+                error=error_msg,
+                fetch_time_seconds=fetch_time
+            )
+        
+        # Extract content - prefer fit_markdown if available
+        # Per docs: https://docs.crawl4ai.com/core/fit-markdown/
+        content = ""
+        if request.use_fit_markdown and hasattr(result, 'markdown') and hasattr(result.markdown, 'fit_markdown'):
+            content = result.markdown.fit_markdown or result.markdown.raw_markdown or ""
+        elif hasattr(result, 'markdown'):
+            if hasattr(result.markdown, 'raw_markdown'):
+                content = result.markdown.raw_markdown or ""
+            else:
+                content = result.markdown or ""
+        else:
+            content = result.text or ""
+        
+        # Truncate if needed
+        max_length = request.max_content_length if request.max_content_length else settings.DEFAULT_MAX_CONTENT_LENGTH
+        if len(content) > max_length:
+            content = content[:max_length]
+        
+        # Extract metadata
+        metadata = {}
+        if result.metadata:
+            metadata = {
+                "title": str(result.metadata.get("title", "")),
+                "description": str(result.metadata.get("description", "")),
+                "author": str(result.metadata.get("author", "")),
+                "keywords": str(result.metadata.get("keywords", "")),
+                "language": str(result.metadata.get("language", "")),
+                "published_time": str(result.metadata.get("published_time", "")),
+                "modified_time": str(result.metadata.get("modified_time", ""))
+            }
+        
+        # Extract links
+        links = []
+        if result.links and hasattr(result.links, '__iter__'):
+            links = list(result.links)[:50]
+        
+        # Extract images
+        images = []
+        if result.media and isinstance(result.media, dict):
+            img_list = result.media.get("images", [])
+            if isinstance(img_list, (list, tuple)):
+                images = list(img_list)[:20]
+        
+        # Extract markdown (prefer fit_markdown if available)
+        markdown_out = ""
+        if hasattr(result, 'markdown'):
+            if hasattr(result.markdown, 'fit_markdown'):
+                markdown_out = str(result.markdown.fit_markdown or result.markdown.raw_markdown or "")
+            elif hasattr(result.markdown, 'raw_markdown'):
+                markdown_out = str(result.markdown.raw_markdown or "")
+            else:
+                markdown_out = str(result.markdown or "")
+        
+        # Ensure all values are proper types for protobuf
+        html_content = str(result.html or "") if hasattr(result, 'html') else ""
+        content_str = str(content) if content else ""
+        
+        # Ensure metadata values are strings
+        metadata_dict = {}
+        for k, v in metadata.items():
+            metadata_dict[str(k)] = str(v) if v is not None else ""
+        
+        # Ensure links and images are lists of strings
+        links_list = [str(link) for link in links if link]
+        images_list = [str(img) for img in images if img]
+        
+        return crawl_service_pb2.CrawlResponse(
+            success=True,
+            url=str(url),
+            title=str(metadata.get("title", "No title")),
+            content=content_str,
+            markdown=str(markdown_out),
+            html=html_content,
+            metadata=metadata_dict,
+            links=links_list,
+            images=images_list,
+            content_length=len(content_str),
+            fetch_time_seconds=fetch_time,
+            status_code=int(result.status_code) if hasattr(result, 'status_code') and result.status_code else 200,
+            extracted_content=str(result.extracted_content) if hasattr(result, 'extracted_content') and result.extracted_content else None
+        )
+    
+    async def stream_crawl_many(self, request) -> AsyncIterator[Any]:
+        """
+        Crawl many URLs, yielding each page as soon as it finishes
+        
+        Pages are leased from the crawler pool (global and per-domain caps apply);
+        request.max_concurrent further limits how many pages of this request run at once.
+        
+        Args:
+            request: CrawlManyRequest protobuf message
+            
+        Yields:
+            CrawlManyStreamResult protobuf messages in completion order
+        """
+        from protos import crawl_service_pb2
+        
+        if not self._initialized:
+            await self.initialize()
+        
+        urls = list(request.urls)
+        max_concurrent = request.max_concurrent if request.max_concurrent > 0 else settings.MAX_CONCURRENT_CRAWLS
+        config = self._build_run_config(request, None)
+        request_slots = asyncio.Semaphore(max_concurrent)
+        
+        logger.info(f"Streaming crawl of {len(urls)} URLs with max_concurrent={max_concurrent}")
+        
+        async def crawl_one(index: int, url: str):
+            async with request_slots:
+                page_start = time.time()
+                try:
+                    async with self.pool.lease(url) as crawler:
+                        result = await crawler.arun(url=url, config=config)
+                    response = self._many_result_response(url, result, request, time.time() - page_start)
+                except Exception as e:
+                    logger.warning(f"Crawl failed for {url}: {e}")
+                    response = crawl_service_pb2.CrawlResponse(
+                        success=False,
+                        url=url,
+                        error=str(e),
+                        fetch_time_seconds=time.time() - page_start
+                    )
+                return crawl_service_pb2.CrawlManyStreamResult(index=index, result=response)
+        
+        tasks = [asyncio.create_task(crawl_one(index, url)) for index, url in enumerate(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client disconnected or the caller stopped early: free the browsers
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     async def crawl_many(self, request) -> Any:
         """
-        Parallel multi-URL crawl using Crawl4AI's native arun_many()
+        Parallel multi-URL crawl, returned as a single response
         
-        This uses Crawl4AI's optimized parallel crawling with built-in dispatcher
-        management, which is more efficient than manual asyncio.gather()
+        Built on stream_crawl_many (pooled browsers, per-domain caps); results are
+        returned in request order.
         
         Args:
             request: CrawlManyRequest protobuf message
@@ -254,235 +418,18 @@ class CrawlServiceImplementation:
         from protos import crawl_service_pb2
         
         start_time = time.time()
-        max_concurrent = request.max_concurrent if request.max_concurrent > 0 else settings.MAX_CONCURRENT_CRAWLS
         
         try:
-            if not self._initialized:
-                await self.initialize()
-            
-            logger.info(f"Crawling {len(request.urls)} URLs using Crawl4AI arun_many() with max_concurrent={max_concurrent}")
-            
-            # Use Crawl4AI's native arun_many() with proper CrawlerRunConfig
-            # According to docs: https://docs.crawl4ai.com/api/arun_many/
-            # All parameters go in CrawlerRunConfig, not as kwargs
-            try:
-                from crawl4ai import CrawlerRunConfig, CacheMode
-                
-                # Prepare extraction strategy if provided
-                extraction_strategy = None
-                if request.extraction_strategy:
-                    extraction_strategy = get_extraction_strategy(
-                        request.extraction_strategy,
-                        request.chunking_strategy or "RegexChunking",
-                        10,  # word_count_threshold
-                        request.llm_question if request.llm_question else None
-                    )
-                
-                # Create CrawlerRunConfig with valid parameters only
-                # Note: virtual_scroll and scroll_delay are not CrawlerRunConfig parameters
-                # They may need to be set via page interaction strategies or kwargs
-                config = CrawlerRunConfig(
-                    # Cache settings
-                    cache_mode=CacheMode.ENABLED,
-                    
-                    # Content selection
-                    css_selector=request.css_selector if request.css_selector else None,
-                    word_count_threshold=10,
-                    
-                    # Timeout (in milliseconds)
-                    page_timeout=(request.timeout_seconds * 1000) if request.timeout_seconds and request.timeout_seconds > 0 else None,
-                    
-                    # Extraction strategy
-                    extraction_strategy=extraction_strategy,
-                    
-                    # Automatic infinite scroll handling
-                    scan_full_page=True  # Automatically handle infinite scroll pages
-                )
-                
-                # Handle virtual scroll via page interaction if requested
-                # Virtual scroll is typically handled via page interaction strategies
-                if request.virtual_scroll:
-                    try:
-                        from crawl4ai.page_interaction_strategy import VirtualScrollStrategy
-                        scroll_delay = request.scroll_delay if request.scroll_delay > 0 else 1.0
-                        config.page_interaction_strategy = VirtualScrollStrategy(delay=scroll_delay)
-                    except ImportError:
-                        logger.warning("VirtualScrollStrategy not available, virtual scroll disabled")
-                        # Fallback: try setting via js_code
-                        try:
-                            config.js_code = "window.scrollTo(0, document.body.scrollHeight); await new Promise(r => setTimeout(r, 1000));"
-                        except:
-                            logger.warning("Could not configure virtual scroll")
-                
-                # Handle fit_markdown if requested
-                # Per docs: https://docs.crawl4ai.com/core/fit-markdown/
-                # Fit markdown is configured via content_filter with DefaultMarkdownGenerator
-                if request.use_fit_markdown:
-                    try:
-                        from crawl4ai.content_filter_strategy import PruningContentFilter
-                        from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
-                        
-                        # Create pruning filter for fit markdown
-                        prune_filter = PruningContentFilter(
-                            threshold=0.48,  # Default threshold - removes low-value content
-                            threshold_type="dynamic",  # Adjust based on tag type, text density
-                            min_word_threshold=5  # Ignore nodes with <5 words
-                        )
-                        
-                        # Create markdown generator with pruning filter
-                        md_generator = DefaultMarkdownGenerator(content_filter=prune_filter)
-                        config.markdown_generator = md_generator
-                        
-                        logger.debug("✅ Fit markdown configured with PruningContentFilter")
-                    except ImportError as e:
-                        logger.warning(f"⚠️ Could not configure fit markdown: {e}, using default markdown")
-                        # Don't set any markdown generator - let Crawl4AI use default
-                
-                # Optional: Use a dispatcher for advanced concurrency control
-                dispatcher = None
-                try:
-                    from crawl4ai.dispatcher import MemoryAdaptiveDispatcher
-                    # Use memory-adaptive dispatcher for optimal resource management
-                    dispatcher = MemoryAdaptiveDispatcher(
-                        memory_threshold_percent=70.0,
-                        max_session_permit=max_concurrent
-                    )
-                except ImportError:
-                    # Fallback: dispatcher not available, arun_many will use default
-                    logger.debug("MemoryAdaptiveDispatcher not available, using default dispatcher")
-                
-                # Call native arun_many() - this is the optimized parallel method
-                # Per docs: arun_many(urls, config, dispatcher)
-                if dispatcher:
-                    results = await self.crawler.arun_many(
-                        urls=request.urls,
-                        config=config,
-                        dispatcher=dispatcher
-                    )
-                else:
-                    results = await self.crawler.arun_many(
-                        urls=request.urls,
-                        config=config
-                    )
-                
-            except AttributeError:
-                # Fallback if arun_many doesn't exist in this Crawl4AI version
-                logger.warning("arun_many() not available, falling back to manual parallelization")
-                results = []
-                for url in request.urls:
-                    kwargs = {**common_kwargs, "url": url}
-                    result = await self.crawler.arun(**kwargs)
-                    results.append(result)
-            
-            # Process results from arun_many()
-            crawl_responses = []
-            successful = 0
-            failed = 0
-            total_content_length = 0
-            
-            for i, result in enumerate(results):
-                if not result or not result.success:
-                    error_msg = result.error_message if result and hasattr(result, 'error_message') else "Crawl failed"
-                    logger.warning(f"Crawl failed for {request.urls[i]}: {error_msg}")
-                    crawl_responses.append(
-                        crawl_service_pb2.CrawlResponse(
-                            success=False,
-                            url=request.urls[i],
-                            error=error_msg
-                        )
-                    )
-                    failed += 1
-                    continue
-                
-                # Extract content - prefer fit_markdown if available
-                # Per docs: https://docs.crawl4ai.com/core/fit-markdown/
-                content = ""
-                if request.use_fit_markdown and hasattr(result, 'markdown') and hasattr(result.markdown, 'fit_markdown'):
-                    content = result.markdown.fit_markdown or result.markdown.raw_markdown or ""
-                elif hasattr(result, 'markdown'):
-                    if hasattr(result.markdown, 'raw_markdown'):
-                        content = result.markdown.raw_markdown or ""
-                    else:
-                        content = result.markdown or ""
-                else:
-                    content = result.text or ""
-                
-                # Truncate if needed
-                max_length = request.max_content_length if request.max_content_length else settings.DEFAULT_MAX_CONTENT_LENGTH
-                if len(content) > max_length:
-                    content = content[:max_length]
-                
-                # Extract metadata
-                metadata = {}
-                if result.metadata:
-                    metadata = {
-                        "title": str(result.metadata.get("title", "")),
-                        "description": str(result.metadata.get("description", "")),
-                        "author": str(result.metadata.get("author", "")),
-                        "keywords": str(result.metadata.get("keywords", "")),
-                        "language": str(result.metadata.get("language", "")),
-                        "published_time": str(result.metadata.get("published_time", "")),
-                        "modified_time": str(result.metadata.get("modified_time", ""))
-                    }
-                
-                # Extract links
-                links = []
-                if result.links and hasattr(result.links, '__iter__'):
-                    links = list(result.links)[:50]
-                
-                # Extract images
-                images = []
-                if result.media and isinstance(result.media, dict):
-                    img_list = result.media.get("images", [])
-                    if isinstance(img_list, (list, tuple)):
-                        images = list(img_list)[:20]
-                
-                # Extract markdown (prefer fit_markdown if available)
-                markdown_out = ""
-                if hasattr(result, 'markdown'):
-                    if hasattr(result.markdown, 'fit_markdown'):
-                        markdown_out = str(result.markdown.fit_markdown or result.markdown.raw_markdown or "")
-                    elif hasattr(result.markdown, 'raw_markdown'):
-                        markdown_out = str(result.markdown.raw_markdown or "")
-                    else:
-                        markdown_out = str(result.markdown or "")
-                
-                # Ensure all values are proper types for protobuf
-                html_content = str(result.html or "") if hasattr(result, 'html') else ""
-                content_str = str(content) if content else ""
-                
-                # Ensure metadata values are strings
-                metadata_dict = {}
-                for k, v in metadata.items():
-                    metadata_dict[str(k)] = str(v) if v is not None else ""
-                
-                # Ensure links and images are lists of strings
-                links_list = [str(link) for link in links if link]
-                images_list = [str(img) for img in images if img]
-                
-                crawl_responses.append(
-                    crawl_service_pb2.CrawlResponse(
-                        success=True,
-                        url=str(request.urls[i]),
-                        title=str(metadata.get("title", "No title")),
-                        content=content_str,
-                        markdown=str(markdown_out),
-                        html=html_content,
-                        metadata=metadata_dict,
-                        links=links_list,
-                        images=images_list,
-                        content_length=len(content_str),
-                        fetch_time_seconds=0.0,  # arun_many doesn't provide individual times
-                        status_code=int(result.status_code) if hasattr(result, 'status_code') and result.status_code else 200,
-                        extracted_content=str(result.extracted_content) if hasattr(result, 'extracted_content') and result.extracted_content else None
-                    )
-                )
-                successful += 1
-                total_content_length += len(content)
+            crawl_responses: List[Any] = [None] * len(request.urls)
+            async for item in self.stream_crawl_many(request):
+                crawl_responses[item.index] = item.result
             
+            successful = sum(1 for response in crawl_responses if response.success)
+            failed = len(crawl_responses) - successful
+            total_content_length = sum(response.content_length for response in crawl_responses if response.success)
             total_time = time.time() - start_time
             
-            logger.info(f"✅ arun_many() completed: {successful}/{len(request.urls)} successful in {total_time:.2f}s")
+            logger.info(f"✅ crawl_many completed: {successful}/{len(request.urls)} successful in {total_time:.2f}s")
             
             return crawl_service_pb2.CrawlManyResponse(
                 success=True,
@@ -550,14 +497,16 @@ class CrawlServiceImplementation:
                 min_gain_threshold=0.05  # Minimum expected information gain to continue
             )
             
-            # Create adaptive crawler wrapper
-            adaptive = AdaptiveCrawler(self.crawler, config)
-            
-            # Execute adaptive crawl using digest() method
-            result = await adaptive.digest(
-                start_url=request.seed_url,
-                query=request.query
-            )
+            # Adaptive crawls keep one pooled browser for their whole exploration
+            async with self.pool.lease() as crawler:
+                # Create adaptive crawler wrapper
+                adaptive = AdaptiveCrawler(crawler, config)
+                
+                # Execute adaptive crawl using digest() method
+                result = await adaptive.digest(
+                    start_url=request.seed_url,
+                    query=request.query
+                )
             
             if not result:
                 raise Exception("AdaptiveCrawler returned no result")
@@ -653,8 +602,8 @@ class CrawlServiceImplementation:
         from protos import crawl_service_pb2
         
         try:
-            # Check if crawler is initialized
-            crawl4ai_available = self._initialized and self.crawler is not None
+            # Check if crawler pool is initialized
+            crawl4ai_available = self._initialized and self.pool.running
             
             # Try a simple browser check
             browser_available = False
@@ -674,7 +623,9 @@ class CrawlServiceImplementation:
                 service_version="0.7.2",
                 details={
                     "max_concurrent": str(settings.MAX_CONCURRENT_CRAWLS),
-                    "headless": str(settings.HEADLESS)
+                    "max_concurrent_per_domain": str(settings.MAX_CONCURRENT_PER_DOMAIN),
+                    "headless": str(settings.HEADLESS),
+                    **self.pool.get_stats()
                 }
             )
             
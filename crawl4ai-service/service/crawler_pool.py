@@ -0,0 +1,207 @@
+"""
+Crawler Pool - Managed set of browser-backed crawlers
+
+The service used to keep one AsyncWebCrawler for its whole lifetime, and Chromium
+memory grows with every page it renders. The pool leases crawlers per page, launches
+extra browsers (up to BROWSER_POOL_SIZE) when the existing ones are busy, caps
+concurrent pages globally and per domain, and recycles a browser once it has
+served BROWSER_RECYCLE_AFTER_PAGES pages.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+from crawl4ai import AsyncWebCrawler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledCrawler:
+    """One browser plus its lease bookkeeping"""
+    crawler_id: int
+    crawler: AsyncWebCrawler
+    active: int = 0
+    pages_served: int = 0
+    retiring: bool = False
+    started_at: float = field(default_factory=time.time)
+
+
+class CrawlerPool:
+    """Leases crawlers per page with global/per-domain caps and browser recycling"""
+
+    def __init__(
+        self,
+        max_browsers: int,
+        pages_per_browser: int,
+        recycle_after_pages: int,
+        max_concurrent_pages: int,
+        max_per_domain: int,
+        headless: bool = True,
+    ):
+        self.max_browsers = max(1, max_browsers)
+        self.pages_per_browser = max(1, pages_per_browser)
+        self.recycle_after_pages = max(0, recycle_after_pages)
+        self.max_per_domain = max(1, max_per_domain)
+        self.headless = headless
+
+        self._crawlers: List[_PooledCrawler] = []
+        self._ids = itertools.count(1)
+        # Guards browser selection; notified when a launch finishes. Chromium startup
+        # itself runs outside it so leases can keep using existing browsers meanwhile
+        self._select_lock = asyncio.Condition()
+        self._launching = 0
+        self._page_slots = asyncio.Semaphore(max(1, max_concurrent_pages))
+        self._domain_slots: Dict[str, asyncio.Semaphore] = {}
+        self._domain_users: Dict[str, int] = {}
+        self._closing_tasks: set = set()
+        # Set by start()/close(); the pool may briefly hold no browser after a recycle
+        self._running = False
+
+        # Statistics
+        self.browsers_launched = 0
+        self.browsers_recycled = 0
+        self.pages_leased = 0
+
+    @property
+    def running(self) -> bool:
+        """True between start() and close(), whether or not a browser is currently live"""
+        return self._running
+
+    async def start(self) -> None:
+        """Launch the first browser so the service is warm before the first request"""
+        async with self._select_lock:
+            needs_browser = not self._crawlers and not self._launching
+            if needs_browser:
+                self._launching += 1
+        if needs_browser:
+            await self._launch_and_register(lease=False)
+        self._running = True
+
+    async def close(self) -> None:
+        """Close every browser, including ones still being recycled"""
+        self._running = False
+        crawlers, self._crawlers = self._crawlers, []
+        for pooled in crawlers:
+            await self._close_crawler(pooled)
+        if self._closing_tasks:
+            await asyncio.gather(*self._closing_tasks, return_exceptions=True)
+
+    async def _launch_and_register(self, lease: bool) -> _PooledCrawler:
+        """
+        Start a browser reserved by incrementing _launching (outside the lock), then
+        add it to the pool, optionally already leased to the caller
+        """
+        try:
+            crawler = AsyncWebCrawler(headless=self.headless)
+            await crawler.__aenter__()
+        except BaseException:
+            async with self._select_lock:
+                self._launching -= 1
+                self._select_lock.notify_all()
+            raise
+
+        pooled = _PooledCrawler(crawler_id=next(self._ids), crawler=crawler)
+        async with self._select_lock:
+            self._launching -= 1
+            self._crawlers.append(pooled)
+            if lease:
+                pooled.active += 1
+            self.browsers_launched += 1
+            self._select_lock.notify_all()
+        logger.info(f"Launched browser #{pooled.crawler_id} ({len(self._crawlers)}/{self.max_browsers} in pool)")
+        return pooled
+
+    async def _close_crawler(self, pooled: _PooledCrawler) -> None:
+        try:
+            await pooled.crawler.__aexit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Error closing browser #{pooled.crawler_id}: {e}")
+
+    async def _acquire_crawler(self) -> _PooledCrawler:
+        async with self._select_lock:
+            while True:
+                available = [pooled for pooled in self._crawlers if not pooled.retiring]
+                least_busy = min(available, key=lambda pooled: pooled.active, default=None)
+                browsers = len(self._crawlers) + self._launching
+                if least_busy is not None and (
+                    least_busy.active < self.pages_per_browser or browsers >= self.max_browsers
+                ):
+                    least_busy.active += 1
+                    return least_busy
+                if least_busy is None and self._launching:
+                    # Nothing usable yet, but a browser is on its way - wait for it
+                    await self._select_lock.wait()
+                    continue
+                # Reserve a launch slot; the browser starts after the lock is released
+                self._launching += 1
+                break
+        return await self._launch_and_register(lease=True)
+
+    def _release_crawler(self, pooled: _PooledCrawler) -> None:
+        pooled.active -= 1
+        pooled.pages_served += 1
+        if self.recycle_after_pages and pooled.pages_served >= self.recycle_after_pages and not pooled.retiring:
+            pooled.retiring = True
+            logger.info(f"Retiring browser #{pooled.crawler_id} after {pooled.pages_served} pages")
+        if pooled.retiring and pooled.active == 0 and pooled in self._crawlers:
+            self._crawlers.remove(pooled)
+            self.browsers_recycled += 1
+            task = asyncio.create_task(self._close_crawler(pooled))
+            self._closing_tasks.add(task)
+            task.add_done_callback(self._closing_tasks.discard)
+
+    @asynccontextmanager
+    async def _domain_slot(self, url: Optional[str]) -> AsyncIterator[None]:
+        domain = urlparse(url).netloc.lower() if url else ""
+        if not domain:
+            yield
+            return
+
+        semaphore = self._domain_slots.get(domain)
+        if semaphore is None:
+            semaphore = self._domain_slots[domain] = asyncio.Semaphore(self.max_per_domain)
+        self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._domain_users[domain] -= 1
+            if self._domain_users[domain] == 0:
+                del self._domain_users[domain]
+                del self._domain_slots[domain]
+
+    @asynccontextmanager
+    async def lease(self, url: Optional[str] = None) -> AsyncIterator[AsyncWebCrawler]:
+        """
+        Lease a crawler for one page (or one adaptive crawl when url is None)
+
+        Waits for a per-domain slot, then a global page slot, then picks the least
+        busy browser - launching a new one when all are at pages_per_browser.
+        """
+        async with self._domain_slot(url):
+            async with self._page_slots:
+                pooled = await self._acquire_crawler()
+                self.pages_leased += 1
+                try:
+                    yield pooled.crawler
+                finally:
+                    self._release_crawler(pooled)
+
+    def get_stats(self) -> Dict[str, str]:
+        """Pool statistics as strings (for HealthCheckResponse.details)"""
+        return {
+            "browsers": str(len(self._crawlers)),
+            "max_browsers": str(self.max_browsers),
+            "active_pages": str(sum(pooled.active for pooled in self._crawlers)),
+            "pages_leased": str(self.pages_leased),
+            "browsers_launched": str(self.browsers_launched),
+            "browsers_recycled": str(self.browsers_recycled),
+            "domains_in_flight": str(len(self._domain_slots)),
+        }
@@ -74,6 +74,21 @@ class CrawlServiceGRPCImplementation(crawl_service_pb2_grpc.CrawlServiceServicer
             from protos import crawl_service_pb2
             return crawl_service_pb2.CrawlManyResponse(success=False, error=str(e))
     
+    async def StreamCrawlMany(self, request, context):
+        """Parallel multi-URL crawl, streaming each page as it completes"""
+        if not self._initialized:
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details("Service not initialized")
+            return
+        
+        try:
+            async for item in self.crawl_service.stream_crawl_many(request):
+                yield item
+        except Exception as e:
+            logger.error(f"StreamCrawlMany failed: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+    
     async def AdaptiveCrawl(self, request, context):
         """Adaptive intelligent crawl"""
         try:
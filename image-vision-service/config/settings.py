@@ -27,10 +27,23 @@ class Settings:
     ENCODING_MODEL: str = os.getenv("ENCODING_MODEL", "large")
     # detection_model: "hog" (faster on CPU) or "cnn" (more accurate, much slower on CPU)
     DETECTION_MODEL: str = os.getenv("DETECTION_MODEL", "hog")
+    # Face detection worker processes (0 = one per CPU core)
+    FACE_DETECTION_WORKERS: int = int(os.getenv("FACE_DETECTION_WORKERS", "0"))
+    # Downsample so the longest side is at most this before detection (0 = full resolution).
+    # Boxes are scaled back and encodings use full-resolution pixels.
+    FACE_DETECTION_MAX_DIMENSION: int = int(os.getenv("FACE_DETECTION_MAX_DIMENSION", "0"))
+    # Identity indexes kept for MatchFaces, one per owner_id (LRU)
+    FACE_IDENTITY_INDEX_OWNERS: int = int(os.getenv("FACE_IDENTITY_INDEX_OWNERS", "32"))
 
     # Object detection (YOLO + CLIP)
     OBJECT_DETECTION_MODEL: str = os.getenv("OBJECT_DETECTION_MODEL", "yolov8n.pt")
     CLIP_MODEL: str = os.getenv("CLIP_MODEL", "openai/clip-vit-base-patch32")
+    # Crops per CLIP forward pass (semantic sweep / region matching)
+    CLIP_BATCH_SIZE: int = int(os.getenv("CLIP_BATCH_SIZE", "32"))
+    # Normalized text features kept per description string (LRU)
+    CLIP_TEXT_CACHE_SIZE: int = int(os.getenv("CLIP_TEXT_CACHE_SIZE", "1024"))
+    # Threads running CPU inference off the grpc.aio event loop
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "2"))
 
     @classmethod
     def validate(cls) -> None:
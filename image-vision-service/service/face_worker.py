@@ -0,0 +1,120 @@
+"""
+Face Worker - Face detection and encoding run inside worker processes
+
+HOG detection and dlib encoding are pure CPU work that holds the GIL, so they run
+in a process pool instead of on the grpc.aio event loop. Each image is decoded
+once; large images are downsampled for detection only and the boxes are scaled
+back, while encodings are still computed on the full-resolution pixels.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+_face_config: Dict[str, Any] = {}
+
+
+def init_face_worker(detection_model: str, encoding_model: str, num_jitters: int) -> None:
+    """Process initializer: import face_recognition (loads dlib models) once per worker"""
+    import face_recognition  # noqa: F401 - importing loads the dlib models
+
+    _face_config.update(
+        detection_model=detection_model,
+        encoding_model=encoding_model,
+        num_jitters=num_jitters,
+    )
+    logger.info(f"Face worker ready (pid={os.getpid()})")
+
+
+def warmup_face_worker() -> int:
+    """No-op used to force worker processes to spawn and load models"""
+    return os.getpid()
+
+
+def _decode_image(image_path: str) -> np.ndarray:
+    """Decode an image once into an RGB uint8 array (same as face_recognition.load_image_file)"""
+    with Image.open(image_path) as image:
+        return np.array(image.convert("RGB"))
+
+
+def detect_faces_in_image(image_path: str, max_detection_dimension: int = 0) -> Dict[str, Any]:
+    """
+    Detect and encode faces in one image
+
+    Args:
+        image_path: Path to image file
+        max_detection_dimension: Downsample so the longest side is at most this many
+            pixels before detection (0 = detect at full resolution)
+
+    Returns:
+        Dict with faces, image_width, image_height, processing_time_seconds
+    """
+    import face_recognition
+
+    start_time = time.time()
+    if not Path(image_path).exists():
+        raise FileNotFoundError(f"Image not found: {image_path}")
+
+    detection_model = _face_config.get("detection_model", "hog")
+    encoding_model = _face_config.get("encoding_model", "large")
+    num_jitters = _face_config.get("num_jitters", 5)
+
+    image = _decode_image(image_path)
+    image_height, image_width = image.shape[:2]
+
+    scale = 1.0
+    detection_image = image
+    longest_side = max(image_width, image_height)
+    if max_detection_dimension and longest_side > max_detection_dimension:
+        scale = longest_side / max_detection_dimension
+        resized = Image.fromarray(image).resize(
+            (max(1, round(image_width / scale)), max(1, round(image_height / scale))),
+            Image.BILINEAR,
+        )
+        detection_image = np.asarray(resized)
+
+    # face_recognition returns (top, right, bottom, left)
+    face_locations = face_recognition.face_locations(detection_image, model=detection_model)
+    if scale != 1.0:
+        face_locations = [
+            (
+                max(0, int(round(top * scale))),
+                min(image_width, int(round(right * scale))),
+                min(image_height, int(round(bottom * scale))),
+                max(0, int(round(left * scale))),
+            )
+            for top, right, bottom, left in face_locations
+        ]
+
+    # num_jitters averages over perturbed crops; "large" uses more landmarks
+    face_encodings = face_recognition.face_encodings(
+        image,
+        face_locations,
+        num_jitters=num_jitters,
+        model=encoding_model,
+    )
+
+    faces = []
+    for (top, right, bottom, left), encoding in zip(face_locations, face_encodings):
+        faces.append({
+            "bbox_x": left,
+            "bbox_y": top,
+            "bbox_width": right - left,
+            "bbox_height": bottom - top,
+            "face_encoding": encoding.tolist(),
+            "confidence": 1.0  # face_recognition doesn't provide confidence scores
+        })
+
+    return {
+        "faces": faces,
+        "image_width": image_width,
+        "image_height": image_height,
+        "processing_time_seconds": time.time() - start_time,
+    }
@@ -81,45 +81,76 @@ class ImageVisionServiceImplementation(image_vision_pb2_grpc.ImageVisionServiceS
             
             # Detect faces
             result = await self.vision_engine.detect_faces(request.image_path)
+            return self._face_detection_response(result)
             
-            # Convert to protobuf format
-            detected_faces = []
-            for face in result["faces"]:
-                detected_face = image_vision_pb2.DetectedFace(
-                    bbox_x=face["bbox_x"],
-                    bbox_y=face["bbox_y"],
-                    bbox_width=face["bbox_width"],
-                    bbox_height=face["bbox_height"],
-                    face_encoding=face["face_encoding"],
-                    confidence=face["confidence"]
-                )
-                detected_faces.append(detected_face)
-            
-            return image_vision_pb2.FaceDetectionResponse(
-                faces=detected_faces,
-                image_width=result["image_width"],
-                image_height=result["image_height"],
-                processing_time_seconds=result["processing_time_seconds"]
-            )
-            
-        except FileNotFoundError as e:
-            logger.error(f"Image not found: {e}")
-            return image_vision_pb2.FaceDetectionResponse(
-                faces=[],
-                image_width=0,
-                image_height=0,
-                processing_time_seconds=0.0,
-                error=f"Image not found: {str(e)}"
-            )
         except Exception as e:
             logger.error(f"Face detection failed: {e}")
-            return image_vision_pb2.FaceDetectionResponse(
-                faces=[],
-                image_width=0,
-                image_height=0,
-                processing_time_seconds=0.0,
-                error=str(e)
+            return self._face_detection_error(e)
+
+    async def DetectFacesBatch(self, request, context):
+        """Detect faces in many images, streaming each result as soon as it is ready"""
+        images = list(request.images)
+        if not self._initialized:
+            for index, image in enumerate(images):
+                yield image_vision_pb2.FaceDetectionBatchResult(
+                    index=index,
+                    image_path=image.image_path,
+                    document_id=image.document_id,
+                    result=self._face_detection_error(RuntimeError("Service not initialized"))
+                )
+            return
+
+        logger.info(f"Batch face detection: {len(images)} images")
+        max_dimension = request.max_detection_dimension or None
+        async for index, result, error in self.vision_engine.detect_faces_batch(
+            [image.image_path for image in images],
+            max_detection_dimension=max_dimension
+        ):
+            if error is not None:
+                logger.error(f"Face detection failed for {images[index].image_path}: {error}")
+                response = self._face_detection_error(error)
+            else:
+                response = self._face_detection_response(result)
+            yield image_vision_pb2.FaceDetectionBatchResult(
+                index=index,
+                image_path=images[index].image_path,
+                document_id=images[index].document_id,
+                result=response
             )
+
+    @staticmethod
+    def _face_detection_response(result: Dict[str, Any]):
+        """Convert a detect_faces result dict to FaceDetectionResponse"""
+        detected_faces = []
+        for face in result["faces"]:
+            detected_face = image_vision_pb2.DetectedFace(
+                bbox_x=face["bbox_x"],
+                bbox_y=face["bbox_y"],
+                bbox_width=face["bbox_width"],
+                bbox_height=face["bbox_height"],
+                face_encoding=face["face_encoding"],
+                confidence=face["confidence"]
+            )
+            detected_faces.append(detected_face)
+        
+        return image_vision_pb2.FaceDetectionResponse(
+            faces=detected_faces,
+            image_width=result["image_width"],
+            image_height=result["image_height"],
+            processing_time_seconds=result["processing_time_seconds"]
+        )
+
+    @staticmethod
+    def _face_detection_error(error: BaseException):
+        """Empty FaceDetectionResponse carrying an error message"""
+        message = f"Image not found: {str(error)}" if isinstance(error, FileNotFoundError) else str(error)
+        return image_vision_pb2.FaceDetectionResponse(
+            faces=[],
+            image_width=0,
+            image_height=0,
+            processing_time_seconds=0.0,
+            error=message
+        )
     
     async def MatchFaces(self, request, context):
         """Match unknown faces against known identities"""
@@ -136,11 +167,13 @@ class ImageVisionServiceImplementation(image_vision_pb2_grpc.ImageVisionServiceS
             # Match faces
             result = await self.vision_engine.match_faces(
                 unknown_faces=[list(face.face_encoding) for face in request.unknown_faces],
-                known_identities={
-                    identity.identity_name: list(identity.face_encoding)
+                known_identities=[
+                    (identity.identity_name, list(identity.face_encoding))
                     for identity in request.known_identities
-                },
-                confidence_threshold=request.confidence_threshold or 0.82
+                ],
+                confidence_threshold=request.confidence_threshold or 0.82,
+                top_k=request.top_k or 1,
+                owner_id=request.owner_id
             )
             
             # Convert to protobuf format
@@ -149,7 +182,14 @@ class ImageVisionServiceImplementation(image_vision_pb2_grpc.ImageVisionServiceS
                 matches.append(image_vision_pb2.FaceMatch(
                     face_index=match["face_index"],
                     matched_identity=match["matched_identity"],
-                    confidence=match["confidence"]
+                    confidence=match["confidence"],
+                    candidates=[
+                        image_vision_pb2.FaceMatchCandidate(
+                            identity_name=candidate["identity_name"],
+                            confidence=candidate["confidence"]
+                        )
+                        for candidate in match.get("candidates", [])
+                    ]
                 ))
             
             return image_vision_pb2.FaceMatchingResponse(
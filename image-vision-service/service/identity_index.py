@@ -0,0 +1,193 @@
+"""
+Identity Index - In-memory matrix of known face encodings for batched matching
+
+Known encodings are kept pre-stacked in one float32 matrix (one row per sample,
+several samples per identity) together with their squared norms, so matching a
+request is a single matrix product instead of a Python loop per (face, identity)
+pair. The index is updated incrementally: only identities whose samples changed
+since the last request are re-stacked.
+"""
+
+import hashlib
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# face_recognition treats L2 distance < 0.6 as "same person"; confidence is scaled against it
+SAME_PERSON_DISTANCE = 0.6
+
+
+def distance_to_confidence(distance: np.ndarray) -> np.ndarray:
+    """Convert L2 face distance to the 0-100 confidence used by the API"""
+    return np.maximum(0.0, (1.0 - distance / SAME_PERSON_DISTANCE) * 100.0)
+
+
+class IdentityIndex:
+    """Pre-stacked known-face encodings with per-identity min-distance search"""
+
+    def __init__(self, dim: int = 128, initial_capacity: int = 1024):
+        self.dim = dim
+        self._matrix = np.empty((initial_capacity, dim), dtype=np.float32)
+        self._sq_norms = np.empty(initial_capacity, dtype=np.float32)
+        self._labels = np.empty(initial_capacity, dtype=np.int32)
+        self._size = 0
+
+        self._names: List[str] = []
+        self._known_labels: Dict[str, int] = {}  # Every name ever seen -> label
+        self._name_to_label: Dict[str, int] = {}  # Identities currently in the index
+        self._fingerprints: Dict[str, str] = {}
+
+        # Rows grouped by label for np.minimum.reduceat; rebuilt lazily after changes
+        self._order: Optional[np.ndarray] = None
+        self._group_starts: Optional[np.ndarray] = None
+        self._group_labels: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._name_to_label)
+
+    @property
+    def sample_count(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _fingerprint(samples: np.ndarray) -> str:
+        return hashlib.blake2b(samples.tobytes(), digest_size=16).hexdigest()
+
+    # ----- Updates -----
+
+    def upsert(self, identity_name: str, samples: np.ndarray) -> bool:
+        """Add or replace an identity's samples. Returns False when nothing changed."""
+        samples = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1, self.dim)
+        fingerprint = self._fingerprint(samples)
+        if self._fingerprints.get(identity_name) == fingerprint:
+            return False
+
+        if identity_name in self._name_to_label:
+            self.remove(identity_name)
+
+        label = self._label_for(identity_name)
+        self._ensure_capacity(self._size + len(samples))
+        end = self._size + len(samples)
+        self._matrix[self._size:end] = samples
+        self._sq_norms[self._size:end] = np.einsum("ij,ij->i", samples, samples)
+        self._labels[self._size:end] = label
+        self._size = end
+
+        self._name_to_label[identity_name] = label
+        self._fingerprints[identity_name] = fingerprint
+        self._order = None
+        return True
+
+    def remove(self, identity_name: str) -> bool:
+        """Drop all samples for an identity"""
+        label = self._name_to_label.pop(identity_name, None)
+        if label is None:
+            return False
+        self._fingerprints.pop(identity_name, None)
+
+        keep = self._labels[:self._size] != label
+        kept = int(keep.sum())
+        self._matrix[:kept] = self._matrix[:self._size][keep]
+        self._sq_norms[:kept] = self._sq_norms[:self._size][keep]
+        self._labels[:kept] = self._labels[:self._size][keep]
+        self._size = kept
+        self._order = None
+        return True
+
+    def sync(self, identities: Dict[str, np.ndarray]) -> Tuple[int, int]:
+        """
+        Make the index hold exactly these identities, touching only what changed
+
+        Returns (updated, removed) counts.
+        """
+        removed = 0
+        for name in [n for n in self._name_to_label if n not in identities]:
+            self.remove(name)
+            removed += 1
+
+        updated = sum(1 for name, samples in identities.items() if self.upsert(name, samples))
+        if updated or removed:
+            logger.info(f"Identity index synced: {updated} updated, {removed} removed, {len(self)} identities / {self._size} samples")
+        return updated, removed
+
+    def _label_for(self, identity_name: str) -> int:
+        # Labels are stable positions in _names; reuse the slot when an identity is re-added
+        label = self._known_labels.get(identity_name)
+        if label is None:
+            label = len(self._names)
+            self._names.append(identity_name)
+            self._known_labels[identity_name] = label
+        return label
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for attr in ("_matrix", "_sq_norms", "_labels"):
+            old = getattr(self, attr)
+            grown = np.empty((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, attr, grown)
+
+    def _ensure_grouping(self) -> None:
+        if self._order is not None:
+            return
+        labels = self._labels[:self._size]
+        self._order = np.argsort(labels, kind="stable")
+        sorted_labels = labels[self._order]
+        boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
+        self._group_starts = np.concatenate(([0], boundaries)).astype(np.intp)
+        self._group_labels = sorted_labels[self._group_starts]
+
+    # ----- Search -----
+
+    def search(self, unknown: np.ndarray, top_k: int = 1) -> List[List[Tuple[str, float]]]:
+        """
+        Best identities for each unknown face, nearest first
+
+        One (faces x samples) distance matrix per call; each identity scores by its
+        closest sample. Returns [[(identity_name, distance), ...] per face].
+        """
+        unknown = np.ascontiguousarray(unknown, dtype=np.float32).reshape(-1, self.dim)
+        if self._size == 0 or len(unknown) == 0:
+            return [[] for _ in range(len(unknown))]
+
+        self._ensure_grouping()
+        matrix = self._matrix[:self._size][self._order]
+        sq_norms = self._sq_norms[:self._size][self._order]
+
+        # ||u - k||^2 = ||u||^2 + ||k||^2 - 2 u.k
+        sq_dist = (
+            np.einsum("ij,ij->i", unknown, unknown)[:, None]
+            + sq_norms[None, :]
+            - 2.0 * unknown @ matrix.T
+        )
+        np.maximum(sq_dist, 0.0, out=sq_dist)
+        per_identity = np.sqrt(np.minimum.reduceat(sq_dist, self._group_starts, axis=1))
+
+        k = max(1, min(top_k, per_identity.shape[1]))
+        if k < per_identity.shape[1]:
+            candidates = np.argpartition(per_identity, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.tile(np.arange(per_identity.shape[1]), (len(unknown), 1))
+
+        results = []
+        for row, cols in enumerate(candidates):
+            cols = cols[np.argsort(per_identity[row, cols])]
+            results.append([
+                (self._names[self._group_labels[col]], float(per_identity[row, col]))
+                for col in cols
+            ])
+        return results
+
+
+def stack_identity_samples(samples: Iterable[Tuple[str, Sequence[float]]]) -> Dict[str, np.ndarray]:
+    """Group (identity_name, encoding) samples into {identity_name: (n, dim) float32 array}"""
+    grouped: Dict[str, List[Sequence[float]]] = {}
+    for identity_name, encoding in samples:
+        grouped.setdefault(identity_name, []).append(encoding)
+    return {name: np.asarray(encodings, dtype=np.float32) for name, encodings in grouped.items()}
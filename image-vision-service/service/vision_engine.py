@@ -4,9 +4,17 @@ Face detection: face_recognition library. Object detection: YOLOv8 + CLIP.
 CPU-optimized.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import numpy as np
 
@@ -38,6 +46,9 @@ except ImportError:
 
 from PIL import Image
 
+from service.face_worker import detect_faces_in_image, init_face_worker, warmup_face_worker
+from service.identity_index import IdentityIndex, distance_to_confidence, stack_identity_samples
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +76,27 @@ class VisionEngine:
         self.clip_model = None
         self.clip_processor = None
         self.clip_embedding_dim = 512
+        cfg = _get_vision_config()
+        # owner_id -> IdentityIndex (LRU), so requests from different users don't re-sync one shared index
+        self._identity_indexes: "OrderedDict[str, IdentityIndex]" = OrderedDict()
+        self._identity_index_owners = max(1, getattr(cfg, "FACE_IDENTITY_INDEX_OWNERS", 32))
+        self.clip_batch_size = max(1, getattr(cfg, "CLIP_BATCH_SIZE", 32))
+        # CPU inference runs here so it never blocks the grpc.aio event loop
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=max(1, getattr(cfg, "INFERENCE_WORKERS", 2)),
+            thread_name_prefix="vision-inference",
+        )
+        # description -> L2-normalized CLIP text features (LRU)
+        self._text_feature_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._text_feature_cache_size = max(0, getattr(cfg, "CLIP_TEXT_CACHE_SIZE", 1024))
+        self._text_feature_cache_lock = threading.Lock()
+        self._text_cache_hits = 0
+        self._text_cache_misses = 0
+        # Face detection/encoding worker processes (created in initialize)
+        self._face_pool: Optional[ProcessPoolExecutor] = None
+        self.face_pool_restarts = 0
+        self.face_workers = max(1, getattr(cfg, "FACE_DETECTION_WORKERS", 0) or os.cpu_count() or 1)
+        self.max_detection_dimension = max(0, getattr(cfg, "FACE_DETECTION_MAX_DIMENSION", 0))
 
         if not FACE_RECOGNITION_AVAILABLE:
             raise RuntimeError("face_recognition library is not installed")
@@ -88,6 +120,7 @@ class VisionEngine:
             logger.info(
                 f"Face config: detection={self.detection_model}, encoding_model={self.encoding_model}, num_jitters={self.num_jitters}"
             )
+            self._start_face_pool()
             self._initialized = True
             logger.info("Vision Engine initialized successfully")
             
@@ -95,12 +128,59 @@ class VisionEngine:
             logger.error(f"Failed to initialize Vision Engine: {e}")
             raise
     
-    async def detect_faces(self, image_path: str) -> Dict[str, Any]:
+    def _start_face_pool(self) -> None:
+        """Start warm face worker processes (dlib models load once per worker)"""
+        if self._face_pool is not None:
+            return
+        # spawn: the grpc.aio server has threads and a running loop, which fork does not copy safely
+        self._face_pool = ProcessPoolExecutor(
+            max_workers=self.face_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_face_worker,
+            initargs=(self.detection_model, self.encoding_model, self.num_jitters),
+        )
+        for _ in range(self.face_workers):
+            self._face_pool.submit(warmup_face_worker)
+        logger.info(
+            f"Face worker pool started: {self.face_workers} processes, "
+            f"max detection dimension {self.max_detection_dimension or 'unlimited'}"
+        )
+
+    def _reset_face_pool(self, broken_pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool (a worker died, e.g. dlib segfault/OOM); the next submit starts a fresh one"""
+        if self._face_pool is not broken_pool:
+            # Another caller already replaced it
+            return
+        self._face_pool = None
+        self.face_pool_restarts += 1
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_face_detection(self, image_path: str, max_detection_dimension: Optional[int]) -> Dict[str, Any]:
+        """Run one detection in the worker pool, restarting the pool and retrying once if it broke"""
+        if max_detection_dimension is None:
+            max_detection_dimension = self.max_detection_dimension
+        for attempt in range(2):
+            if self._face_pool is None:
+                self._start_face_pool()
+            pool = self._face_pool
+            try:
+                return await asyncio.wrap_future(
+                    pool.submit(detect_faces_in_image, str(image_path), max_detection_dimension)
+                )
+            except BrokenProcessPool as e:
+                logger.error(f"Face worker pool broke while processing {image_path}: {e} - restarting")
+                self._reset_face_pool(pool)
+                if attempt:
+                    raise
+
+    async def detect_faces(self, image_path: str, max_detection_dimension: Optional[int] = None) -> Dict[str, Any]:
         """
         Detect faces in an image and return encodings
         
         Args:
             image_path: Path to image file
+            max_detection_dimension: Longest side used for detection (None = configured
+                default, 0 = full resolution); boxes are always in original pixels
             
         Returns:
             Dict with:
@@ -112,141 +192,127 @@ class VisionEngine:
         if not self._initialized:
             raise RuntimeError("Vision Engine not initialized")
         
-        start_time = time.time()
-        
         try:
-            # Load image
-            image_path_obj = Path(image_path)
-            if not image_path_obj.exists():
-                raise FileNotFoundError(f"Image not found: {image_path}")
-            
-            # Load image with face_recognition (uses PIL internally)
-            image = face_recognition.load_image_file(str(image_path))
-            
-            # Get image dimensions
-            pil_image = Image.open(image_path)
-            image_width, image_height = pil_image.size
-            
-            # Detect face locations (hog = faster on CPU, cnn = more accurate)
-            face_locations = face_recognition.face_locations(image, model=self.detection_model)
-            
-            logger.info(f"Found {len(face_locations)} face(s) in image")
-            
-            # Get face encodings: num_jitters averages over perturbed crops for robustness;
-            # encoding_model "large" uses more landmarks for better accuracy
-            face_encodings = face_recognition.face_encodings(
-                image,
-                face_locations,
-                num_jitters=self.num_jitters,
-                model=self.encoding_model,
-            )
-            
-            # Build response
-            detected_faces = []
-            for (top, right, bottom, left), encoding in zip(face_locations, face_encodings):
-                # face_recognition returns (top, right, bottom, left)
-                # Convert to (x, y, width, height)
-                bbox_x = left
-                bbox_y = top
-                bbox_width = right - left
-                bbox_height = bottom - top
-                
-                detected_faces.append({
-                    "bbox_x": bbox_x,
-                    "bbox_y": bbox_y,
-                    "bbox_width": bbox_width,
-                    "bbox_height": bbox_height,
-                    "face_encoding": encoding.tolist(),  # Convert numpy array to list
-                    "confidence": 1.0  # face_recognition doesn't provide confidence scores
-                })
-            
-            processing_time = time.time() - start_time
-            
-            return {
-                "faces": detected_faces,
-                "image_width": image_width,
-                "image_height": image_height,
-                "processing_time_seconds": processing_time
-            }
+            result = await self._run_face_detection(image_path, max_detection_dimension)
+            logger.info(f"Found {len(result['faces'])} face(s) in image")
+            return result
             
         except Exception as e:
             logger.error(f"Face detection failed: {e}")
             raise
-    
+
+    async def detect_faces_batch(
+        self,
+        image_paths: List[str],
+        max_detection_dimension: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Detect faces in many images across the worker pool
+
+        Yields (index, result, error) per image in completion order, so callers can
+        stream results while slower images are still being processed.
+        """
+        if not self._initialized:
+            raise RuntimeError("Vision Engine not initialized")
+
+        futures = {
+            asyncio.ensure_future(self._run_face_detection(image_path, max_detection_dimension)): index
+            for index, image_path in enumerate(image_paths)
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    error = future.exception()
+                    yield futures[future], (None if error else future.result()), error
+        finally:
+            # Client went away: don't keep workers busy with images nobody will read
+            for future in pending:
+                future.cancel()
+
+    def _identity_index_for(self, owner_id: str) -> IdentityIndex:
+        index = self._identity_indexes.get(owner_id)
+        if index is None:
+            index = IdentityIndex()
+            self._identity_indexes[owner_id] = index
+            while len(self._identity_indexes) > self._identity_index_owners:
+                evicted, _ = self._identity_indexes.popitem(last=False)
+                logger.debug(f"Evicted identity index for owner {evicted or '(default)'}")
+        else:
+            self._identity_indexes.move_to_end(owner_id)
+        return index
+
     async def match_faces(
         self,
         unknown_faces: list,  # List of face encodings
-        known_identities: dict,  # {identity_name: face_encoding}
-        confidence_threshold: float = 0.82
+        known_identities: List[Tuple[str, List[float]]],  # [(identity_name, face_encoding), ...]
+        confidence_threshold: float = 0.82,
+        top_k: int = 1,
+        owner_id: str = ""
     ) -> Dict[str, Any]:
         """
         Match unknown faces against known identities
-        
+
+        Known encodings live in a persistent per-owner IdentityIndex that is synced
+        with the request (only changed identities are re-stacked), then all unknown
+        faces are scored in one batched distance computation.
+
         Args:
             unknown_faces: List of 128-dimensional face encodings
-            known_identities: Dict mapping identity names to their face encodings
+            known_identities: (identity_name, face_encoding) samples; an identity may
+                appear several times, its closest sample wins
             confidence_threshold: Minimum confidence (0.0-1.0) for a match
-            
+            top_k: Number of ranked candidate identities returned per matched face
+            owner_id: Whose identity set this is (e.g. user_id); callers without one
+                share a single index
+
         Returns:
             Dict with matches list and processing time
         """
-        import time
-        import numpy as np
-        
         start_time = time.time()
-        
-        logger.info(f"🔍 Matching {len(unknown_faces)} unknown faces against {len(known_identities)} known identities")
-        logger.info(f"   Confidence threshold: {confidence_threshold * 100}%")
-        
+
         try:
+            identity_index = self._identity_index_for(owner_id)
+            identity_index.sync(stack_identity_samples(known_identities))
+            ranked = identity_index.search(np.asarray(unknown_faces, dtype=np.float32), top_k=max(1, top_k))
+
+            threshold = confidence_threshold * 100
             matches = []
-            
-            for idx, unknown_encoding in enumerate(unknown_faces):
-                unknown_np = np.array(unknown_encoding)
-                
-                best_match = None
-                best_confidence = 0
-                
-                # Compare against all known identities
-                for identity_name, known_encoding in known_identities.items():
-                    known_np = np.array(known_encoding)
-                    
-                    # Calculate face distance (lower = more similar)
-                    distance = face_recognition.face_distance([known_np], unknown_np)[0]
-                    
-                    # Convert distance to confidence percentage
-                    # face_recognition uses 0.6 as typical threshold for "same person"
-                    confidence = max(0, (1 - (distance / 0.6)) * 100)
-                    
-                    logger.info(f"   📊 Face #{idx} vs '{identity_name}': distance={distance:.4f}, confidence={confidence:.1f}%")
-                    
-                    # Track best confidence regardless of threshold
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        # Only mark as match if meets threshold
-                        if confidence >= (confidence_threshold * 100):
-                            best_match = identity_name
-                
-                # Add match if found
-                if best_match:
+            for idx, candidates in enumerate(ranked):
+                if not candidates:
+                    logger.debug(f"No match for face #{idx} (no known identities to compare)")
+                    continue
+
+                confidences = distance_to_confidence(np.array([distance for _, distance in candidates]))
+                best_name, best_distance = candidates[0]
+                best_confidence = float(confidences[0])
+
+                if best_confidence >= threshold:
                     matches.append({
                         "face_index": idx,
-                        "matched_identity": best_match,
-                        "confidence": round(best_confidence, 1)
+                        "matched_identity": best_name,
+                        "confidence": round(best_confidence, 1),
+                        "candidates": [
+                            {"identity_name": name, "confidence": round(float(confidence), 1)}
+                            for (name, _), confidence in zip(candidates, confidences)
+                        ],
                     })
-                    logger.info(f"✨ Matched face #{idx} to {best_match} ({best_confidence:.1f}% confidence)")
-                elif best_confidence > 0:
-                    logger.info(f"❌ No match found for face #{idx} (best: {best_confidence:.1f}% < {confidence_threshold * 100:.1f}% threshold)")
+                    logger.debug(f"Matched face #{idx} to {best_name} (distance={best_distance:.4f}, {best_confidence:.1f}%)")
                 else:
-                    logger.info(f"❌ No match found for face #{idx} (no known identities to compare)")
-            
+                    logger.debug(f"No match for face #{idx} (best: {best_name} {best_confidence:.1f}% < {threshold:.1f}%)")
+
             processing_time = time.time() - start_time
-            
+            logger.info(
+                f"🔍 Matched {len(matches)}/{len(unknown_faces)} faces against {len(identity_index)} identities "
+                f"({identity_index.sample_count} samples) in {processing_time * 1000:.1f}ms"
+            )
+
             return {
                 "matches": matches,
                 "processing_time_seconds": processing_time
             }
-            
+
         except Exception as e:
             logger.error(f"Face matching failed: {e}")
             raise
@@ -275,6 +341,78 @@ class VisionEngine:
             logger.error(f"Failed to initialize object detection: {e}")
             raise
 
+    async def _run_inference(self, func, *args, **kwargs):
+        """Run blocking model inference on the inference thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._inference_executor, partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _clip_device() -> str:
+        return "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
+
+    def _get_text_features(self, descriptions: List[str]):
+        """
+        L2-normalized CLIP text features, one row per description (in order)
+
+        Features are cached per description string; only cache misses go through
+        the text encoder, in a single batch.
+        """
+        rows: Dict[str, Any] = {}
+        with self._text_feature_cache_lock:
+            for description in descriptions:
+                cached = self._text_feature_cache.get(description)
+                if cached is not None:
+                    self._text_feature_cache.move_to_end(description)
+                    rows[description] = cached
+            missing = list(dict.fromkeys(d for d in descriptions if d not in rows))
+            self._text_cache_hits += len(descriptions) - len(missing)
+            self._text_cache_misses += len(missing)
+
+        if missing:
+            text_inputs = self.clip_processor(
+                text=missing,
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+            ).to(self._clip_device())
+            with torch.no_grad():
+                text_features = self.clip_model.get_text_features(**text_inputs)
+                text_features = text_features / text_features.norm(dim=-1, keepdim=True)
+            with self._text_feature_cache_lock:
+                for description, features in zip(missing, text_features):
+                    rows[description] = features
+                    if self._text_feature_cache_size:
+                        self._text_feature_cache[description] = features
+                        self._text_feature_cache.move_to_end(description)
+                while len(self._text_feature_cache) > self._text_feature_cache_size:
+                    self._text_feature_cache.popitem(last=False)
+
+        return torch.stack([rows[description] for description in descriptions])
+
+    def _get_image_features(self, crops: List[Image.Image]):
+        """L2-normalized CLIP image features for crops, clip_batch_size crops per forward pass"""
+        device = self._clip_device()
+        batches = []
+        for start in range(0, len(crops), self.clip_batch_size):
+            image_inputs = self.clip_processor(
+                images=crops[start:start + self.clip_batch_size],
+                return_tensors="pt",
+            ).to(device)
+            with torch.no_grad():
+                image_features = self.clip_model.get_image_features(**image_inputs)
+                batches.append(image_features / image_features.norm(dim=-1, keepdim=True))
+        return torch.cat(batches, dim=0)
+
+    def _score_crops(self, crops: List[Image.Image], object_descriptions: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Best description index and softmax score for each crop"""
+        text_features = self._get_text_features(object_descriptions)
+        image_features = self._get_image_features(crops)
+        with torch.no_grad():
+            logits = (image_features @ text_features.T).cpu().numpy()
+        probs = self._softmax(logits)
+        best = np.argmax(probs, axis=-1)
+        return best, probs[np.arange(len(best)), best]
+
     async def detect_objects(
         self,
         image_path: str,
@@ -299,7 +437,8 @@ class VisionEngine:
             raise FileNotFoundError(f"Image not found: {image_path}")
         pil_image = Image.open(image_path)
         image_width, image_height = pil_image.size
-        results = self.yolo_model.predict(
+        results = await self._run_inference(
+            self.yolo_model.predict,
             str(image_path),
             conf=confidence_threshold,
             verbose=False,
@@ -356,50 +495,56 @@ class VisionEngine:
         if not object_descriptions or not regions:
             return []
         await self.initialize_object_detection()
+        return await self._run_inference(
+            self._match_objects_semantically_sync,
+            image_path,
+            regions,
+            object_descriptions,
+            similarity_threshold,
+        )
+
+    def _match_objects_semantically_sync(
+        self,
+        image_path: str,
+        regions: List[Dict[str, Any]],
+        object_descriptions: List[str],
+        similarity_threshold: float,
+    ) -> List[Dict[str, Any]]:
         pil_image = Image.open(image_path)
-        device = "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
-        text_inputs = self.clip_processor(
-            text=object_descriptions,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-        ).to(device)
-        with torch.no_grad():
-            text_features = self.clip_model.get_text_features(**text_inputs)
-            text_features = text_features / text_features.norm(dim=-1, keepdim=True)
-        matches = []
+        crops = []
+        region_indices = []
         for idx, region in enumerate(regions):
             x = region["bbox_x"]
             y = region["bbox_y"]
             w = region["bbox_width"]
             h = region["bbox_height"]
-            crop = pil_image.crop((x, y, x + w, y + h))
-            if crop.size[0] < 1 or crop.size[1] < 1:
+            if w < 1 or h < 1:
                 continue
-            image_inputs = self.clip_processor(images=crop, return_tensors="pt").to(device)
-            with torch.no_grad():
-                image_features = self.clip_model.get_image_features(**image_inputs)
-                image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-                logits = (image_features @ text_features.T).squeeze(0).cpu().numpy()
-            probs = self._softmax(logits)
-            best_idx = int(np.argmax(probs))
-            score = float(probs[best_idx])
+            crops.append(pil_image.crop((x, y, x + w, y + h)))
+            region_indices.append(idx)
+        if not crops:
+            return []
+
+        best, scores = self._score_crops(crops, object_descriptions)
+        matches = []
+        for idx, best_idx, score in zip(region_indices, best, scores):
             if score >= similarity_threshold:
+                region = regions[idx]
                 matches.append({
                     "region_index": idx,
-                    "matched_description": object_descriptions[best_idx],
-                    "confidence": score,
-                    "bbox_x": x,
-                    "bbox_y": y,
-                    "bbox_width": w,
-                    "bbox_height": h,
+                    "matched_description": object_descriptions[int(best_idx)],
+                    "confidence": float(score),
+                    "bbox_x": region["bbox_x"],
+                    "bbox_y": region["bbox_y"],
+                    "bbox_width": region["bbox_width"],
+                    "bbox_height": region["bbox_height"],
                 })
         return matches
 
     def _softmax(self, x: np.ndarray) -> np.ndarray:
-        """Numerically stable softmax."""
-        exp_x = np.exp(x - np.max(x))
-        return exp_x / exp_x.sum()
+        """Numerically stable softmax over the last axis."""
+        exp_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+        return exp_x / exp_x.sum(axis=-1, keepdims=True)
 
     @staticmethod
     def _box_iou(a: Dict[str, Any], b: Dict[str, Any]) -> float:
@@ -470,6 +615,27 @@ class VisionEngine:
         await self.initialize_object_detection()
         if not CLIP_AVAILABLE:
             return []
+        return await self._run_inference(
+            self._find_semantic_regions_sync,
+            image_path,
+            object_descriptions,
+            chunk_size,
+            stride,
+            similarity_threshold,
+            max_chunks,
+            nms_iou_threshold,
+        )
+
+    def _find_semantic_regions_sync(
+        self,
+        image_path: str,
+        object_descriptions: List[str],
+        chunk_size: int,
+        stride: Optional[int],
+        similarity_threshold: float,
+        max_chunks: int,
+        nms_iou_threshold: float,
+    ) -> List[Dict[str, Any]]:
         pil_image = Image.open(image_path).convert("RGB")
         w, h = pil_image.size
         stride = stride if stride is not None else chunk_size
@@ -488,17 +654,8 @@ class VisionEngine:
             step_y = max(1, int(len(ys) / ratio))
             xs = xs[::step_x] if step_x > 1 else xs
             ys = ys[::step_y] if step_y > 1 else ys
-        device = "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
-        text_inputs = self.clip_processor(
-            text=object_descriptions,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-        ).to(device)
-        with torch.no_grad():
-            text_features = self.clip_model.get_text_features(**text_inputs)
-            text_features = text_features / text_features.norm(dim=-1, keepdim=True)
-        raw_matches = []
+        windows = []
+        crops = []
         for y in ys:
             for x in xs:
                 # Clip to image bounds
@@ -508,28 +665,26 @@ class VisionEngine:
                 ch = y2 - y
                 if cw < 8 or ch < 8:
                     continue
-                crop = pil_image.crop((x, y, x2, y2))
-                image_inputs = self.clip_processor(images=crop, return_tensors="pt").to(device)
-                with torch.no_grad():
-                    image_features = self.clip_model.get_image_features(**image_inputs)
-                    image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-                    logits = (image_features @ text_features.T).squeeze(0).cpu().numpy()
-                probs = self._softmax(logits)
-                best_idx = int(np.argmax(probs))
-                score = float(probs[best_idx])
-                if score >= similarity_threshold:
-                    raw_matches.append({
-                        "bbox_x": x,
-                        "bbox_y": y,
-                        "bbox_width": cw,
-                        "bbox_height": ch,
-                        "matched_description": object_descriptions[best_idx],
-                        "confidence": score,
-                    })
+                windows.append((x, y, cw, ch))
+                crops.append(pil_image.crop((x, y, x2, y2)))
+        if not crops:
+            return []
+        best, scores = self._score_crops(crops, object_descriptions)
+        raw_matches = []
+        for (x, y, cw, ch), best_idx, score in zip(windows, best, scores):
+            if score >= similarity_threshold:
+                raw_matches.append({
+                    "bbox_x": x,
+                    "bbox_y": y,
+                    "bbox_width": cw,
+                    "bbox_height": ch,
+                    "matched_description": object_descriptions[int(best_idx)],
+                    "confidence": float(score),
+                })
         if not raw_matches:
             return []
         kept = self._nms_boxes(raw_matches, iou_threshold=nms_iou_threshold)
-        logger.debug("Semantic sweep: %d raw hits, %d after NMS", len(raw_matches), len(kept))
+        logger.debug("Semantic sweep: %d windows, %d raw hits, %d after NMS", len(crops), len(raw_matches), len(kept))
         return kept
 
     async def extract_object_features(
@@ -550,25 +705,23 @@ class VisionEngine:
             Dict with visual_embedding, semantic_embedding, combined_embedding (lists), embedding_dim.
         """
         await self.initialize_object_detection()
+        return await self._run_inference(self._extract_object_features_sync, image_path, bbox, description)
+
+    def _extract_object_features_sync(
+        self,
+        image_path: str,
+        bbox: Dict[str, int],
+        description: str,
+    ) -> Dict[str, Any]:
         x = bbox.get("bbox_x", bbox.get("x", 0))
         y = bbox.get("bbox_y", bbox.get("y", 0))
         w = bbox.get("bbox_width", bbox.get("width", 0))
         h = bbox.get("bbox_height", bbox.get("height", 0))
         pil_image = Image.open(image_path)
         crop = pil_image.crop((x, y, x + w, y + h))
-        device = "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
-        image_inputs = self.clip_processor(images=crop, return_tensors="pt").to(device)
-        text_inputs = self.clip_processor(
-            text=[description] if description else ["object"],
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-        ).to(device)
+        image_features = self._get_image_features([crop])
+        text_features = self._get_text_features([description or "object"])
         with torch.no_grad():
-            image_features = self.clip_model.get_image_features(**image_inputs)
-            image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-            text_features = self.clip_model.get_text_features(**text_inputs)
-            text_features = text_features / text_features.norm(dim=-1, keepdim=True)
             combined = (image_features + text_features) / 2
             combined = combined / combined.norm(dim=-1, keepdim=True)
         return {
@@ -590,5 +743,15 @@ class VisionEngine:
             "face_recognition_available": FACE_RECOGNITION_AVAILABLE,
             "object_detection_initialized": getattr(self, "_object_detection_initialized", False),
             "clip_only_initialized": getattr(self, "_clip_only_initialized", False),
+            "face_workers": self.face_workers,
+            "face_pool_restarts": self.face_pool_restarts,
+            "identity_indexes": len(self._identity_indexes),
+            "clip_batch_size": self.clip_batch_size,
+            "clip_text_cache": {
+                "size": len(self._text_feature_cache),
+                "capacity": self._text_feature_cache_size,
+                "hits": self._text_cache_hits,
+                "misses": self._text_cache_misses,
+            },
         }
         return out
\ No newline at end of file
@@ -20,6 +20,14 @@ class RSSFeed(BaseModel):
     last_check: Optional[datetime] = Field(None, description="Timestamp of last feed check")
     is_active: bool = Field(default=True, description="Whether the feed is currently being monitored")
     user_id: Optional[str] = Field(None, description="User ID for user-specific feeds, NULL for global feeds")
+    etag: Optional[str] = Field(None, description="ETag from the last successful fetch, sent as If-None-Match")
+    last_modified: Optional[str] = Field(None, description="Last-Modified from the last successful fetch, sent as If-Modified-Since")
+    next_poll_at: Optional[datetime] = Field(None, description="When the adaptive scheduler will next poll this feed")
+    poll_interval: Optional[int] = Field(None, description="Current adaptive poll interval in seconds")
+    avg_publish_interval: Optional[float] = Field(None, description="EWMA of observed seconds between new items")
+    last_new_item_at: Optional[datetime] = Field(None, description="When the last new item was seen")
+    consecutive_unchanged: int = Field(default=0, description="Polls in a row with no new items or 304")
+    consecutive_failures: int = Field(default=0, description="Polls in a row that failed")
     created_at: Optional[datetime] = Field(None, description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
 
@@ -107,7 +115,7 @@ class RSSArticleImport(BaseModel):
 class RSSFeedPollResult(BaseModel):
     """Structured result from RSS feed polling"""
     feed_id: str = Field(..., description="Feed ID that was polled")
-    status: str = Field(..., description="Polling status: success, error, no_new_articles")
+    status: str = Field(..., description="Polling status: success, error, no_new_articles, not_modified")
     articles_found: int = Field(default=0, description="Number of new articles found")
     articles_added: int = Field(default=0, description="Number of articles actually added")
     error_message: Optional[str] = Field(None, description="Error message if polling failed")
@@ -135,6 +143,13 @@ class RSSFeedHealth(BaseModel):
     average_response_time: Optional[float] = Field(None, description="Average response time in seconds")
     articles_per_day: Optional[float] = Field(None, description="Average articles per day")
     last_article_date: Optional[datetime] = Field(None, description="Date of most recent article")
+    next_poll_at: Optional[datetime] = Field(None, description="When the adaptive scheduler will next poll this feed")
+    poll_interval: Optional[int] = Field(None, description="Current adaptive poll interval in seconds")
+    avg_publish_interval: Optional[float] = Field(None, description="Learned average seconds between new items")
+    fetch_count: int = Field(default=0, description="Polls that made an HTTP request since adaptive tracking began")
+    not_modified_count: int = Field(default=0, description="Polls answered with 304 Not Modified")
+    polls_saved: int = Field(default=0, description="Polls avoided versus polling at the fixed check_interval")
+    bytes_saved: int = Field(default=0, description="Estimated bytes not downloaded thanks to 304 responses")
 
 
 class RSSUserPreferences(BaseModel):
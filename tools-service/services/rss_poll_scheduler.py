@@ -0,0 +1,111 @@
+"""
+RSS Poll Scheduler
+Adaptive per-feed polling intervals driven by observed publish cadence
+
+Each feed learns an EWMA of the time between new items. Busy feeds are polled
+about twice per expected item (never faster than their configured check_interval),
+quiet feeds back off geometrically on 304 / no-new-items, and feeds with more
+subscribers or recent readers get a lower back-off ceiling. Jitter spreads polls
+so feeds added together don't stay synchronized.
+"""
+
+import math
+import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Poll outcomes reported by the RSS background agent
+OUTCOME_NEW_ITEMS = "new_items"
+OUTCOME_UNCHANGED = "unchanged"
+OUTCOME_NOT_MODIFIED = "not_modified"
+OUTCOME_ERROR = "error"
+
+MIN_POLL_INTERVAL = 300  # Matches RSSFeed.check_interval lower bound
+MAX_POLL_INTERVAL = int(os.getenv("RSS_MAX_POLL_INTERVAL", str(6 * 3600)))
+BACKOFF_FACTOR = 1.5
+ERROR_BACKOFF_FACTOR = 2.0
+EWMA_ALPHA = 0.3
+JITTER_RATIO = 0.1
+
+
+@dataclass
+class PollSchedule:
+    """Scheduler state to persist after one poll"""
+    poll_interval: int
+    next_poll_at: datetime
+    avg_publish_interval: Optional[float]
+    last_new_item_at: Optional[datetime]
+    consecutive_unchanged: int
+    consecutive_failures: int
+
+
+def interval_ceiling(base_interval: int, demand: float) -> int:
+    """
+    Longest back-off allowed for a feed
+
+    demand is subscribers plus recent reader activity; every doubling of demand
+    lowers the ceiling so popular feeds never drift too far from fresh.
+    """
+    ceiling = MAX_POLL_INTERVAL / (1.0 + math.log2(1.0 + max(demand, 0.0)))
+    return int(max(ceiling, base_interval))
+
+
+def compute_poll_schedule(
+    base_interval: int,
+    previous_interval: Optional[int],
+    avg_publish_interval: Optional[float],
+    last_new_item_at: Optional[datetime],
+    consecutive_unchanged: int,
+    consecutive_failures: int,
+    outcome: str,
+    new_items: int = 0,
+    demand: float = 0.0,
+    now: Optional[datetime] = None,
+    rng: Optional[random.Random] = None,
+) -> PollSchedule:
+    """Compute the next poll interval and time for a feed after a poll outcome"""
+    now = now or datetime.utcnow()
+    rng = rng or random
+    floor = max(int(base_interval or MIN_POLL_INTERVAL), MIN_POLL_INTERVAL)
+    ceiling = interval_ceiling(floor, demand)
+    previous = previous_interval or floor
+
+    if outcome == OUTCOME_NEW_ITEMS and new_items > 0:
+        if last_new_item_at is not None:
+            observed = max((now - last_new_item_at).total_seconds() / new_items, 1.0)
+            if avg_publish_interval:
+                avg_publish_interval = EWMA_ALPHA * observed + (1 - EWMA_ALPHA) * avg_publish_interval
+            else:
+                avg_publish_interval = observed
+        last_new_item_at = now
+        consecutive_unchanged = 0
+        consecutive_failures = 0
+        # Poll roughly twice per expected item
+        target = avg_publish_interval / 2 if avg_publish_interval else floor
+    elif outcome == OUTCOME_ERROR:
+        consecutive_failures += 1
+        target = previous * ERROR_BACKOFF_FACTOR
+    else:
+        consecutive_unchanged += 1
+        consecutive_failures = 0
+        target = previous * BACKOFF_FACTOR
+
+    interval = min(max(target, floor), ceiling)
+    interval *= 1.0 + rng.uniform(-JITTER_RATIO, JITTER_RATIO)
+    interval = int(min(max(interval, floor), ceiling))
+
+    return PollSchedule(
+        poll_interval=interval,
+        next_poll_at=now + timedelta(seconds=interval),
+        avg_publish_interval=avg_publish_interval,
+        last_new_item_at=last_new_item_at,
+        consecutive_unchanged=consecutive_unchanged,
+        consecutive_failures=consecutive_failures,
+    )
+
+
+def dispatch_priority(demand: float) -> int:
+    """Map feed demand onto a Celery task priority (0 = highest, 9 = lowest)"""
+    return max(0, 9 - int(round(math.log2(1.0 + max(demand, 0.0)) * 2)))
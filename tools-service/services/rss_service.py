@@ -17,6 +17,9 @@ from tools_service.models.rss_models import (
     RSSFeed, RSSArticle, RSSFeedSubscription, RSSFeedCreate,
     RSSFeedPollResult, RSSArticleProcessResult, RSSFeedHealth
 )
+from tools_service.services.rss_poll_scheduler import (
+    compute_poll_schedule, OUTCOME_ERROR, OUTCOME_NOT_MODIFIED
+)
 from services.database_manager import get_database_manager
 from services.database_manager.database_helpers import (
     fetch_all, fetch_one, fetch_value, execute, insert_and_return_id,
@@ -25,6 +28,14 @@ from services.database_manager.database_helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Scheduling demand: active subscribers, the owning user, and recent reads (10 reads ~ 1 subscriber)
+_FEED_DEMAND_SQL = """(
+    (SELECT COUNT(*) FROM rss_feed_subscriptions s WHERE s.feed_id = f.feed_id AND s.is_active = true)
+    + CASE WHEN f.user_id IS NOT NULL THEN 1 ELSE 0 END
+    + (SELECT COUNT(*) FROM rss_articles a
+       WHERE a.feed_id = f.feed_id AND a.is_read = true AND a.updated_at >= NOW() - INTERVAL '7 days') / 10.0
+)::float"""
+
 
 class RSSService:
     """
@@ -295,10 +306,9 @@ class RSSService:
                     query = """
                         SELECT * FROM rss_feeds 
                         WHERE user_id = $1 
-                        AND (last_check IS NULL OR 
-                             last_check + (check_interval || ' seconds')::interval < NOW())
+                        AND COALESCE(next_poll_at, last_check + (check_interval || ' seconds')::interval, NOW()) <= NOW()
                             AND (is_polling IS NULL OR is_polling = false)
-                        ORDER BY last_check ASC NULLS FIRST
+                        ORDER BY next_poll_at ASC NULLS FIRST, last_check ASC NULLS FIRST
                             LIMIT 10
                     """
                     params = [user_id]
@@ -306,10 +316,9 @@ class RSSService:
                     # Get all feeds that need polling (for global polling) with concurrency control
                     query = """
                         SELECT * FROM rss_feeds 
-                        WHERE (last_check IS NULL OR 
-                               last_check + (check_interval || ' seconds')::interval < NOW())
+                        WHERE COALESCE(next_poll_at, last_check + (check_interval || ' seconds')::interval, NOW()) <= NOW()
                             AND (is_polling IS NULL OR is_polling = false)
-                        ORDER BY last_check ASC NULLS FIRST
+                        ORDER BY next_poll_at ASC NULLS FIRST, last_check ASC NULLS FIRST
                             LIMIT 10
                     """
                     params = []
@@ -342,17 +351,25 @@ class RSSService:
         
             return []
     
-    async def update_feed_last_check(self, feed_id: str) -> bool:
-        """Update feed last_check timestamp with optimistic locking"""
+    async def update_feed_last_check(
+        self,
+        feed_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> bool:
+        """Update feed last_check timestamp (and HTTP validators, when provided) with optimistic locking"""
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 # Use optimistic locking to prevent race conditions
+                # COALESCE keeps stored validators when a response (e.g. 304) doesn't resend them
                 result = await execute("""
                     UPDATE rss_feeds 
-                        SET last_check = NOW(), updated_at = NOW(), is_polling = false
+                        SET last_check = NOW(), updated_at = NOW(), is_polling = false,
+                            etag = COALESCE($2, etag),
+                            last_modified = COALESCE($3, last_modified)
                     WHERE feed_id = $1
-                """, feed_id)
+                """, feed_id, etag, last_modified)
                 
                 if result == "UPDATE 1":
                     logger.info(f"RSS SERVICE: Updated last_check for feed {feed_id}")
@@ -374,6 +391,120 @@ class RSSService:
         
         return False
 
+    async def get_feed_demand(self, feed_id: str) -> float:
+        """Subscribers (plus owner) and recent reader activity for scheduling priority"""
+        try:
+            demand = await fetch_value(f"""
+                SELECT {_FEED_DEMAND_SQL} FROM rss_feeds f WHERE f.feed_id = $1
+            """, feed_id)
+            return float(demand or 0)
+        except Exception as e:
+            logger.warning(f"RSS SERVICE: Failed to get demand for feed {feed_id}: {e}")
+            return 0.0
+    
+    async def record_poll_outcome(
+        self,
+        feed: RSSFeed,
+        outcome: str,
+        new_items: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_length: Optional[int] = None
+    ) -> bool:
+        """
+        Persist a poll result and schedule the feed's next poll
+        
+        Updates last_check / validators like update_feed_last_check, releases the
+        dispatch lease, and stores the adaptive interval computed from the outcome.
+        """
+        demand = await self.get_feed_demand(feed.feed_id)
+        schedule = compute_poll_schedule(
+            base_interval=feed.check_interval,
+            previous_interval=feed.poll_interval,
+            avg_publish_interval=feed.avg_publish_interval,
+            last_new_item_at=feed.last_new_item_at,
+            consecutive_unchanged=feed.consecutive_unchanged or 0,
+            consecutive_failures=feed.consecutive_failures or 0,
+            outcome=outcome,
+            new_items=new_items,
+            demand=demand,
+        )
+        
+        succeeded = outcome != OUTCOME_ERROR
+        not_modified = 1 if outcome == OUTCOME_NOT_MODIFIED else 0
+        
+        try:
+            result = await execute("""
+                UPDATE rss_feeds 
+                    SET last_check = CASE WHEN $2 THEN NOW() ELSE last_check END,
+                        updated_at = NOW(), is_polling = false, poll_dispatched_at = NULL,
+                        etag = COALESCE($3, etag),
+                        last_modified = COALESCE($4, last_modified),
+                        next_poll_at = $5, poll_interval = $6, avg_publish_interval = $7,
+                        last_new_item_at = $8, consecutive_unchanged = $9, consecutive_failures = $10,
+                        fetch_count = COALESCE(fetch_count, 0) + 1,
+                        not_modified_count = COALESCE(not_modified_count, 0) + $11,
+                        bytes_saved = COALESCE(bytes_saved, 0) + CASE WHEN $11 = 1 THEN COALESCE(last_content_length, 0) ELSE 0 END,
+                        last_content_length = COALESCE($12, last_content_length),
+                        adaptive_since = COALESCE(adaptive_since, NOW())
+                WHERE feed_id = $1
+            """, feed.feed_id, succeeded, etag, last_modified,
+                 schedule.next_poll_at, schedule.poll_interval, schedule.avg_publish_interval,
+                 schedule.last_new_item_at, schedule.consecutive_unchanged, schedule.consecutive_failures,
+                 not_modified, content_length)
+            
+            logger.info(f"RSS SERVICE: Feed {feed.feed_id} {outcome} - next poll in {schedule.poll_interval}s")
+            return result == "UPDATE 1"
+        except Exception as e:
+            logger.error(f"RSS SERVICE ERROR: Failed to record poll outcome for {feed.feed_id}: {e}")
+            return False
+    
+    async def claim_due_feeds(self, lookahead_seconds: int = 60, limit: int = 500, lease_minutes: int = 15) -> List[Dict[str, Any]]:
+        """
+        Lease feeds that fall due within the lookahead window
+        
+        Sets poll_dispatched_at so overlapping scheduler runs don't dispatch the
+        same feed twice; the lease is released by record_poll_outcome or expires.
+        """
+        try:
+            rows = await fetch_all(f"""
+                WITH due AS (
+                    SELECT f.feed_id
+                    FROM rss_feeds f
+                    WHERE f.is_active = true
+                      AND (f.is_polling IS NULL OR f.is_polling = false)
+                      AND (f.poll_dispatched_at IS NULL OR f.poll_dispatched_at < NOW() - ($3 || ' minutes')::interval)
+                      AND COALESCE(f.next_poll_at, f.last_check + (f.check_interval || ' seconds')::interval, NOW())
+                          <= NOW() + ($1 || ' seconds')::interval
+                    ORDER BY f.next_poll_at ASC NULLS FIRST
+                    LIMIT $2
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE rss_feeds f
+                    SET poll_dispatched_at = NOW()
+                FROM due
+                WHERE f.feed_id = due.feed_id
+                RETURNING f.feed_id,
+                          COALESCE(f.next_poll_at, f.last_check + (f.check_interval || ' seconds')::interval, NOW()) AS due_at,
+                          {_FEED_DEMAND_SQL} AS demand
+            """, str(lookahead_seconds), limit, str(lease_minutes))
+            return rows
+        except Exception as e:
+            logger.error(f"RSS SERVICE ERROR: Failed to claim due feeds: {e}")
+            return []
+    
+    async def release_poll_lease(self, feed_id: str) -> bool:
+        """Release a claim_due_feeds lease without polling (the feed was not due after all)"""
+        try:
+            result = await execute("""
+                UPDATE rss_feeds SET poll_dispatched_at = NULL
+                WHERE feed_id = $1 AND poll_dispatched_at IS NOT NULL
+            """, feed_id)
+            return result == "UPDATE 1"
+        except Exception as e:
+            logger.error(f"RSS SERVICE ERROR: Failed to release poll lease for {feed_id}: {e}")
+            return False
+    
     async def mark_feed_polling(self, feed_id: str, is_polling: bool = True) -> bool:
         """Mark feed as polling to prevent concurrent polling"""
         max_retries = 3
@@ -485,6 +616,62 @@ class RSSService:
         
         return False
     
+    async def save_articles_batch(self, articles: List[RSSArticle]) -> List[str]:
+        """
+        Insert many RSS articles in one statement; returns IDs that were actually inserted
+        
+        Raises once retries are exhausted so the caller doesn't persist the feed's
+        ETag/Last-Modified for a response whose articles were never stored.
+        """
+        if not articles:
+            return []
+        
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                rows = await fetch_all("""
+                    INSERT INTO rss_articles 
+                    (article_id, feed_id, title, description, full_content, full_content_html, images, link, published_date, 
+                     is_processed, is_read, content_hash, user_id)
+                    SELECT * FROM unnest(
+                        $1::varchar[], $2::varchar[], $3::text[], $4::text[], $5::text[], $6::text[], $7::jsonb[],
+                        $8::text[], $9::timestamp[], $10::boolean[], $11::boolean[], $12::varchar[], $13::varchar[]
+                    )
+                    ON CONFLICT (article_id) DO NOTHING
+                    RETURNING article_id
+                """,
+                    [a.article_id for a in articles],
+                    [a.feed_id for a in articles],
+                    [a.title for a in articles],
+                    [a.description for a in articles],
+                    [a.full_content for a in articles],
+                    [a.full_content_html for a in articles],
+                    [json.dumps(a.images) if a.images else None for a in articles],
+                    [a.link for a in articles],
+                    [a.published_date for a in articles],
+                    [a.is_processed for a in articles],
+                    [a.is_read for a in articles],
+                    [a.content_hash for a in articles],
+                    [a.user_id for a in articles],
+                )
+                
+                inserted_ids = [row['article_id'] for row in rows]
+                logger.info(f"RSS SERVICE: Batch saved {len(inserted_ids)}/{len(articles)} articles")
+                return inserted_ids
+                
+            except Exception as e:
+                error_msg = str(e).lower()
+                if any(keyword in error_msg for keyword in ["another operation is in progress", "connection was closed", "connection does not exist"]) and attempt < max_retries - 1:
+                    wait_time = (attempt + 1) * 1  # Exponential backoff
+                    logger.warning(f"RSS SERVICE: Database connection issue batch saving {len(articles)} articles (attempt {attempt + 1}/{max_retries}), retrying in {wait_time} seconds: {e}")
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    logger.error(f"RSS SERVICE ERROR: Failed to batch save {len(articles)} articles after {max_retries} attempts: {e}")
+                    raise
+        
+        return []
+    
     async def get_article(self, article_id: str) -> Optional[RSSArticle]:
         """Get RSS article by ID using centralized DatabaseManager"""
         try:
@@ -562,6 +749,26 @@ class RSSService:
         
             return False
     
+    async def get_existing_article_keys(self, feed_id: str, links: List[str], content_hashes: List[str]) -> Dict[str, set]:
+        """
+        Bulk duplicate check for one feed poll
+        
+        Replaces one is_duplicate_article() query per entry with a single
+        link = ANY($2) / content_hash = ANY($3) lookup.
+        """
+        if not links and not content_hashes:
+            return {"links": set(), "content_hashes": set()}
+        
+        rows = await fetch_all("""
+            SELECT link, content_hash FROM rss_articles 
+            WHERE feed_id = $1 AND (link = ANY($2::text[]) OR content_hash = ANY($3::varchar[]))
+        """, feed_id, list(links), list(content_hashes))
+        
+        return {
+            "links": {row['link'] for row in rows},
+            "content_hashes": {row['content_hash'] for row in rows if row.get('content_hash')},
+        }
+    
     async def mark_article_read(self, article_id: str, user_id: str) -> bool:
         """Mark article as read"""
         try:
@@ -797,14 +1004,29 @@ class RSSService:
                  feed_row['last_check'] >= datetime.utcnow() - timedelta(days=1))
             )
             
+            # Fetch savings versus polling at the fixed check_interval
+            fetch_count = feed_row.get('fetch_count') or 0
+            polls_saved = 0
+            adaptive_since = feed_row.get('adaptive_since')
+            if adaptive_since and feed_row.get('check_interval'):
+                elapsed = (datetime.utcnow() - adaptive_since).total_seconds()
+                polls_saved = max(0, int(elapsed // feed_row['check_interval']) - fetch_count)
+            
             return RSSFeedHealth(
                 feed_id=feed_id,
                 is_healthy=is_healthy,
                 last_successful_poll=feed_row['last_check'],
-                consecutive_failures=0,  # TODO: Implement failure tracking
+                consecutive_failures=feed_row.get('consecutive_failures') or 0,
                 average_response_time=None,  # TODO: Implement response time tracking
                 articles_per_day=recent_articles / 7 if recent_articles > 0 else 0,
-                last_article_date=last_article_date
+                last_article_date=last_article_date,
+                next_poll_at=feed_row.get('next_poll_at'),
+                poll_interval=feed_row.get('poll_interval'),
+                avg_publish_interval=feed_row.get('avg_publish_interval'),
+                fetch_count=fetch_count,
+                not_modified_count=feed_row.get('not_modified_count') or 0,
+                polls_saved=polls_saved,
+                bytes_saved=feed_row.get('bytes_saved') or 0
             )
                 
         except Exception as e:
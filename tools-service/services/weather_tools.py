@@ -6,11 +6,15 @@ Weather operations and forecasting for LangGraph agents using OpenWeatherMap API
 import logging
 import aiohttp
 import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 import math
 
+from utils.redis_backoff import RedisBackoff
+
 # Import weather models using explicit tools_service path
 # This avoids conflicts with backend's 'from models.xxx' imports
 from tools_service.models.weather_models import (
@@ -21,6 +25,9 @@ from tools_service.models.weather_models import (
 
 logger = logging.getLogger(__name__)
 
+GEOCODE_CACHE_PREFIX = "weather:geocode"
+HISTORY_CACHE_PREFIX = "weather:history"
+
 
 class WeatherTools:
     """Weather tools for LangGraph agents using OpenWeatherMap API"""
@@ -31,6 +38,18 @@ class WeatherTools:
         self.cache = {}  # Simple in-memory cache
         self.cache_duration = timedelta(minutes=10)
         
+        # Pooled HTTP session and rate limiter - bound to the running loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
+        # Back off instead of failing weather lookups on a Redis outage
+        self._redis = RedisBackoff("Weather cache")
+        
+        # Geocodes resolved by this process (LRU, backed by the Redis cache)
+        self._geocode_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
     def get_tools(self) -> Dict[str, Any]:
         """Get all weather tools"""
         return {
@@ -124,6 +143,78 @@ class WeatherTools:
             }
         ]
     
+    def _bind_loop(self) -> None:
+        """(Re)create loop-bound resources when called from a different event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        from config import settings
+        self._retire_session(self._session, self._loop)
+        self._loop = loop
+        self._session = None
+        self._request_slots = asyncio.Semaphore(max(1, settings.WEATHER_MAX_CONCURRENT_REQUESTS))
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+    
+    @staticmethod
+    def _retire_session(session: Optional[aiohttp.ClientSession], loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a session left behind on a previous event loop"""
+        if session is None or session.closed:
+            return
+        if loop is not None and not loop.is_closed():
+            # Still alive (e.g. a persistent worker loop between tasks): close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # Its loop is gone and took the sockets with it; detach so the session is
+            # marked closed without touching transports bound to the dead loop
+            session.detach()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session for all OpenWeatherMap calls"""
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    @asynccontextmanager
+    async def _request(self, url: str, params: Dict[str, Any]):
+        """GET through the pooled session, capped in concurrency and start rate"""
+        from config import settings
+        session = await self._get_session()
+        async with self._request_slots:
+            min_interval = 1.0 / settings.WEATHER_REQUESTS_PER_SECOND if settings.WEATHER_REQUESTS_PER_SECOND > 0 else 0.0
+            async with self._rate_lock:
+                now = self._loop.time()
+                wait = self._next_request_at - now
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_request_at = max(now, self._next_request_at) + min_interval
+            async with session.get(url, params=params) as response:
+                yield response
+    
+    async def _durable_get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._redis.get_client()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(key)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+            return None
+    
+    async def _durable_set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        client = self._redis.get_client()
+        if client is None:
+            return
+        try:
+            await client.set(key, json.dumps(value, default=str), ex=ttl_seconds)
+        except Exception as e:
+            self._redis.mark_unavailable(e)
+    
     async def get_weather_conditions(self, location: str, units: str = "imperial", user_id: str = None) -> Dict[str, Any]:
         """Get current weather conditions for a location"""
         try:
@@ -161,17 +252,16 @@ class WeatherTools:
                 "units": units
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
-                            "location": location
-                        }
+            async with self._request(url, params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
+                        "location": location
+                    }
                     
-                    data = await response.json()
+                data = await response.json()
             
             # Format the response
             result = self._format_current_weather(data, location, units)
@@ -235,17 +325,16 @@ class WeatherTools:
                 "units": units
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
-                            "location": location
-                        }
+            async with self._request(url, params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
+                        "location": location
+                    }
                     
-                    data = await response.json()
+                data = await response.json()
             
             # Format the response
             result = self._format_forecast(data, location, days, units)
@@ -335,6 +424,16 @@ class WeatherTools:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
             timestamp = int(date_obj.timestamp())
             
+            # Observations for past days never change - serve them from the durable cache.
+            # Yesterday is excluded so every timezone has finished the day.
+            from config import settings
+            is_immutable = date_obj.date() < datetime.utcnow().date() - timedelta(days=1)
+            cache_key = f"{HISTORY_CACHE_PREFIX}:{lat:.4f},{lon:.4f}:{date_str}:{units}"
+            if is_immutable:
+                cached = await self._durable_get(cache_key)
+                if cached is not None:
+                    return cached
+            
             # Use One Call API 3.0 timemachine endpoint
             url = f"{self.base_url}/onecall/timemachine"
             params = {
@@ -345,42 +444,44 @@ class WeatherTools:
                 "units": units
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        # Check for subscription-related errors
-                        if response.status == 401:
-                            return {
-                                "success": False,
-                                "error": "Historical weather data requires an OpenWeatherMap One Call API 3.0 subscription. Current and forecast weather are still available with a free API key.",
-                                "location": f"{lat},{lon}",
-                                "date_str": date_str,
-                                "subscription_required": True
-                            }
-                        elif response.status == 403:
-                            return {
-                                "success": False,
-                                "error": "Access denied. Please verify your OpenWeatherMap API key has One Call API 3.0 subscription enabled.",
-                                "location": f"{lat},{lon}",
-                                "date_str": date_str,
-                                "subscription_required": True
-                            }
+            async with self._request(url, params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    # Check for subscription-related errors
+                    if response.status == 401:
+                        return {
+                            "success": False,
+                            "error": "Historical weather data requires an OpenWeatherMap One Call API 3.0 subscription. Current and forecast weather are still available with a free API key.",
+                            "location": f"{lat},{lon}",
+                            "date_str": date_str,
+                            "subscription_required": True
+                        }
+                    elif response.status == 403:
                         return {
                             "success": False,
-                            "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
+                            "error": "Access denied. Please verify your OpenWeatherMap API key has One Call API 3.0 subscription enabled.",
                             "location": f"{lat},{lon}",
-                            "date_str": date_str
+                            "date_str": date_str,
+                            "subscription_required": True
                         }
+                    return {
+                        "success": False,
+                        "error": f"OpenWeatherMap API error: {response.status} - {error_text}",
+                        "location": f"{lat},{lon}",
+                        "date_str": date_str
+                    }
                     
-                    data = await response.json()
+                data = await response.json()
             
-            return {
+            result = {
                 "success": True,
                 "data": data,
                 "date_str": date_str,
                 "timestamp": timestamp
             }
+            if is_immutable:
+                await self._durable_set(cache_key, result, settings.WEATHER_HISTORY_CACHE_DAYS * 86400)
+            return result
             
         except ValueError as e:
             return {
@@ -407,30 +508,26 @@ class WeatherTools:
             last_day = monthrange(year, month)[1]
             sample_days = [1, 8, 15, 22, last_day]
             
-            daily_results = []
-            subscription_error = None
+            sample_dates = [f"{year}-{month:02d}-{day:02d}" for day in sample_days]
             
-            for day in sample_days:
-                day_str = f"{year}-{month:02d}-{day:02d}"
-                daily_result = await self._get_daily_history(lat, lon, day_str, units, api_key)
-                if daily_result.get("success"):
-                    daily_results.append(daily_result)
-                else:
-                    # Check if this is a subscription error (401)
-                    error_msg = daily_result.get("error", "")
-                    if "One Call API subscription required" in error_msg or "subscription required" in error_msg.lower():
-                        subscription_error = error_msg
-                        # Stop trying if we hit subscription error - all will fail
-                        break
-            
-            # If we got a subscription error, return it immediately
-            if subscription_error:
+            # Probe one day first: without a One Call 3.0 subscription every request
+            # fails, so don't spend the other sample days on it
+            first_result = await self._get_daily_history(lat, lon, sample_dates[0], units, api_key)
+            if first_result.get("subscription_required"):
                 return {
                     "success": False,
-                    "error": subscription_error,
-                    "date_str": date_str
+                    "error": first_result.get("error"),
+                    "date_str": date_str,
+                    "subscription_required": True
                 }
             
+            # Remaining sample days are fetched concurrently (bounded by the request rate limiter)
+            sampled = await asyncio.gather(*[
+                self._get_daily_history(lat, lon, sample_date, units, api_key)
+                for sample_date in sample_dates[1:]
+            ])
+            daily_results = [result for result in [first_result, *sampled] if result.get("success")]
+            
             if not daily_results:
                 return {
                     "success": False,
@@ -507,33 +604,51 @@ class WeatherTools:
             
             lat, lon = coords["lat"], coords["lon"]
             
-            # Query each month in the range
-            monthly_results = []
+            # Enumerate each month in the range
+            months = []
             current_year = start_year
             current_month = start_month
             
             while (current_year < end_year) or (current_year == end_year and current_month <= end_month):
-                month_str = f"{current_year}-{current_month:02d}"
-                logger.info(f"📅 Fetching monthly data for {month_str}...")
-                
-                month_result = await self._get_monthly_average(lat, lon, month_str, units, settings.OPENWEATHERMAP_API_KEY)
+                months.append((current_year, current_month))
                 
+                # Move to next month
+                current_month += 1
+                if current_month > 12:
+                    current_month = 1
+                    current_year += 1
+            
+            # The first month doubles as the subscription probe; the rest are fetched
+            # concurrently and the request rate limiter bounds API pressure
+            first_year, first_month = months[0]
+            first_result = await self._get_monthly_average(
+                lat, lon, f"{first_year}-{first_month:02d}", units, settings.OPENWEATHERMAP_API_KEY
+            )
+            if first_result.get("subscription_required"):
+                return {
+                    "success": False,
+                    "error": first_result.get("error")
+                }
+            
+            logger.info(f"📅 Fetching monthly data for {len(months) - 1} more months concurrently...")
+            month_results = [first_result] + list(await asyncio.gather(*[
+                self._get_monthly_average(lat, lon, f"{year}-{month:02d}", units, settings.OPENWEATHERMAP_API_KEY)
+                for year, month in months[1:]
+            ]))
+            
+            monthly_results = []
+            for (year, month), month_result in zip(months, month_results):
+                month_str = f"{year}-{month:02d}"
                 if month_result.get("success"):
                     monthly_results.append({
                         "month": month_str,
-                        "year": current_year,
-                        "month_num": current_month,
+                        "year": year,
+                        "month_num": month,
                         "data": month_result
                     })
                 else:
                     # Log but continue - some months may fail due to subscription limits
                     logger.warning(f"⚠️ Failed to get data for {month_str}: {month_result.get('error', 'Unknown error')}")
-                
-                # Move to next month
-                current_month += 1
-                if current_month > 12:
-                    current_month = 1
-                    current_year += 1
             
             if not monthly_results:
                 return {
@@ -760,7 +875,36 @@ class WeatherTools:
         Note: Location resolution (vague location → user ZIP code) is handled
         by WeatherLocationRequest.resolve_location() before this method is called.
         This method only performs geocoding of the resolved location.
+        
+        Successful geocodes are cached in-process and in Redis (WEATHER_GEOCODE_CACHE_DAYS),
+        so the variant probing below runs once per location string.
         """
+        from config import settings
+        
+        cache_key = f"{GEOCODE_CACHE_PREFIX}:{' '.join(str(location).lower().split())}"
+        coords = self._geocode_cache.get(cache_key)
+        if coords is None:
+            coords = await self._durable_get(cache_key)
+        if coords is not None:
+            self._remember_geocode(cache_key, coords)
+            return coords
+        
+        coords = await self._geocode_location(location, api_key)
+        if coords.get("success"):
+            self._remember_geocode(cache_key, coords)
+            await self._durable_set(cache_key, coords, settings.WEATHER_GEOCODE_CACHE_DAYS * 86400)
+        return coords
+    
+    def _remember_geocode(self, cache_key: str, coords: Dict[str, Any]) -> None:
+        """Keep a geocode in the in-process LRU (keys are free text, so the size is capped)"""
+        from config import settings
+        self._geocode_cache[cache_key] = coords
+        self._geocode_cache.move_to_end(cache_key)
+        while len(self._geocode_cache) > max(1, settings.WEATHER_GEOCODE_LOCAL_CACHE_SIZE):
+            self._geocode_cache.popitem(last=False)
+    
+    async def _geocode_location(self, location: str, api_key: str) -> Dict[str, Any]:
+        """Geocode a location string or US ZIP code against the OpenWeatherMap geocoding API"""
         try:
             # Location should already be resolved by WeatherLocationRequest
             # This method only performs geocoding
@@ -803,16 +947,15 @@ class WeatherTools:
                 }
             
             # Handle ZIP code request (simple case)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"Could not find ZIP code: {location}",
-                            "location": location
-                        }
+            async with self._request(url, params) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"Could not find ZIP code: {location}",
+                        "location": location
+                    }
                     
-                    data = await response.json()
+                data = await response.json()
             
             # ZIP code response format
             if not data:
@@ -895,37 +1038,36 @@ class WeatherTools:
     async def _try_geocoding_request(self, url: str, params: Dict[str, Any], location_variant: str) -> Dict[str, Any]:
         """ROOSEVELT'S GEOCODING REQUEST: Try a single geocoding request"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}",
-                            "location": location_variant
-                        }
-                    
-                    data = await response.json()
+            async with self._request(url, params) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}",
+                        "location": location_variant
+                    }
                     
-                    # Handle empty response
-                    if not data or len(data) == 0:
-                        return {
-                            "success": False,
-                            "error": "No results found",
-                            "location": location_variant
-                        }
+                data = await response.json()
                     
-                    # Extract coordinates from first result
-                    result = data[0]
+                # Handle empty response
+                if not data or len(data) == 0:
                     return {
-                        "success": True,
-                        "lat": result["lat"],
-                        "lon": result["lon"],
-                        "name": result.get("name", location_variant),
-                        "country": result.get("country", "Unknown"),
-                        "state": result.get("state", ""),
-                        "original_query": location_variant
+                        "success": False,
+                        "error": "No results found",
+                        "location": location_variant
                     }
                     
+                # Extract coordinates from first result
+                result = data[0]
+                return {
+                    "success": True,
+                    "lat": result["lat"],
+                    "lon": result["lon"],
+                    "name": result.get("name", location_variant),
+                    "country": result.get("country", "Unknown"),
+                    "state": result.get("state", ""),
+                    "original_query": location_variant
+                }
+                    
         except Exception as e:
             return {
                 "success": False,
@@ -12,7 +12,7 @@ from typing import Dict, Any, List, Optional
 from concurrent import futures
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import VectorParams, Distance, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.models import VectorParams, Distance, PointStruct, Filter, FieldCondition, MatchValue, PointIdsList
 from qdrant_client.http.exceptions import UnexpectedResponse
 
 # Import generated proto files (will be generated during Docker build)
@@ -412,6 +412,25 @@ class VectorServiceImplementation(vector_service_pb2_grpc.VectorServiceServicer)
                     error="Service or Qdrant not initialized"
                 )
             
+            # Explicit point IDs (incremental re-indexing removes only vanished chunks)
+            if request.point_ids:
+                point_ids = []
+                for point_id in request.point_ids:
+                    try:
+                        point_ids.append(int(point_id))
+                    except (ValueError, TypeError):
+                        point_ids.append(point_id)
+                
+                self.qdrant_client.delete(
+                    collection_name=request.collection_name,
+                    points_selector=PointIdsList(points=point_ids)
+                )
+                logger.info(f"DeleteVectors: Deleted {len(point_ids)} point(s) by ID from '{request.collection_name}'")
+                return vector_service_pb2.DeleteVectorsResponse(
+                    success=True,
+                    points_deleted=len(point_ids)
+                )
+            
             # Build Qdrant filter from VectorFilter messages
             if not request.filters:
                 return vector_service_pb2.DeleteVectorsResponse(